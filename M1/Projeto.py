@@ -1,74 +1,432 @@
-import keyboard  # Importa a biblioteca keyboard
 import os # Importa a biblioteca os
-import sys # Importa a biblioteca sys
+import csv # Importa a biblioteca csv
 import heapq # Importa a biblioteca heapq
+import json # Importa a biblioteca json
+import math # Importa a biblioteca math
+import mmap # Importa a biblioteca mmap
+import multiprocessing # Importa a biblioteca multiprocessing
+import time # Importa a biblioteca time
+import tracemalloc # Importa a biblioteca tracemalloc
 from collections import deque # Importa a biblioteca deque
+from collections import namedtuple # Importa a função namedtuple
+from functools import lru_cache, partial, wraps # Importa os decoradores lru_cache e wraps e a função partial
+
+TAMANHO_PADRAO = 3 # Dimensão do tabuleiro por omissão (3x3, puzzle de 8 peças)
+PESOS_ARA = (5, 3, 2, 1.5, 1.2, 1) # Pesos da heurística em cada iteração do ARA* (o último, 1, dá a solução ótima)
+
+Geometria = namedtuple("Geometria", "tamanho celulas bits mascara shift_vazio movimentos") # Constantes de um tabuleiro NxN
+
+def construir_tabela_movimentos(tamanho, bits, shift_vazio): # Pré-calcula as trocas possíveis para cada posição do espaço vazio
+    tabela = [] # Lista indexada pela posição do espaço vazio
+    for pos in range(tamanho * tamanho): # Loop para percorrer todas as posições do tabuleiro
+        x, y = divmod(pos, tamanho) # Converte o índice em linha e coluna
+        destinos = [] # Movimentos possíveis a partir desta posição
+        if x < tamanho - 1: destinos.append(('up', pos + tamanho)) # Troca com a peça abaixo
+        if x > 0: destinos.append(('down', pos - tamanho)) # Troca com a peça acima
+        if y < tamanho - 1: destinos.append(('left', pos + 1)) # Troca com a peça à direita
+        if y > 0: destinos.append(('right', pos - 1)) # Troca com a peça à esquerda
+        movimentos = [] # Entradas (movimento, destino, shift da peça, fator, delta do vazio)
+        for move, destino in destinos: # Para cada troca possível
+            shift = destino * bits # Posição (em bits) da peça que vai ser movida
+            fator = (1 << (pos * bits)) - (1 << shift) # Multiplicar a peça por este fator move-a para a posição do vazio
+            delta_vazio = (destino - pos) << shift_vazio # Atualiza o índice do espaço vazio
+            movimentos.append((move, destino, shift, fator, delta_vazio)) # Adiciona a entrada à tabela
+        tabela.append(tuple(movimentos)) # Tuplo imutável por posição
+    return tuple(tabela) # Retorna a tabela completa
+
+@lru_cache(maxsize=None) # Calculada uma única vez por dimensão
+def geometria(tamanho): # Devolve as constantes do estado compactado e a tabela de movimentos de um tabuleiro NxN
+    celulas = tamanho * tamanho # Número de células do tabuleiro
+    bits = max(4, (celulas - 1).bit_length()) # Bits por célula (4 chegam até ao 4x4, 5 para o 5x5, ...)
+    shift_vazio = celulas * bits # Posição (em bits) onde é guardado o índice do espaço vazio
+    return Geometria(tamanho, celulas, bits, (1 << bits) - 1, shift_vazio,
+                     construir_tabela_movimentos(tamanho, bits, shift_vazio)) # Constantes do tabuleiro
+
+INVERSO = {'up': 'down', 'down': 'up', 'left': 'right', 'right': 'left'} # Movimento que desfaz cada movimento
+DIRECOES = ('up', 'down', 'left', 'right') # Ordem dos movimentos nas tabelas NumPy
+
+@lru_cache(maxsize=None)
+def tabelas_numpy(tamanho): # Tabelas da pesquisa vetorizada (o numpy só é importado quando é usado)
+    import numpy as np # Dependência opcional: só os algoritmos *_numpy precisam dela
+    geo = geometria(tamanho) # Constantes do tabuleiro
+    if geo.celulas > 16: # Cada célula ocupa 4 bits numa chave de 64 bits
+        raise ValueError("A pesquisa vetorizada só suporta tabuleiros até 4x4")
+    destinos = np.full((len(DIRECOES), geo.celulas), -1, dtype=np.int64) # destinos[movimento, vazio] (-1 se impossível)
+    for pos in range(geo.celulas): # Copia a tabela de movimentos
+        for move, destino, _, _, _ in geo.movimentos[pos]:
+            destinos[DIRECOES.index(move), pos] = destino
+    shifts = np.arange(geo.celulas, dtype=np.uint64) * np.uint64(4) # Posição (em bits) de cada célula na chave
+    return np, destinos, shifts
+
+def chaves_numpy(np, tabuleiros, shifts): # Chave de 64 bits de cada linha (4 bits por célula; o vazio é a célula a 0)
+    return np.bitwise_or.reduce(tabuleiros.astype(np.uint64) << shifts, axis=1)
+
+def expandir_numpy(np, tabuleiros, vazios, destinos): # Gera os filhos de um bloco de tabuleiros (k, celulas) de uma vez
+    filhos, vazios_filhos, pais, movimentos = [], [], [], [] # Um bloco por direção
+    linhas = np.arange(len(tabuleiros)) # Índice de cada tabuleiro do bloco
+    for indice, destino in enumerate(destinos): # Uma operação vetorizada por direção
+        destino = destino[vazios] # Célula trocada com o vazio em cada tabuleiro (-1 se o movimento for impossível)
+        validos = destino >= 0 # Tabuleiros onde o movimento é possível
+        pai, destino, vazio = linhas[validos], destino[validos], vazios[validos] # Só os movimentos possíveis
+        filho = tabuleiros[pai] # Cópia dos pais (indexação avançada)
+        r = np.arange(len(pai)) # Linhas do bloco de filhos
+        filho[r, vazio] = filho[r, destino] # A peça passa para o lugar do vazio
+        filho[r, destino] = 0 # E o vazio para o lugar da peça
+        filhos.append(filho)
+        vazios_filhos.append(destino)
+        pais.append(pai)
+        movimentos.append(np.full(len(pai), indice, dtype=np.int8))
+    return np.concatenate(filhos), np.concatenate(vazios_filhos), np.concatenate(pais), np.concatenate(movimentos)
+
+@lru_cache(maxsize=64) # Guarda as tabelas dos últimos tabuleiros finais usados
+def tabelas_objetivo(goal, tamanho=TAMANHO_PADRAO): # Pré-calcula o custo de cada peça em cada posição para um estado final
+    geo = geometria(tamanho) # Constantes do tabuleiro
+    celulas = geo.celulas # Número de células do tabuleiro
+    target_pos = {} # Dicionário para armazenar as posições dos números no tabuleiro final
+    for pos in range(celulas): # Loop para percorrer as células do estado final
+        target_pos[(goal >> (pos * geo.bits)) & geo.mascara] = pos # Posição final de cada número
+    linha = [0] * celulas # Linha final de cada peça
+    coluna = [0] * celulas # Coluna final de cada peça
+    manhattan = [0] * (celulas * celulas) # Tabela indexada por peça * celulas + posição
+    hamming = [0] * (celulas * celulas) # Tabela indexada por peça * celulas + posição
+    for tile in range(1, celulas): # Loop para percorrer as peças (ignora o espaço vazio)
+        ti, tj = divmod(target_pos[tile], tamanho) # Linha e coluna finais da peça
+        linha[tile], coluna[tile] = ti, tj # Guarda a linha e a coluna finais
+        for pos in range(celulas): # Loop para percorrer as posições possíveis da peça
+            i, j = divmod(pos, tamanho) # Linha e coluna da posição
+            manhattan[tile * celulas + pos] = abs(i - ti) + abs(j - tj) # Distância de Manhattan da peça nesta posição
+            hamming[tile * celulas + pos] = int(pos != target_pos[tile]) # 1 se a peça estiver fora do lugar
+    return {'manhattan': tuple(manhattan), 'hamming': tuple(hamming), 'posicao': tuple(target_pos[v] for v in range(celulas)),
+            'linha': tuple(linha), 'coluna': tuple(coluna)} # Tuplos imutáveis, partilhados entre instâncias
+
+DIRETORIO_PDB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache_pdb") # Pasta onde são guardadas as bases de dados de padrões
+DIRETORIO_DISTANCIAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache_distancias") # Pasta das tabelas de distâncias exatas
+_TABELAS_ABERTAS = {} # Tabelas já mapeadas em memória neste processo (por caminho)
+
+def mapear_tabela(caminho, construir): # Devolve uma tabela em disco mapeada em memória, construindo-a na primeira utilização
+    if caminho in _TABELAS_ABERTAS: # Já mapeada neste processo
+        return _TABELAS_ABERTAS[caminho]
+    if not os.path.exists(caminho): # Só é construída uma vez
+        os.makedirs(os.path.dirname(caminho), exist_ok=True) # Cria a pasta se não existir
+        temporario = f"{caminho}.{os.getpid()}.tmp" # Escreve num ficheiro temporário para não expor tabelas incompletas
+        with open(temporario, "wb") as f:
+            f.write(construir())
+        os.replace(temporario, caminho) # Troca atómica (seguro com vários processos)
+    with open(caminho, "rb") as f: # Mapeia o ficheiro só de leitura (páginas partilhadas entre processos)
+        tabela = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _TABELAS_ABERTAS[caminho] = tabela # Guarda o mapeamento
+    return tabela # Retorna a tabela (indexável como bytes)
+
+def construir_pdb(grupo, tamanho=TAMANHO_PADRAO): # Calcula por BFS retrógrada o custo mínimo para colocar as peças de um grupo no sítio
+    # As peças do padrão são identificadas pela célula final (grupo), por isso a tabela não depende dos números do objetivo
+    geo = geometria(tamanho) # Constantes do tabuleiro
+    celulas = geo.celulas # Número de células do tabuleiro
+    k = len(grupo) # Número de peças do padrão
+    entradas = celulas ** k # Uma entrada por cada combinação de posições das peças do padrão
+    distancias = bytearray(b'\xff') * entradas # 255 = ainda não calculado
+    visitados = bytearray(entradas * celulas) # Estados abstratos (posições do padrão + espaço vazio) já expandidos
+    pesos = [celulas ** i for i in range(k)] # Peso de cada peça no índice
+    fila = deque() # Fila 0-1 BFS: mover uma peça fora do padrão custa 0, mover uma peça do padrão custa 1
+    for vazio in range(celulas): # Estados finais: peças do padrão no sítio, espaço vazio em qualquer outra célula
+        if vazio not in grupo:
+            fila.append((0, tuple(grupo), vazio))
+    while fila: # Enquanto houver estados abstratos por expandir
+        custo, posicoes, vazio = fila.popleft() # Os custos saem por ordem crescente
+        indice = sum(pos * peso for pos, peso in zip(posicoes, pesos)) # Índice das posições do padrão
+        if visitados[indice * celulas + vazio]: # Já expandido com custo menor ou igual
+            continue
+        visitados[indice * celulas + vazio] = 1 # Marca como expandido
+        if distancias[indice] == 255: # Primeira vez que estas posições saem da fila: custo mínimo
+            distancias[indice] = custo
+        for _, destino, _, _, _ in geo.movimentos[vazio]: # Movimentos possíveis do espaço vazio
+            if destino in posicoes: # Troca com uma peça do padrão (custo 1)
+                i = posicoes.index(destino) # Qual das peças é movida
+                fila.append((custo + 1, posicoes[:i] + (vazio,) + posicoes[i + 1:], destino))
+            else: # Troca com uma peça fora do padrão (custo 0)
+                fila.appendleft((custo, posicoes, destino))
+    return bytes(distancias) # Retorna a tabela compacta (1 byte por entrada)
+
+def carregar_pdb(grupo, tamanho=TAMANHO_PADRAO): # Devolve a base de dados de padrões de um grupo, mapeada em memória a partir do disco
+    nome = f"pdb_{tamanho}x{tamanho}_" + "-".join(map(str, grupo)) + ".bin" # Nome do ficheiro da tabela
+    return mapear_tabela(os.path.join(DIRETORIO_PDB, nome), lambda: construir_pdb(grupo, tamanho)) # Constrói só se não existir
+
+def grupos_pdb(vazio_final, tamanho=TAMANHO_PADRAO, tamanho_grupo=None): # Divide as células finais das peças em grupos disjuntos
+    celulas = [pos for pos in range(tamanho * tamanho) if pos != vazio_final] # Células onde terminam as peças
+    if tamanho_grupo is None: # Grupos de 4 peças até ao 4x4; de 3 nos tabuleiros maiores (tabelas e BFS mais pequenas)
+        tamanho_grupo = 4 if len(celulas) < 16 else 3
+    return tuple(tuple(celulas[i:i + tamanho_grupo]) for i in range(0, len(celulas), tamanho_grupo)) # Grupos consecutivos
+
+FATORIAIS = tuple(math.factorial(i) for i in range(17)) # Fatoriais usados no índice das permutações
+
+def rank_permutacao(valores): # Índice (0 a n!-1) de uma permutação dos números 0..n-1 (código de Lehmer)
+    n = len(valores) # Número de elementos
+    vistos = 0 # Máscara dos números já vistos
+    rank = 0 # Índice acumulado
+    for i, v in enumerate(valores): # Para cada número, conta os menores que ainda não apareceram
+        rank += (v - (vistos & ((1 << v) - 1)).bit_count()) * FATORIAIS[n - 1 - i]
+        vistos |= 1 << v # Marca o número como visto
+    return rank # Retorna o índice
+
+def objetivo_canonico(vazio, tamanho=TAMANHO_PADRAO): # Objetivo com o espaço vazio na célula dada e as peças 1, 2, ... pela ordem das restantes
+    celulas = tamanho * tamanho # Número de células do tabuleiro
+    return [0 if pos == vazio else (pos + 1 if pos < vazio else pos) for pos in range(celulas)] # Lista com os números de cada célula
+
+def construir_tabela_distancias(vazio): # BFS retrógrada a partir do objetivo canónico: distância exata de cada permutação do 3x3
+    geo = geometria(3) # Constantes do tabuleiro 3x3
+    bits, mascara, shift_vazio = geo.bits, geo.mascara, geo.shift_vazio # Variáveis locais
+    canonico = objetivo_canonico(vazio, 3) # Objetivo canónico
+    goal = sum(v << (pos * bits) for pos, v in enumerate(canonico)) | (vazio << shift_vazio) # Estado compactado do objetivo
+    distancias = bytearray(b'\xff') * FATORIAIS[geo.celulas] # 1 byte por permutação (255 = inalcançável: outra paridade)
+    distancias[rank_permutacao(canonico)] = 0 # O objetivo está à distância 0
+    fila = deque([(goal, 0)]) # Fila da BFS (estado, distância)
+    while fila: # Enquanto houver estados por expandir
+        current, d = fila.popleft() # Estado mais antigo da fila
+        for _, _, shift, fator, delta_vazio in geo.movimentos[current >> shift_vazio]: # Trocas pré-calculadas
+            neighbor = current + ((current >> shift) & mascara) * fator + delta_vazio # Estado vizinho compactado
+            rank = rank_permutacao([(neighbor >> (pos * bits)) & mascara for pos in range(geo.celulas)]) # Índice do vizinho
+            if distancias[rank] == 255: # Ainda não visitado
+                distancias[rank] = d + 1 # Distância exata (BFS)
+                fila.append((neighbor, d + 1)) # Adiciona à fila
+    return bytes(distancias) # Retorna a tabela (181440 entradas alcançáveis)
+
+def carregar_tabela_distancias(vazio): # Tabela de distâncias exatas para o objetivo canónico com o vazio na célula dada
+    caminho = os.path.join(DIRETORIO_DISTANCIAS, f"distancias_3x3_v{vazio}.bin") # Uma tabela por posição final do vazio (no máximo 9)
+    return mapear_tabela(caminho, lambda: construir_tabela_distancias(vazio)) # Constrói só se não existir
+
+class PuzzleInsolavel(ValueError): # Erro lançado quando o tabuleiro final não é alcançável a partir do inicial
+    pass
+
+class EstatisticasPesquisa: # Contadores de uma execução de um algoritmo de pesquisa (preenchidos só quando pedidos)
+    CAMPOS = ("algoritmo", "comprimento", "expandidos", "gerados", "pico_abertos", "pico_fechados", "repetidos",
+              "tempo", "memoria_pico", "limite_subotimo") # Colunas exportadas (JSON e CSV)
+
+    def __init__(self, medir_memoria=False): # Construtor da classe
+        self.medir_memoria = medir_memoria # O tracemalloc torna a pesquisa várias vezes mais lenta: só por pedido
+        self.algoritmo = None # Nome do algoritmo medido
+        self.comprimento = None # Número de movimentos da solução (None se não houver solução)
+        self.expandidos = 0 # Estados cujos vizinhos foram gerados
+        self.gerados = 0 # Vizinhos gerados (incluindo os já visitados)
+        self.pico_abertos = 0 # Maior número de estados à espera de serem expandidos (fila, heap ou profundidade no IDA*)
+        self.pico_fechados = 0 # Maior número de estados guardados em memória (visitados)
+        self.repetidos = 0 # Entradas obsoletas retiradas da fila (estado já expandido com custo menor)
+        self.tempo = 0.0 # Tempo de execução em segundos
+        self.memoria_pico = None # Pico de memória alocada em bytes (só com medir_memoria)
+        self.limite_subotimo = None # Garantia comprimento <= limite * ótimo (só nos algoritmos subótimos, ex.: ARA*)
+
+    def iniciar(self, algoritmo): # Começa a medição de uma execução
+        self.algoritmo = algoritmo # Guarda o nome do algoritmo
+        if self.medir_memoria: # Mede a memória alocada durante a pesquisa
+            tracemalloc.start()
+        self._inicio = time.perf_counter() # Regista o tempo de início
+
+    def terminar(self, solucao): # Termina a medição de uma execução
+        self.tempo = time.perf_counter() - self._inicio # Tempo de execução
+        if self.medir_memoria: # Pico de memória desde o início da medição
+            self.memoria_pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        self.comprimento = len(solucao) if solucao is not None else None # Número de movimentos
+
+    def como_dict(self): # Devolve as estatísticas como dicionário
+        return {campo: getattr(self, campo) for campo in self.CAMPOS}
+
+    def como_json(self): # Devolve as estatísticas numa linha JSON
+        return json.dumps(self.como_dict(), ensure_ascii=False)
+
+def exportar_estatisticas(estatisticas, caminho): # Guarda uma lista de estatísticas em JSON ou CSV (pela extensão do ficheiro)
+    linhas = [stats.como_dict() for stats in estatisticas] # Uma linha por execução
+    with open(caminho, "w", encoding="utf-8", newline="") as f: # Abre o ficheiro de destino
+        if caminho.lower().endswith(".csv"): # CSV com uma coluna por contador
+            writer = csv.DictWriter(f, fieldnames=EstatisticasPesquisa.CAMPOS)
+            writer.writeheader()
+            writer.writerows(linhas)
+        else: # JSON com uma lista de execuções
+            json.dump(linhas, f, ensure_ascii=False, indent=2)
+
+class FilaBaldes: # Fila de prioridade por baldes: os f são inteiros pequenos (custos unitários e heurísticas inteiras)
+    # Mesma interface que o heapq (entradas (f, g, estado)); push e pop em O(1) amortizado.
+    # Com f igual sai primeiro o maior g (o estado mais perto do objetivo)
 
-class EightPuzzle: # Classe que representa o jogo do puzzle de 8 peças
     def __init__(self): # Construtor da classe
-        print("Configuração inicial:") # Mostra a configuração inicial
-        self.board = self.ler_config("inicial") # Lê a configuração inicial do tabuleiro
-        print("\nTabuleiro inicial:\n") # Mostra o tabuleiro inicial
-        self.mostrar_tabuleiro() # Mostra o tabuleiro
-        
-        print("Configuração final (objetivo):") # Mostra a configuração final
-        self.target_board = self.ler_config("final") # Lê a configuração final do tabuleiro
-        print("\nTabuleiro final (objetivo):\n") # Mostra o tabuleiro final
-        self.mostrar_tabuleiro_custom(self.target_board) # Mostra o tabuleiro final
-        
-        if not self.is_solvable(self.board, self.target_board): # Verifica se o puzzle é solucionável
-            print("O puzzle não é solucionável com a configuração final dada!") # Mostra a mensagem de erro, se não o for solucionável.
-            sys.exit(1) # Sai do programa com código de erro 1
-        
-            
-        self.moves = 0  # Contador de movimentos
+        self.baldes = [] # baldes[f][g] = estados com esse f e esse g
+        self.f_min = 0 # Nenhum balde abaixo deste f tem estados
+        self.tamanho = 0 # Número de entradas na fila
 
-    def ler_config(self, tipo): # Método para ler a configuração do tabuleiro
-       
-        print(f"Introduza 9 números únicos entre 0 e 8 para a configuração {tipo}:") # Mostra a mensagem para introduzir os números
-        numeros_validos = set(range(0, 9)) # Define os números válidos
-        numeros_usados = set() # Define os números usados
-        tabuleiro = [] # Define o tabuleiro
+    def __len__(self): # Número de entradas na fila
+        return self.tamanho
 
-        for i in range(3): # Loop para ler as linhas do tabuleiro
-            while True: # Enquanto verdade/loop verifica se os números são válidos
-                try: # Tenta ler os números
-                    linha = list(map(int, input(f"Linha {i+1}: ").split())) # Lê os números da linha
-                    if len(linha) != 3: # Verifica se a linha tem 3 números
-                        print("Erro: Deve introduzir exatamente 3 números.") # Mostra a mensagem de erro se não tiver 3 números
-                        continue # Continua o loop se preencher os requisitos
+    def push(self, entrada): # Adiciona uma entrada (f, g, estado)
+        f, g, estado = entrada # Desempacota a entrada
+        baldes = self.baldes # Variável local
+        while len(baldes) <= f: # Cria os baldes em falta até f
+            baldes.append([])
+        por_g = baldes[f] # Estados deste f, separados por g
+        while len(por_g) <= g: # Cria os baldes em falta até g
+            por_g.append([])
+        por_g[g].append(estado) # Adiciona o estado
+        if f < self.f_min: # Heurística inconsistente: o f pode descer
+            self.f_min = f
+        self.tamanho += 1 # Conta a entrada
 
-                    if not all(num in numeros_validos for num in linha): # Verifica se não há mais de 8 números introduzidos
-                        print("Erro: Apenas números de 0 a 8 são permitidos.") # Mostra a mensagem de erro se houver mais de 8 números
-                        continue # Continua o loop se preencher os requisitos
+    def pop(self): # Remove a entrada com menor f (e, nesse f, maior g)
+        if not self.tamanho: # Fila vazia (como o heapq)
+            raise IndexError("pop de uma fila vazia")
+        por_g = self.baldes[self.f_min] # Balde do menor f
+        while not por_g: # Avança para o próximo f com estados
+            self.f_min += 1
+            por_g = self.baldes[self.f_min]
+        g = len(por_g) - 1 # O último balde de g nunca está vazio
+        estado = por_g[g].pop() # Remove o estado
+        while por_g and not por_g[-1]: # Remove os baldes de g vazios no fim
+            por_g.pop()
+        self.tamanho -= 1 # Desconta a entrada
+        return self.f_min, g, estado
 
-                    if any(num in numeros_usados for num in linha): # Verifica se não há números repetidos
-                        print("Erro: Não pode repetir números no tabuleiro.") # Mostra a mensagem de erro se houver números repetidos
-                        continue# Continua o loop se preencher os requisitos
+def instrumentado(solver): # Decorador: mede o tempo e a memória de um algoritmo quando recebe stats
+    @wraps(solver)
+    def medir(self, *args, stats=None, **kwargs): # Sem stats chama o algoritmo diretamente (sem custo adicional)
+        if stats is None:
+            return solver(self, *args, **kwargs)
+        nome = solver.__name__.replace("auto_solve_", "") # Nome do algoritmo
+        if args: # Acrescenta o nome da heurística (ex.: astar/heuristic_manhattan)
+            nome += "/" + getattr(args[0], "__name__", str(args[0])).replace("heuristic_", "")
+        nome += "".join(f"/{valor}" for valor in kwargs.values() if isinstance(valor, str)) # E as opções (ex.: astar/manhattan/baldes)
+        stats.iniciar(nome) # Começa a medição
+        solucao = solver(self, *args, stats=stats, **kwargs) # Resolve o puzzle, preenchendo os contadores
+        stats.terminar(solucao) # Termina a medição
+        return solucao
+    return medir
 
-                    tabuleiro.append(linha) # Adiciona a linha ao tabuleiro
-                    numeros_usados.update(linha) # Atualiza os números usados
-                    break # Sai do loop
+HASH_DONO = 0x9E3779B97F4A7C15 # Constante do hash multiplicativo que escolhe o processo dono de cada estado
+HDA_PROCESSOS_MINIMO = 4 # Com menos processos o HDA* resolve em série: cada estado enviado custa cerca do dobro de um expandido
 
-                except ValueError: # Trata o erro de valor inválido
-                    print("Erro: Introduza apenas números inteiros separados por espaço.") # Mostra a mensagem de erro se o valor for inválido
+def dono_estado(estado, processos): # Processo dono de um estado no A* paralelo (mistura todos os bits do estado)
+    return ((estado * HASH_DONO) >> 64) % processos
 
-        return tabuleiro # Retorna o tabuleiro
+def hda_em_serie(processos=None, forcar=False): # O HDA* recorre ao A* em série neste caso?
+    processos = processos or os.cpu_count() or 1 # Um processo por núcleo
+    return not forcar and processos < HDA_PROCESSOS_MINIMO
 
-    def mostrar_tabuleiro_custom(self, board): # Método para mostrar o tabuleiro
-       
-        os.system('cls' if os.name == 'nt' else 'clear') # Limpa a tela
-        for row in board: # Loop para mostrar as linhas do tabuleiro 
-            print(" ".join(str(num) if num != 0 else " " for num in row)) # Conversão dos números para string e se for 0, mostra um espaço
-        print("\n") # Espaço de uma linha em branco
-    
-    def mostrar_tabuleiro(self): # Método para mostrar o tabuleiro
-        
-        self.mostrar_tabuleiro_custom(self.board) # Mostra o tabuleiro
+def trabalhador_hda(indice, processos, inicial, final, heuristica, caixas, comandos, respostas, lote):
+    # Processo do A* paralelo (HDA*): guarda os estados de que é dono (fila, g e pais) e expande-os por rondas.
+    # Em cada ronda: recebe um lote de cada um dos outros processos (enviados na ronda anterior), expande até `lote`
+    # estados com f <= limite, envia os filhos ao respetivo dono e manda um relatório ao processo principal
+    game = EightPuzzle(inicial, final) # Puzzle (só para as heurísticas e as constantes)
+    heuristic = getattr(game, heuristica) # Heurística pelo nome (os métodos não passam entre processos)
+    table = game.heuristic_table(heuristic) # Tabela para atualizar a heurística de forma incremental (se existir)
+    geo = game.geo # Constantes do estado compactado
+    movimentos, mascara, celulas, shift_vazio = geo.movimentos, geo.mascara, geo.celulas, geo.shift_vazio # Variáveis locais
+    start, goal = game.board_to_state(inicial), game.board_to_state(final) # Estados inicial e objetivo
+    open_set, g_score, came_from = [], {}, {} # Fila, custos e pais dos estados deste processo
+    pendentes = {} # Lotes recebidos, por ronda (um processo rápido pode já ter enviado os da ronda seguinte)
+    contadores = {"gerados": 0, "repetidos": 0, "objetivo": float('inf')} # Contadores deste processo
+
+    def inserir(estado, g, h, pai, move): # Adiciona um estado de que este processo é dono
+        if g < g_score.get(estado, g + 1): # Novo ou com caminho melhor
+            g_score[estado] = g
+            came_from[estado] = (pai, move)
+            heapq.heappush(open_set, (g + h, -g, estado)) # Com f igual, prefere o maior g
+            if estado == goal and g < contadores["objetivo"]: # Melhor solução conhecida por este processo
+                contadores["objetivo"] = g
+
+    if dono_estado(start, processos) == indice: # O dono do estado inicial começa a pesquisa
+        g_score[start] = 0
+        heapq.heappush(open_set, (heuristic(start), 0, start))
+        if start == goal:
+            contadores["objetivo"] = 0
+
+    while True:
+        comando = comandos.get() # Espera pela ordem do processo principal
+        if comando[0] == "fim": # Termina o processo
+            for caixa in caixas: # Os lotes da última ronda nunca são lidos: não espera que sejam entregues
+                caixa.cancel_join_thread()
+            return
+        if comando[0] == "pai": # Pergunta pelo pai de um estado (reconstrução do caminho)
+            respostas.put(came_from.get(comando[1]))
+            continue
+        _, ronda, f_limite, incumbente = comando # Nova ronda
+        if ronda > 0: # Recebe exatamente um lote de cada outro processo, enviado na ronda anterior
+            while len(pendentes.get(ronda - 1, ())) < processos - 1:
+                r, recebido = caixas[indice].get()
+                pendentes.setdefault(r, []).append(recebido)
+            for recebido in pendentes.pop(ronda - 1, ()): # Junta os estados recebidos à fila
+                for entrada in recebido:
+                    inserir(*entrada)
+        saidas = [[] for _ in range(processos)] # Filhos a enviar a cada processo
+        f_enviado = float('inf') # Menor f enviado nesta ronda (ainda não está na fila de ninguém)
+        expandidos = 0 # Estados expandidos nesta ronda
+        while open_set and expandidos < lote and open_set[0][0] <= f_limite: # Só a camada com o menor f global
+            f, g, current = heapq.heappop(open_set) # Estado com menor f deste processo
+            g = -g # Custo guardado negativo (desempate pelo maior g)
+            if g > g_score[current] or f >= incumbente: # Entrada obsoleta ou sem hipótese de melhorar a solução
+                contadores["repetidos"] += 1
+                continue
+            expandidos += 1 # Conta o nó expandido
+            h_current = f - g # Heurística do estado atual
+            empty = current >> shift_vazio # Posição do espaço vazio
+            for move, destino, shift, fator, delta_vazio in movimentos[empty]: # Trocas pré-calculadas
+                tile = (current >> shift) & mascara # Peça que vai ocupar o espaço vazio
+                neighbor = current + tile * fator + delta_vazio # Estado vizinho compactado
+                if table is not None: # Só a peça movida muda de posição
+                    h = h_current + table[tile * celulas + empty] - table[tile * celulas + destino]
+                else: # Heurística sem tabela: calcula do zero
+                    h = heuristic(neighbor)
+                dono = dono_estado(neighbor, processos) # Processo dono do vizinho
+                if dono == indice: # Fica neste processo: entra já na fila
+                    inserir(neighbor, g + 1, h, current, move)
+                else: # Segue no lote do dono
+                    saidas[dono].append((neighbor, g + 1, h, current, move))
+                    if g + 1 + h < f_enviado:
+                        f_enviado = g + 1 + h
+            contadores["gerados"] += len(movimentos[empty]) # Conta os filhos gerados
+        for j in range(processos): # Envia um lote (mesmo vazio) a cada outro processo
+            if j != indice:
+                caixas[j].put((ronda, saidas[j]))
+        f_aberto = open_set[0][0] if open_set else float('inf') # Menor f na fila deste processo
+        respostas.put((min(f_aberto, f_enviado), contadores["objetivo"], expandidos, contadores["gerados"],
+                       len(open_set), len(g_score), contadores["repetidos"])) # Relatório da ronda
+
+class EightPuzzle: # Classe que representa o jogo do puzzle de 8 peças (e dos puzzles NxN: 15, 24, ...)
+    def __init__(self, board, target_board): # Construtor da classe (sem interação: os tabuleiros são argumentos)
+        self.size = len(board) # A dimensão é dada pelo tabuleiro inicial
+        self.board = [list(row) for row in board] # Copia o tabuleiro inicial
+        self.target_board = [list(row) for row in target_board] # Copia o tabuleiro final
+        for tabuleiro in (self.board, self.target_board): # Valida os dois tabuleiros
+            if len(tabuleiro) != self.size or any(len(row) != self.size for row in tabuleiro) \
+                    or sorted(self.flatten(tabuleiro) + [0]) != list(range(self.size * self.size)): # Números 0 a N*N-1, uma vez cada
+                raise ValueError(f"Tabuleiro inválido: {tabuleiro}")
+        if not self.is_solvable(self.board, self.target_board): # Verifica se o puzzle é solucionável
+            raise PuzzleInsolavel("O puzzle não é solucionável com a configuração final dada!") # Erro para quem chamou
+        self.moves = 0  # Contador de movimentos
+
+    @property
+    def geo(self): # Constantes do estado compactado para a dimensão deste puzzle
+        return geometria(self.size)
+
+    @property
+    def target_board(self): # Tabuleiro final (objetivo)
+        return self._target_board
+
+    @target_board.setter
+    def target_board(self, board): # Ao mudar o objetivo, as tabelas das heurísticas têm de ser recalculadas
+        self._target_board = board # Guarda o novo tabuleiro final
+        self._tabelas = None # Tabelas calculadas na próxima utilização
+        self._pdb = None # Bases de dados de padrões carregadas na próxima utilização
+
+    def goal_tables(self): # Método para obter as tabelas das heurísticas para o tabuleiro final
+        if self._tabelas is None: # Só calcula uma vez por tabuleiro final
+            self._tabelas = tabelas_objetivo(self.board_to_state(self.target_board), self.size) # Usa a cache partilhada
+        return self._tabelas # Retorna as tabelas
+
+    def heuristic_table(self, heuristic): # Devolve a tabela por peça/posição de uma heurística aditiva (ou None)
+        if heuristic == self.heuristic_manhattan: # Manhattan é a soma das distâncias de cada peça
+            return self.goal_tables()['manhattan']
+        if heuristic == self.heuristic_hamming: # Hamming é a soma das peças fora do lugar
+            return self.goal_tables()['hamming']
+        return None # Heurística sem versão incremental
 
     def flatten(self, board): # Método para achatar o tabuleiro
        
-        return [num for row in board for num in row if num != 0] # Converte o tabuleiro 3x3 em uma lista de 9 elementos
+        return [num for row in board for num in row if num != 0] # Converte o tabuleiro NxN numa lista sem o espaço vazio
 
     def count_inversions(self, board): # Método para contar as inversões
        
@@ -82,14 +440,20 @@ class EightPuzzle: # Classe que representa o jogo do puzzle de 8 peças
 
     def is_solvable(self, initial, target): # Método para verificar se o puzzle é solucionável
        
-        return (self.count_inversions(initial) % 2) == (self.count_inversions(target) % 2) # Retorna True se o número de inversões for par, False se for ímpar
+        def paridade(board): # Invariante dos movimentos
+            # Largura ímpar: um movimento vertical troca a peça com N-1 (par) peças, a paridade das inversões não muda.
+            # Largura par: cada movimento vertical muda a paridade das inversões e a linha do espaço vazio, a soma mantém-se.
+            if len(board) % 2 == 1:
+                return self.count_inversions(board) % 2
+            return (self.count_inversions(board) + self.find_empty(board)[0]) % 2
+        return paridade(initial) == paridade(target) # Solucionável se o invariante for igual nos dois tabuleiros
 
     def find_empty(self, board=None): # Método para encontrar o espaço vazio
         
         if board is None: # Verifica se o tabuleiro é nulo
             board = self.board # Se nenhum tabuleiro for passado, usa o tabuleiro atual (self.board)
-        for i in range(3): # Loop para percorrer as linhas do tabuleiro
-            for j in range(3):  # Loop para percorrer as colunas do tabuleiro
+        for i in range(len(board)): # Loop para percorrer as linhas do tabuleiro
+            for j in range(len(board[i])):  # Loop para percorrer as colunas do tabuleiro
                 if board[i][j] == 0: # Verifica se o número é 0
                     return i, j     # Retorna a posição do espaço vazio
         return None # Retorna nulo se não encontrar o espaço vazio
@@ -98,14 +462,15 @@ class EightPuzzle: # Classe que representa o jogo do puzzle de 8 peças
         
         x, y = self.find_empty() # Usa método find_empty para encontrar a posição do espaço vazio
         moved = False # Verifica se o movimento foi realizado com sucesso
+        limite = len(self.board) - 1 # Última linha/coluna do tabuleiro
 
-        if direction == 'up' and x < 2: # Troca o espaço vazio com o número acima dele
+        if direction == 'up' and x < limite: # Troca o espaço vazio com o número acima dele
             self.board[x][y], self.board[x+1][y] = self.board[x+1][y], self.board[x][y] # Não deixa exceder o limite do tabuleiro
             moved = True
         elif direction == 'down' and x > 0: # Troca o espaço vazio com o número abaixo dele
             self.board[x][y], self.board[x-1][y] = self.board[x-1][y], self.board[x][y] # Não deixa exceder o limite do tabuleiro
             moved = True
-        elif direction == 'left' and y < 2: # Troca o espaço vazio com o número à esquerda dele
+        elif direction == 'left' and y < limite: # Troca o espaço vazio com o número à esquerda dele
             self.board[x][y], self.board[x][y+1] = self.board[x][y+1], self.board[x][y] # Não deixa exceder o limite do tabuleiro
             moved = True
         elif direction == 'right' and y > 0: # Troca o espaço vazio com o número à direita dele
@@ -114,12 +479,7 @@ class EightPuzzle: # Classe que representa o jogo do puzzle de 8 peças
 
         if moved: # Se o movimento foi realizado com sucesso
             self.moves += 1 # Incrementa o contador de movimentos
-            self.mostrar_tabuleiro() # Mostra o tabuleiro
-            print(f"Movimentos: {self.moves}") # Exibe o número de movimentos
-
-            if self.is_solved(): # Verifica se o tabuleiro está resolvido
-                print(f"🎉 Parabéns! Atingiu a configuração final em {self.moves} movimentos! 🎉") 
-                keyboard.unhook_all() # Desliga o hook/import do teclado
+        return moved # Indica a quem chamou se o tabuleiro mudou
 
     def is_solved(self): # Método para verificar se o tabuleiro está resolvido
        
@@ -127,188 +487,627 @@ class EightPuzzle: # Classe que representa o jogo do puzzle de 8 peças
  
     def board_to_state(self, board): # Método para converter o tabuleiro em estado
        
-        return tuple(tuple(row) for row in board) # Converte o tabuleiro em uma tupla que é imutável (inalterável)
+        geo = self.geo # Constantes do estado compactado
+        state = 0 # O estado é um inteiro compactado (geo.bits bits por célula)
+        for pos, num in enumerate(num for row in board for num in row): # Loop para percorrer as células do tabuleiro
+            state |= num << (pos * geo.bits) # Guarda o número na sua posição
+            if num == 0: # Se for o espaço vazio
+                state |= pos << geo.shift_vazio # Guarda também o índice do espaço vazio nos bits superiores
+        return state # Retorna o estado compactado (imutável e com hash barato)
+
+    def state_to_board(self, state): # Método para converter o estado compactado em tabuleiro
+       
+        geo = self.geo # Constantes do estado compactado
+        nums = [(state >> (pos * geo.bits)) & geo.mascara for pos in range(geo.celulas)] # Extrai o número de cada célula
+        return [nums[i:i + geo.tamanho] for i in range(0, geo.celulas, geo.tamanho)] # Agrupa os números em linhas
 
     def get_neighbors(self, state): # Método para obter os numeros vizinhos
         
-        board = [list(row) for row in state] # Converte o tabuleiro em uma lista mutavel (alterável)
-        x, y = self.find_empty(board) # Localiza o espaço vazio
+        geo = self.geo # Constantes do estado compactado
         neighbors = [] # Armazena os movimentos possíveis e os estados resultantes
-
-        def swap_and_clone(b, i1, j1, i2, j2): # Método para trocar e clonar o tabuleiro
-            b_new = [row[:] for row in b] # Clona o tabuleiro para não alterar o original
-            b_new[i1][j1], b_new[i2][j2] = b_new[i2][j2], b_new[i1][j1] # Troca os valores das posições
-            return b_new # Retorna o tabuleiro clonado
-
-        if x < 2:  # pode mover 'up' 
-            new_board = swap_and_clone(board, x, y, x+1, y) # Troca o espaço vazio com o número acima dele (imutável)
-            neighbors.append(('up', self.board_to_state(new_board))) # Adiciona o movimento e o estado resultante
-        if x > 0:  # pode mover 'down'
-            new_board = swap_and_clone(board, x, y, x-1, y) # Troca o espaço vazio com o número abaixo dele (imutável)
-            neighbors.append(('down', self.board_to_state(new_board))) # Adiciona o movimento e o estado resultante
-        if y < 2:  # pode mover 'left'
-            new_board = swap_and_clone(board, x, y, x, y+1) # Troca o espaço vazio com o número à esquerda dele (imutável)
-            neighbors.append(('left', self.board_to_state(new_board))) # Adiciona o movimento e o estado resultante
-        if y > 0:  # pode mover 'right'
-            new_board = swap_and_clone(board, x, y, x, y-1) # Troca o espaço vazio com o número à direita dele (imutável)
-            neighbors.append(('right', self.board_to_state(new_board))) # Adiciona o movimento e o estado resultante
+        for move, _, shift, fator, delta_vazio in geo.movimentos[state >> geo.shift_vazio]: # Trocas pré-calculadas para a posição do espaço vazio
+            tile = (state >> shift) & geo.mascara # Número da peça que vai ser movida
+            neighbors.append((move, state + tile * fator + delta_vazio)) # Adiciona o movimento e o estado resultante
         return neighbors # Retorna os movimentos possíveis e os estados resultantes
 
-    def heuristic_manhattan(self, state): # Método para calcular a heurística de Manhattan
+    def heuristic_value(self, state, table): # Soma o custo de cada peça numa tabela por peça/posição
         
-        board = [list(row) for row in state] # Converte o tabuleiro em uma lista mutável (alterável)
-        target = self.target_board # Define o tabuleiro final como o alvo
-        target_pos = {} # Dicionário para armazenar as posições dos números no tabuleiro final
-        for i in range(3): # Loop para percorrer as linhas do tabuleiro
-            for j in range(3): # Loop para percorrer as colunas do tabuleiro
-                target_pos[target[i][j]] = (i, j) # Armazena no dicionário as posições dos números no tabuleiro final
+        geo = self.geo # Constantes do estado compactado
+        bits, mascara, celulas = geo.bits, geo.mascara, geo.celulas # Variáveis locais (mais rápidas no loop)
         distance = 0 # Distância começa em 0
-        for i in range(3): # Loop para percorrer as linhas do tabuleiro
-            for j in range(3): # Loop para percorrer as colunas do tabuleiro
-                val = board[i][j] # Verifica se o valor é diferente de 0
-                if val != 0:    # Ignora o espaço vazio
+        for pos in range(celulas): # Loop para percorrer as células do tabuleiro
+            distance += table[((state >> (pos * bits)) & mascara) * celulas + pos] # Custo da peça nesta posição
+        return distance # Retorna a distância
 
-                    ti, tj = target_pos[val] #### Verifica a posição do número no tabuleiro final ????
-                    
-                    distance += abs(i - ti) + abs(j - tj) # Calcula a distância de Manhattan
-        return distance # Retorna a distância de Manhattan
+    def heuristic_manhattan(self, state): # Método para calcular a heurística de Manhattan
+        
+        return self.heuristic_value(state, self.goal_tables()['manhattan']) # Distâncias pré-calculadas para o tabuleiro final
 
     def heuristic_hamming(self, state): # Método para calcular a heurística de Hamming
         
-        board = [list(row) for row in state] # Converte o tabuleiro em uma lista mutável (alterável)
-        distance = 0 # Distância começa em 0
-        for i in range(3): # Loop para percorrer as linhas do tabuleiro
-            for j in range(3): # Loop para percorrer as colunas do tabuleiro
-                if board[i][j] != 0 and board[i][j] != self.target_board[i][j]: # Verifica se o número é diferente de 0 e se está na posição correta
-                    distance += 1 # Incrementa a distância
+        return self.heuristic_value(state, self.goal_tables()['hamming']) # Peças fora do lugar pré-calculadas para o tabuleiro final
+
+    def reconstruct_path(self, came_from, current): # Método para reconstruir os movimentos até um estado
+        
+        moves = [] # Lista de movimentos (do fim para o início)
+        while came_from.get(current) is not None: # Enquanto o estado atual tiver pai (o estado inicial não tem)
+            current, move = came_from[current] # Atualiza o estado atual e o movimento
+            moves.append(move) # Adiciona o movimento à lista de movimentos
+        return list(reversed(moves)) # Retorna a lista de movimentos invertida
+
+    def heuristic_linear_conflict(self, state): # Método para calcular a heurística Manhattan com conflitos lineares
+        
+        tables = self.goal_tables() # Tabelas do tabuleiro final
+        n = self.size # Dimensão do tabuleiro
+        nums = [num for row in self.state_to_board(state) for num in row] # Números de cada célula
+        distance = self.heuristic_value(state, tables['manhattan']) # Parte da distância de Manhattan
+        for i in range(n): # Loop para percorrer as linhas e as colunas
+            linha = [tables['coluna'][v] for v in nums[i * n:(i + 1) * n] if v != 0 and tables['linha'][v] == i] # Peças já na linha final
+            coluna = [tables['linha'][v] for v in nums[i::n] if v != 0 and tables['coluna'][v] == i] # Peças já na coluna final
+            for ordem in (linha, coluna): # Peças em conflito têm de sair da linha e voltar (+2 movimentos cada)
+                distance += 2 * (len(ordem) - self.longest_increasing(ordem))
         return distance # Retorna a distância
 
-    def auto_solve_astar(self, heuristic): # Método para resolver o puzzle automaticamente
+    def longest_increasing(self, values): # Tamanho da maior subsequência crescente (peças que não precisam de sair)
+        
+        best = [] # best[i] = menor fim de uma subsequência crescente de tamanho i + 1
+        for value in values: # Loop para percorrer os valores
+            i = 0 # Procura a primeira posição com fim maior ou igual
+            while i < len(best) and best[i] < value:
+                i += 1
+            if i == len(best): # Aumenta a subsequência
+                best.append(value)
+            else: # Melhora o fim de uma subsequência existente
+                best[i] = value
+        return len(best) # Retorna o tamanho
+
+    def pdb_tables(self): # Método para obter as bases de dados de padrões do tabuleiro final
+        
+        if self._pdb is None: # Calcula os pesos uma única vez por tabuleiro final
+            tables = self.goal_tables() # Tabelas do tabuleiro final
+            n, celulas = self.size, self.geo.celulas # Dimensão e número de células
+            grupos = grupos_pdb(tables['posicao'][0], n) # Grupos de células finais (sem a do espaço vazio)
+            grupo_de = [0] * celulas # Grupo de cada peça
+            peso = [0] * (celulas * celulas) # Contribuição de cada peça/posição para o índice do seu grupo
+            for g, grupo in enumerate(grupos): # Loop para percorrer os grupos
+                for i, celula in enumerate(grupo): # Loop para percorrer as células finais do grupo
+                    tile = self.target_board[celula // n][celula % n] # Peça que termina nesta célula
+                    grupo_de[tile] = g # Guarda o grupo da peça
+                    for pos in range(celulas): # Peso da peça em cada posição
+                        peso[tile * celulas + pos] = pos * celulas ** i
+            self._pdb = ([carregar_pdb(grupo, n) for grupo in grupos], tuple(grupo_de), tuple(peso)) # Guarda as tabelas e os pesos
+        return self._pdb # Retorna as tabelas
+
+    def heuristic_pdb(self, state): # Método para calcular a heurística aditiva das bases de dados de padrões
+        
+        bases, grupo_de, peso = self.pdb_tables() # Tabelas e pesos do tabuleiro final
+        geo = self.geo # Constantes do estado compactado
+        bits, mascara, celulas = geo.bits, geo.mascara, geo.celulas # Variáveis locais (mais rápidas no loop)
+        indices = [0] * len(bases) # Índice de cada grupo
+        for pos in range(celulas): # Loop para percorrer as células do tabuleiro
+            tile = (state >> (pos * bits)) & mascara # Extrai o valor da célula
+            if tile != 0: # Ignora o espaço vazio
+                indices[grupo_de[tile]] += peso[tile * celulas + pos] # Acumula no índice do grupo da peça
+        return sum(base[indice] for base, indice in zip(bases, indices)) # Os grupos são disjuntos: a soma é admissível
+
+    @instrumentado
+    def auto_solve_astar(self, heuristic, stats=None, fila="baldes"): # Método para resolver o puzzle automaticamente
+        return self.solve_astar(heuristic, stats=stats, fila=fila) # A pesquisa está em solve_astar (sem medição)
+
+    def solve_astar(self, heuristic, stats=None, fila="baldes"): # A* sem o decorador (também usado pelo HDA* em série)
+        # fila: "baldes" (FilaBaldes, O(1) por operação) ou "heap" (heapq, O(log n), mantido para comparação)
         
         start = self.board_to_state(self.board) # Converte o tabuleiro inicial em estado
         goal = self.board_to_state(self.target_board) # Verifica se o tabuleiro final é o objetivo
-        open_set = [] # Filas de prioridade para armazenar os estados para explorar
-        heapq.heappush(open_set, (heuristic(start), 0, start)) # Adiciona o estado inicial à fila de prioridade
+        table = self.heuristic_table(heuristic) # Tabela para atualizar a heurística de forma incremental (se existir)
+        geo = self.geo # Constantes do estado compactado
+        movimentos, mascara, celulas, shift_vazio = geo.movimentos, geo.mascara, geo.celulas, geo.shift_vazio # Variáveis locais
+        if fila == "baldes": # Fila de prioridade por baldes
+            open_set = FilaBaldes()
+            push, pop = open_set.push, open_set.pop
+        elif fila == "heap": # Fila de prioridade binária
+            open_set = []
+            push, pop = partial(heapq.heappush, open_set), partial(heapq.heappop, open_set)
+        else:
+            raise ValueError(f"Fila desconhecida: {fila} (opções: baldes, heap)")
+        push((heuristic(start), 0, start)) # Adiciona o estado inicial à fila de prioridade
         came_from = {}  # Dicionário para armazenar o movimento e o estado anterior
         g_score = {start: 0} # Dicionário para armazenar o custo do caminho (inicialmente 0)
+        self.nodes_expanded = 0 # Contador de nós expandidos
+        generated = stale = peak_open = 0 # Contadores das estatísticas
+        medir = stats is not None # O pico da fila só é medido quando pedido
+        solution = None # Movimentos da solução
 
         while open_set: # Enquanto a fila de prioridade não estiver vazia
-            f, current_cost, current = heapq.heappop(open_set) # Remove o estado com menor custo da fila de prioridade
+            if medir and len(open_set) > peak_open: # Maior tamanho da fila de prioridade
+                peak_open = len(open_set)
+            f, current_cost, current = pop() # Remove o estado com menor custo da fila de prioridade
             if current == goal: # Verifica se o estado atual é o objetivo
-                moves = [] # 
-
-                while current in came_from: # Enquanto o estado atual estiver no dicionário came_from
-                    current, move = came_from[current] # Atualiza o estado atual e o movimento
-                    moves.append(move) # Adiciona o movimento à lista de movimentos
-                return list(reversed(moves)) # Retorna a lista de movimentos invertida
+                solution = self.reconstruct_path(came_from, current) # Reconstrói os movimentos a partir dos ponteiros para o pai
+                break
+            if current_cost > g_score[current]: # Entrada obsoleta: o estado já foi expandido com um custo menor
+                stale += 1 # Re-expansão evitada
+                continue
+            self.nodes_expanded += 1 # Conta o nó expandido
             
-            for move, neighbor in self.get_neighbors(current): # Para cada movimento e vizinho no estado atual
-                tentative_g = g_score[current] + 1 # Custo acumulado = custo atual + 1
-                if neighbor not in g_score or tentative_g < g_score[neighbor]: # Se o vizinho não estiver no dicionário ou o custo acumulado for menor
+            tentative_g = current_cost + 1 # Custo acumulado = custo atual + 1
+            h_current = f - current_cost # Heurística do estado atual (f = g + h)
+            empty = current >> shift_vazio # Posição do espaço vazio
+            for move, destino, shift, fator, delta_vazio in movimentos[empty]: # Trocas pré-calculadas para o espaço vazio
+                tile = (current >> shift) & mascara # Peça que vai ocupar o espaço vazio
+                neighbor = current + tile * fator + delta_vazio # Estado vizinho sem criar tabuleiros intermédios
+                generated += 1 # Conta o vizinho gerado
+                if tentative_g < g_score.get(neighbor, tentative_g + 1): # Se o vizinho não estiver no dicionário ou o custo acumulado for menor
                     came_from[neighbor] = (current, move) # Atualiza o dicionário came_from
                     g_score[neighbor] = tentative_g # Atualiza o dicionário g_score
-                    f_neighbor = tentative_g + heuristic(neighbor) # Calcula a heurística do vizinho
-                    heapq.heappush(open_set, (f_neighbor, tentative_g, neighbor)) # Adiciona o vizinho à fila de prioridade
-        return None # Retorna nulo se não encontrar solução
+                    if table is not None: # Só a peça movida muda de posição: h(vizinho) = h(atual) + delta da peça
+                        h_neighbor = h_current + table[tile * celulas + empty] - table[tile * celulas + destino]
+                    else: # Heurística sem tabela: calcula do zero
+                        h_neighbor = heuristic(neighbor)
+                    push((tentative_g + h_neighbor, tentative_g, neighbor)) # Adiciona o vizinho à fila de prioridade
+        if medir: # Preenche as estatísticas
+            stats.expandidos, stats.gerados, stats.repetidos = self.nodes_expanded, generated, stale
+            stats.pico_abertos, stats.pico_fechados = peak_open, len(g_score) # O dicionário g_score só cresce
+        return solution # Retorna a solução (None se não encontrar)
 
-    def auto_solve_bfs(self): # Método para resolver o puzzle automaticamente
+    @instrumentado
+    def auto_solve_arastar(self, heuristic, stats=None, pesos=PESOS_ARA, tempo_limite=None, limite_nos=None):
+        # ARA* (A* anytime reparador): A* com f = g + peso * h e pesos decrescentes, reaproveitando a pesquisa anterior.
+        # A primeira solução (peso alto) chega depressa; cada iteração melhora-a até acabar o tempo (segundos) ou os nós.
+        # Devolve a melhor solução encontrada; self.suboptimality_bound garante comprimento <= limite * ótimo
+        
+        start = self.board_to_state(self.board) # Converte o tabuleiro inicial em estado
+        goal = self.board_to_state(self.target_board) # Estado objetivo
+        self.nodes_expanded = generated = stale = peak_open = 0 # Contadores das estatísticas
+        self.suboptimality_bound = None # Garantia da solução atual
+        self.anytime_solutions = [] # Soluções melhoradas: (tempo, movimentos, peso, limite)
+        if not self.is_solvable(self.board, self.target_board): # Sem solução exploraria todos os estados alcançáveis
+            return None
+        table = self.heuristic_table(heuristic) # Tabela para atualizar a heurística de forma incremental (se existir)
+        geo = self.geo # Constantes do estado compactado
+        movimentos, mascara, celulas, shift_vazio = geo.movimentos, geo.mascara, geo.celulas, geo.shift_vazio # Variáveis locais
+        inicio = time.perf_counter() # Regista o tempo de início
+        prazo = inicio + tempo_limite if tempo_limite is not None else None # Instante limite
+        g_score = {start: 0} # Custo do melhor caminho conhecido até cada estado
+        h_score = {start: heuristic(start)} # Heurística de cada estado (necessária para reordenar a fila)
+        came_from = {} # Pai e movimento de cada estado
+        inconsistent = {start} # Estados melhorados depois de expandidos (entram na fila na iteração seguinte)
+        open_set = [] # Fila de prioridade (f com peso não é inteiro: usa o heapq)
+        solution = None # Melhor solução encontrada
+        esgotado = False # Acabou o tempo ou o limite de nós
+
+        for peso in pesos: # Uma iteração por peso
+            estados = {estado for _, _, estado in open_set} | inconsistent # Estados abertos com o g atual
+            open_set = [(g_score[estado] + peso * h_score[estado], g_score[estado], estado) for estado in estados]
+            heapq.heapify(open_set) # Reordena a fila com o novo peso
+            inconsistent = set() # Sem estados inconsistentes no início da iteração
+            closed = set() # Estados expandidos nesta iteração
+            while open_set and g_score.get(goal, float('inf')) > open_set[0][0]: # Pára quando nenhum estado aberto promete melhor
+                if len(open_set) > peak_open: # Maior tamanho da fila
+                    peak_open = len(open_set)
+                entrada = heapq.heappop(open_set) # Remove o estado com menor f
+                _, current_cost, current = entrada
+                if current in closed or current_cost > g_score[current]: # Entrada obsoleta
+                    stale += 1 # Re-expansão evitada
+                    continue
+                if not (self.nodes_expanded + 1) & 1023: # Verifica os limites de vez em quando (sem custo por nó), antes de expandir
+                    if (prazo is not None and time.perf_counter() > prazo) or (limite_nos is not None and self.nodes_expanded >= limite_nos):
+                        heapq.heappush(open_set, entrada) # Não expandido: continua na fronteira do limite inferior
+                        esgotado = True
+                        break
+                closed.add(current) # Só é expandido uma vez por iteração
+                self.nodes_expanded += 1 # Conta o nó expandido
+                tentative_g = current_cost + 1 # Custo acumulado = custo atual + 1
+                h_current = h_score[current] # Heurística do estado atual
+                empty = current >> shift_vazio # Posição do espaço vazio
+                for move, destino, shift, fator, delta_vazio in movimentos[empty]: # Trocas pré-calculadas para o espaço vazio
+                    tile = (current >> shift) & mascara # Peça que vai ocupar o espaço vazio
+                    neighbor = current + tile * fator + delta_vazio # Estado vizinho compactado
+                    generated += 1 # Conta o vizinho gerado
+                    if tentative_g < g_score.get(neighbor, tentative_g + 1): # Caminho melhor para o vizinho
+                        came_from[neighbor] = (current, move) # Atualiza o pai
+                        g_score[neighbor] = tentative_g # Atualiza o custo
+                        if neighbor not in h_score: # Primeira vez que o estado é visto
+                            if table is not None: # Só a peça movida muda de posição
+                                h_score[neighbor] = h_current + table[tile * celulas + empty] - table[tile * celulas + destino]
+                            else: # Heurística sem tabela: calcula do zero
+                                h_score[neighbor] = heuristic(neighbor)
+                        if neighbor in closed: # Já expandido nesta iteração: fica para a próxima
+                            inconsistent.add(neighbor)
+                        else:
+                            heapq.heappush(open_set, (tentative_g + peso * h_score[neighbor], tentative_g, neighbor))
+            if goal in g_score: # Solução (melhorada ou não) desta iteração
+                if solution is None or g_score[goal] < len(solution): # Só reconstrói se melhorou
+                    solution = self.reconstruct_path(came_from, goal)
+                # Limite inferior do ótimo: menor g + h entre os estados que ainda podem melhorar a solução
+                fronteira = [g_score[estado] + h_score[estado] for _, g, estado in open_set if g == g_score[estado]]
+                fronteira += [g_score[estado] + h_score[estado] for estado in inconsistent]
+                minimo = min(fronteira, default=len(solution)) # Sem estados por explorar a solução é ótima
+                limite = max(1.0, len(solution) / minimo) if minimo else 1.0 # Garantia dada pelo limite inferior
+                self.suboptimality_bound = limite if esgotado else min(peso, limite) # Iteração completa: garante também o peso
+                self.anytime_solutions.append((time.perf_counter() - inicio, len(solution), peso, self.suboptimality_bound))
+                if self.suboptimality_bound <= 1: # Já é ótima
+                    break
+            if esgotado: # Sem tempo para mais iterações
+                break
+
+        if stats is not None: # Preenche as estatísticas
+            stats.expandidos, stats.gerados, stats.repetidos = self.nodes_expanded, generated, stale
+            stats.pico_abertos, stats.pico_fechados = peak_open, len(g_score) # Os dicionários só crescem
+            stats.limite_subotimo = self.suboptimality_bound
+        return solution # Retorna a melhor solução (None se o limite acabou antes da primeira)
+
+    @instrumentado
+    def auto_solve_hda(self, heuristic, stats=None, processos=None, lote=2048, forcar=False):
+        # A* paralelo distribuído por hash (HDA*). Cada estado pertence ao processo dono_estado(estado); os filhos são
+        # enviados ao dono em lotes, por rondas. Em cada ronda só se expande a camada com o menor f global, por isso a
+        # solução é ótima como no A*. Termina quando a melhor solução conhecida não é maior do que o menor f ainda por
+        # expandir (incluindo os estados em trânsito); o caminho é reconstruído perguntando o pai de cada estado ao dono.
+        # Só compensa com vários núcleos: no 4x4 com PDB, num só núcleo, foi 2 a 6 vezes mais lento do que o A* (0,58 s
+        # contra 0,10 s numa instância fácil, 31 s contra 16 s numa difícil). Com menos de HDA_PROCESSOS_MINIMO processos
+        # resolve com o A* em série (e as estatísticas ficam com o nome do A*); forcar=True usa sempre o HDA*
+        
+        start = self.board_to_state(self.board) # Converte o tabuleiro inicial em estado
+        goal = self.board_to_state(self.target_board) # Estado objetivo
+        self.nodes_expanded = 0 # Contador de nós expandidos (soma de todos os processos)
+        self.parallel_load = [] # Nós expandidos por cada processo (equilíbrio da carga)
+        if not self.is_solvable(self.board, self.target_board): # Sem solução exploraria todos os estados alcançáveis
+            return None
+        processos = processos or os.cpu_count() or 1 # Um processo por núcleo
+        if hda_em_serie(processos, forcar): # Em paralelo seria mais lento: A* em série
+            if stats is not None: # A medição fica registada como A* e não como HDA*
+                stats.algoritmo = "astar/" + heuristic.__name__.replace("heuristic_", "")
+            return self.solve_astar(heuristic, stats=stats) # Sem medir duas vezes (já medido aqui)
+        f_limite = heuristic(start) # Primeira camada (também constrói as tabelas da heurística antes de criar os processos)
+        caixas = [multiprocessing.Queue() for _ in range(processos)] # Caixa de entrada de cada processo (lotes de estados)
+        comandos = [multiprocessing.Queue() for _ in range(processos)] # Ordens do processo principal
+        respostas = [multiprocessing.Queue() for _ in range(processos)] # Relatórios e respostas de cada processo
+        trabalhadores = [multiprocessing.Process(target=trabalhador_hda, daemon=True,
+                                                 args=(i, processos, self.board, self.target_board, heuristic.__name__,
+                                                       caixas, comandos[i], respostas[i], lote))
+                         for i in range(processos)] # Um processo por parte do espaço de estados
+        for trabalhador in trabalhadores:
+            trabalhador.start()
+        incumbente = float('inf') # Comprimento da melhor solução conhecida
+        expandidos = [0] * processos # Nós expandidos por processo
+        peak_open = peak_closed = 0 # Picos (somados em todos os processos)
+        try:
+            ronda = 0 # Número da ronda
+            while True:
+                for fila in comandos: # Começa a ronda em todos os processos
+                    fila.put(("ronda", ronda, f_limite, incumbente))
+                relatorios = [fila.get() for fila in respostas] # Espera pelos relatórios de todos
+                f_minimo = min(relatorio[0] for relatorio in relatorios) # Menor f por expandir (filas e lotes em trânsito)
+                incumbente = min(incumbente, min(relatorio[1] for relatorio in relatorios)) # Melhor solução conhecida
+                for i, relatorio in enumerate(relatorios): # Soma os contadores
+                    expandidos[i] += relatorio[2]
+                peak_open = max(peak_open, sum(relatorio[4] for relatorio in relatorios))
+                peak_closed = max(peak_closed, sum(relatorio[5] for relatorio in relatorios))
+                if incumbente <= f_minimo: # Nenhum estado por expandir pode dar uma solução melhor: é ótima
+                    break
+                f_limite = f_minimo # Próxima ronda: a camada com o menor f
+                ronda += 1
+
+            solution = None # Movimentos da solução
+            if incumbente < float('inf'): # Reconstrói o caminho perguntando os pais aos donos
+                solution, estado = [], goal
+                while estado != start:
+                    dono = dono_estado(estado, processos) # Processo que guarda o pai
+                    comandos[dono].put(("pai", estado))
+                    estado, move = respostas[dono].get()
+                    solution.append(move)
+                solution.reverse()
+        finally:
+            for fila in comandos: # Termina os processos
+                fila.put(("fim",))
+            for trabalhador in trabalhadores:
+                trabalhador.join(timeout=5)
+                if trabalhador.is_alive(): # Não respondeu (erro): termina à força
+                    trabalhador.terminate()
+
+        self.nodes_expanded, self.parallel_load = sum(expandidos), expandidos # Totais de todos os processos
+        if stats is not None: # Preenche as estatísticas
+            stats.expandidos = self.nodes_expanded
+            stats.gerados = sum(relatorio[3] for relatorio in relatorios)
+            stats.repetidos = sum(relatorio[6] for relatorio in relatorios)
+            stats.pico_abertos, stats.pico_fechados = peak_open, peak_closed
+        return solution # Retorna a solução ótima (None se não encontrar)
+
+    @instrumentado
+    def auto_solve_idastar(self, heuristic, stats=None): # Método para resolver o puzzle com IDA* (A* com aprofundamento iterativo)
+        
+        start = self.board_to_state(self.board) # Converte o tabuleiro inicial em estado
+        goal = self.board_to_state(self.target_board) # Estado objetivo
+        if not self.is_solvable(self.board, self.target_board): # Sem solução o limite cresceria para sempre
+            return None
+        table = self.heuristic_table(heuristic) # Tabela para atualizar a heurística de forma incremental (se existir)
+        geo = self.geo # Constantes do estado compactado
+        movimentos, mascara, celulas = geo.movimentos, geo.mascara, geo.celulas # Variáveis locais
+        path = [] # Movimentos do caminho atual (única estrutura que cresce, com a profundidade)
+        state = start # Único tabuleiro da pesquisa, alterado no lugar (fazer/desfazer movimentos)
+        found = object() # Marcador de solução encontrada
+        self.nodes_expanded = generated = 0 # Contadores de nós expandidos e gerados (somados em todas as iterações)
+
+        def search(g, h, empty, previous, bound): # Pesquisa em profundidade limitada por f = g + h
+            nonlocal state, generated
+            f = g + h # Custo estimado do caminho por este estado
+            if f > bound: # Ultrapassa o limite desta iteração
+                return f # Devolve o f para calcular o próximo limite
+            if state == goal: # Verifica se o estado atual é o objetivo
+                return found
+            self.nodes_expanded += 1 # Conta o nó expandido
+            generated += len(movimentos[empty]) # Todos os vizinhos são gerados (o anterior é descartado logo)
+            minimum = float('inf') # Menor f que ultrapassou o limite nos descendentes
+            for move, destino, shift, fator, delta_vazio in movimentos[empty]: # Trocas pré-calculadas para o espaço vazio
+                if destino == previous: # Não desfaz o movimento anterior (evita ciclos de comprimento 2)
+                    continue
+                tile = (state >> shift) & mascara # Peça que vai ocupar o espaço vazio
+                delta = tile * fator + delta_vazio # Alteração do estado provocada pelo movimento
+                state += delta # Faz o movimento
+                if table is not None: # Só a peça movida muda de posição
+                    h_next = h + table[tile * celulas + empty] - table[tile * celulas + destino]
+                else: # Heurística sem tabela: calcula do zero
+                    h_next = heuristic(state)
+                path.append(move) # Acrescenta o movimento ao caminho
+                result = search(g + 1, h_next, destino, empty, bound) # Explora o vizinho
+                if result is found: # Solução encontrada: mantém o caminho
+                    return found
+                path.pop() # Remove o movimento do caminho
+                state -= delta # Desfaz o movimento
+                if result < minimum: # Guarda o menor f acima do limite
+                    minimum = result
+            return minimum # Retorna o menor f acima do limite
+
+        h_start = heuristic(start) # Heurística do estado inicial
+        bound = h_start # O primeiro limite é a heurística do estado inicial
+        while True: # Aumenta o limite até encontrar a solução
+            result = search(0, h_start, start >> geo.shift_vazio, -1, bound) # Pesquisa com o limite atual
+            if result is found or result == float('inf'): # Solução encontrada ou não há mais estados para explorar
+                break
+            bound = result # Próximo limite: menor f que foi cortado
+        if stats is not None: # Preenche as estatísticas
+            stats.expandidos, stats.gerados = self.nodes_expanded, generated
+            stats.pico_abertos = stats.pico_fechados = bound + 1 # Só o caminho atual está em memória (profundidade máxima)
+        return path if result is found else None # Retorna os movimentos (ótimos com uma heurística admissível)
+
+    @instrumentado
+    def auto_solve_bfs(self, stats=None): # Método para resolver o puzzle automaticamente
         
         start = self.board_to_state(self.board) # Converte o tabuleiro inicial em estado
         goal = self.board_to_state(self.target_board) # Verifica se o tabuleiro final é o objetivo
-        queue = deque([(start, [])]) # Fila para armazenar o estado e o caminho
-        visited = set([start]) # Conjunto para armazenar os estados visitados
+        geo = self.geo # Constantes do estado compactado
+        movimentos, mascara, shift_vazio = geo.movimentos, geo.mascara, geo.shift_vazio # Variáveis locais
+        queue = deque([start]) # Fila para armazenar os estados a explorar
+        came_from = {start: None} # Estados visitados e respetivo pai/movimento (o caminho é reconstruído no fim)
+        self.nodes_expanded = generated = peak_open = 0 # Contadores das estatísticas
+        medir = stats is not None # O pico da fila só é medido quando pedido
+        solution = None # Movimentos da solução
 
         while queue: # Enquanto a fila não estiver vazia
-            current, path = queue.popleft() # Remove o estado mais antigo da fila (FIFO)
+            if medir and len(queue) > peak_open: # Maior tamanho da fila
+                peak_open = len(queue)
+            current = queue.popleft() # Remove o estado mais antigo da fila (FIFO)
             if current == goal: # Verifica se o estado atual é o objetivo
-                return path # Retorna o caminho
-            for move, neighbor in self.get_neighbors(current): # Usa o método get_neighbors para obter os vizinhos
-                if neighbor not in visited: # Se o vizinho não foi visitado
-                    visited.add(neighbor) # Adiciona ao estado visitado
-                    queue.append((neighbor, path + [move])) # Adiciona o vizinho e o movimento à fila
-        return None # Retorna nulo se não encontrar solução
-
-    def auto_solve(self): # Método para resolver o puzzle automaticamente
+                solution = self.reconstruct_path(came_from, current) # Reconstrói o caminho
+                break
+            self.nodes_expanded += 1 # Conta o nó expandido
+            for move, _, shift, fator, delta_vazio in movimentos[current >> shift_vazio]: # Trocas pré-calculadas para o espaço vazio
+                neighbor = current + ((current >> shift) & mascara) * fator + delta_vazio # Estado vizinho compactado
+                generated += 1 # Conta o vizinho gerado
+                if neighbor not in came_from: # Se o vizinho não foi visitado
+                    came_from[neighbor] = (current, move) # Guarda o pai e o movimento
+                    queue.append(neighbor) # Adiciona o vizinho à fila
+        if medir: # Preenche as estatísticas
+            stats.expandidos, stats.gerados = self.nodes_expanded, generated
+            stats.pico_abertos, stats.pico_fechados = peak_open, len(came_from) # Os visitados só crescem
+        return solution # Retorna a solução (None se não encontrar)
+
+    @instrumentado
+    def auto_solve_bidirectional(self, stats=None): # Método para resolver o puzzle com BFS bidirecional
+        
+        start = self.board_to_state(self.board) # Converte o tabuleiro inicial em estado
+        goal = self.board_to_state(self.target_board) # Estado objetivo
+        self.nodes_expanded = generated = peak_open = 0 # Contadores das estatísticas
+        if start == goal: # Já está resolvido
+            return []
+        geo = self.geo # Constantes do estado compactado
+        movimentos, mascara, shift_vazio = geo.movimentos, geo.mascara, geo.shift_vazio # Variáveis locais
+        came_from = ({start: None}, {goal: None}) # Pais da pesquisa a partir do início e a partir do objetivo
+        frontiers = ([start], [goal]) # Camada atual de cada lado
+
+        best = None # Caminho mais curto encontrado
+        while frontiers[0] and frontiers[1]: # Enquanto os dois lados tiverem estados para expandir
+            peak_open = max(peak_open, len(frontiers[0]) + len(frontiers[1])) # Maior número de estados nas duas camadas
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1 # Expande a camada mais pequena
+            own, other = came_from[side], came_from[1 - side] # Pais deste lado e do lado oposto
+            next_frontier = [] # Próxima camada deste lado
+            meetings = [] # Estados desta camada que já foram visitados pelo outro lado
+            self.nodes_expanded += len(frontiers[side]) # Conta os nós expandidos
+            for current in frontiers[side]: # Expande a camada inteira (garante o caminho mais curto)
+                for move, _, shift, fator, delta_vazio in movimentos[current >> shift_vazio]: # Trocas pré-calculadas
+                    neighbor = current + ((current >> shift) & mascara) * fator + delta_vazio # Estado vizinho compactado
+                    generated += 1 # Conta o vizinho gerado
+                    if neighbor not in own: # Se o vizinho ainda não foi visitado deste lado
+                        own[neighbor] = (current, move) # Guarda o pai e o movimento
+                        next_frontier.append(neighbor) # Adiciona à próxima camada
+                        if neighbor in other: # As duas pesquisas encontraram-se
+                            meetings.append(neighbor)
+            if meetings: # Escolhe o ponto de encontro com o caminho total mais curto
+                for meeting in meetings: # Loop para percorrer os pontos de encontro
+                    forward = self.reconstruct_path(came_from[0], meeting) # Movimentos do início até ao encontro
+                    backward = self.reconstruct_path(came_from[1], meeting) # Movimentos do objetivo até ao encontro
+                    path = forward + [INVERSO[move] for move in reversed(backward)] # Inverte o lado do objetivo
+                    if best is None or len(path) < len(best): # Guarda o caminho mais curto
+                        best = path
+                break
+            frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier) # Avança a camada expandida
+        if stats is not None: # Preenche as estatísticas
+            stats.expandidos, stats.gerados, stats.pico_abertos = self.nodes_expanded, generated, peak_open
+            stats.pico_fechados = len(came_from[0]) + len(came_from[1]) # Visitados pelos dois lados
+        return best # Retorna o caminho mais curto (None se não encontrar)
+
+    def numpy_start(self): # Estado inicial e chave do objetivo para a pesquisa vetorizada
+        
+        np, destinos, shifts = tabelas_numpy(self.size) # Tabelas NumPy deste tamanho
+        inicial = np.array([[num for row in self.board for num in row]], dtype=np.uint8) # Bloco com um só tabuleiro
+        objetivo = np.array([[num for row in self.target_board for num in row]], dtype=np.uint8) # Tabuleiro final
+        return np, destinos, shifts, inicial, chaves_numpy(np, objetivo, shifts)[0]
+
+    @instrumentado
+    def auto_solve_bfs_numpy(self, stats=None): # BFS vetorizado: expande uma camada inteira de cada vez com NumPy
         
-        print("Algoritmos disponíveis:")
-        print(" 1 - A* com Manhattan")
-        print(" 2 - A* com Hamming")
-        print(" 3 - BFS")
-        alg = input("Escolha o algoritmo (1, 2 ou 3): ").strip() # Escolha do algoritmo
-        if alg == "1": # Se escolher o algoritmo 1
-            solution = self.auto_solve_astar(self.heuristic_manhattan) # Resolve o puzzle com a heurística de Manhattan
-        elif alg == "2":    # Se escolher o algoritmo 2
-            solution = self.auto_solve_astar(self.heuristic_hamming) # Resolve o puzzle com a heurística de Hamming
-        elif alg == "3":    # Se escolher o algoritmo 3
-            solution = self.auto_solve_bfs()    # Resolve o puzzle com o BFS
-        else:  # Se escolher um algoritmo inválido
-            print("Opção inválida!")
+        if not self.is_solvable(self.board, self.target_board): # Sem solução percorreria metade do espaço de estados
             return None
+        np, destinos, shifts, tabuleiros, goal = self.numpy_start() # Tabelas e estado inicial
+        vazios = np.argmin(tabuleiros, axis=1) # Posição do espaço vazio (o único 0)
+        camada = chaves_numpy(np, tabuleiros, shifts) # Chaves da camada atual (ordenadas)
+        anterior = camada[:0] # Chaves da camada anterior
+        camadas = [] # (pai, movimento) de cada estado de cada camada, para reconstruir o caminho
+        self.nodes_expanded = generated = peak_open = closed = 0 # Contadores das estatísticas
+        solution = None # Movimentos da solução
+
+        while len(camada): # Enquanto houver estados por expandir
+            peak_open = max(peak_open, len(camada)) # Maior camada
+            closed += len(camada) # Estados visitados
+            indice = np.searchsorted(camada, goal) # Procura o objetivo na camada (ordenada)
+            if indice < len(camada) and camada[indice] == goal: # Encontrou o objetivo
+                solution = [] # Reconstrói o caminho de camada em camada
+                for pais, movimentos in reversed(camadas):
+                    solution.append(DIRECOES[movimentos[indice]])
+                    indice = pais[indice]
+                solution.reverse()
+                break
+            self.nodes_expanded += len(camada) # Conta os nós expandidos
+            filhos, vazios, pais, movimentos = expandir_numpy(np, tabuleiros, vazios, destinos) # Todos os filhos de uma vez
+            generated += len(filhos) # Conta os filhos gerados
+            chaves, primeiro = np.unique(chaves_numpy(np, filhos, shifts), return_index=True) # Remove os repetidos (ordenados)
+            # Num grafo não orientado os vizinhos da camada d estão nas camadas d-1, d ou d+1: só é preciso comparar com duas
+            novos = ~(np.isin(chaves, camada, assume_unique=True) | np.isin(chaves, anterior, assume_unique=True))
+            primeiro = primeiro[novos] # Índice do filho que fica com cada estado novo
+            anterior, camada = camada, chaves[novos] # Avança uma camada
+            tabuleiros, vazios = filhos[primeiro], vazios[primeiro] # Tabuleiros da nova camada
+            camadas.append((pais[primeiro], movimentos[primeiro])) # Guarda os pais para reconstruir o caminho
 
-        if solution is None: # Se não encontrar solução
-            print("Não foi encontrada solução!") # Mostra a mensagem de erro
+        if stats is not None: # Preenche as estatísticas
+            stats.expandidos, stats.gerados = self.nodes_expanded, generated
+            stats.pico_abertos, stats.pico_fechados = peak_open, closed
+        return solution # Retorna a solução (None se não encontrar)
+
+    @instrumentado
+    def auto_solve_astar_numpy(self, heuristica="manhattan", stats=None): # A* vetorizado: expande todos os estados com o menor f de uma vez
+        # heuristica: "manhattan" ou "hamming" (tabelas por peça/posição, somadas para o bloco inteiro numa operação)
+        
+        if not self.is_solvable(self.board, self.target_board): # Sem solução percorreria metade do espaço de estados
             return None
+        np, destinos, shifts, tabuleiros, goal = self.numpy_start() # Tabelas e estado inicial
+        celulas = self.geo.celulas # Número de células
+        tabela = np.array(self.goal_tables()[heuristica], dtype=np.int32).reshape(celulas, celulas) # tabela[peça, posição]
+        posicoes = np.arange(celulas) # Coluna de cada célula
+
+        def heuristica_bloco(bloco): # Heurística de todos os tabuleiros de um bloco numa só operação
+            return tabela[bloco, posicoes].sum(axis=1, dtype=np.int32)
+
+        chave = chaves_numpy(np, tabuleiros, shifts) # Chave do estado inicial
+        vistos, vistos_id, vistos_g = chave, np.zeros(1, np.int64), np.zeros(1, np.int32) # Melhor nó de cada estado (ordenados)
+        abertos = (chave, np.zeros(1, np.int32), heuristica_bloco(tabuleiros), np.zeros(1, np.int64)) # chave, g, h, id
+        pais, movimentos = [np.full(1, -1, np.int64)], [np.full(1, -1, np.int8)] # Pai e movimento de cada nó (por blocos)
+        proximo_id = 1 # Identificador do próximo nó
+        self.nodes_expanded = generated = stale = peak_open = 0 # Contadores das estatísticas
+        solution = None # Movimentos da solução
+
+        while len(abertos[0]): # Enquanto houver estados por expandir
+            peak_open = max(peak_open, len(abertos[0])) # Maior número de estados abertos
+            chaves, g, h, ids = abertos # Estados abertos
+            f = g + h # Custo estimado de cada estado
+            bloco = f == f.min() # Todos os estados com o menor f são expandidos juntos
+            abertos = tuple(coluna[~bloco] for coluna in abertos) # Os outros ficam na fila
+            chaves, g, ids = chaves[bloco], g[bloco], ids[bloco] # Bloco a expandir
+            atuais = vistos_id[np.searchsorted(vistos, chaves)] == ids # Entradas obsoletas (o estado tem um nó melhor)
+            stale += int(len(ids) - atuais.sum()) # Re-expansões evitadas
+            chaves, g, ids = chaves[atuais], g[atuais], ids[atuais] # Só os nós atuais
+            objetivo = np.flatnonzero(chaves == goal) # Com f mínimo, o objetivo no bloco é ótimo
+            if len(objetivo): # Reconstrói o caminho pelos pais
+                todos_pais, todos_movimentos = np.concatenate(pais), np.concatenate(movimentos) # Pais de todos os nós
+                no, solution = int(ids[objetivo[0]]), [] # Nó do objetivo
+                while todos_pais[no] >= 0: # Sobe até ao nó inicial
+                    solution.append(DIRECOES[todos_movimentos[no]])
+                    no = int(todos_pais[no])
+                solution.reverse()
+                break
+            self.nodes_expanded += len(chaves) # Conta os nós expandidos
+            tabuleiros = ((chaves[:, None] >> shifts) & np.uint64(15)).astype(np.uint8) # Desempacota as chaves
+            filhos, _, linha_pai, movimento = expandir_numpy(np, tabuleiros, np.argmin(tabuleiros, axis=1), destinos) # Filhos do bloco
+            generated += len(filhos) # Conta os filhos gerados
+            chaves_filhos, g_filhos = chaves_numpy(np, filhos, shifts), g[linha_pai] + 1 # Chave e custo de cada filho
+            ordem = np.lexsort((g_filhos, chaves_filhos)) # Por chave e, em cada chave, pelo menor g
+            primeiro = np.ones(len(ordem), dtype=bool) # Fica o primeiro (menor g) de cada chave
+            primeiro[1:] = chaves_filhos[ordem[1:]] != chaves_filhos[ordem[:-1]]
+            ordem = ordem[primeiro] # Filhos sem repetidos no bloco
+            chaves_filhos, g_filhos = chaves_filhos[ordem], g_filhos[ordem]
+            posicao = np.minimum(np.searchsorted(vistos, chaves_filhos), len(vistos) - 1) # Procura os filhos nos estados vistos
+            conhecido = vistos[posicao] == chaves_filhos # Estados já vistos
+            melhor = ~conhecido | (g_filhos < vistos_g[posicao]) # Novos ou com caminho melhor
+            ordem, chaves_filhos, g_filhos, conhecido, posicao = (ordem[melhor], chaves_filhos[melhor], g_filhos[melhor],
+                                                                  conhecido[melhor], posicao[melhor])
+            novos_ids = np.arange(proximo_id, proximo_id + len(ordem), dtype=np.int64) # Um nó por filho que fica
+            proximo_id += len(ordem)
+            pais.append(ids[linha_pai[ordem]]) # Pai de cada novo nó
+            movimentos.append(movimento[ordem]) # Movimento de cada novo nó
+            vistos_id[posicao[conhecido]] = novos_ids[conhecido] # Caminho melhor para um estado visto: o nó antigo fica obsoleto
+            vistos_g[posicao[conhecido]] = g_filhos[conhecido]
+            if (~conhecido).any(): # Junta os estados novos aos vistos, mantendo a ordem
+                vistos = np.concatenate((vistos, chaves_filhos[~conhecido]))
+                vistos_id = np.concatenate((vistos_id, novos_ids[~conhecido]))
+                vistos_g = np.concatenate((vistos_g, g_filhos[~conhecido]))
+                ordem_vistos = np.argsort(vistos, kind="stable")
+                vistos, vistos_id, vistos_g = vistos[ordem_vistos], vistos_id[ordem_vistos], vistos_g[ordem_vistos]
+            novos = (chaves_filhos, g_filhos, heuristica_bloco(filhos[ordem]), novos_ids) # Heurística de todos os filhos de uma vez
+            abertos = tuple(np.concatenate(colunas) for colunas in zip(abertos, novos)) # Junta os filhos à fila
 
-        print(f"Solução encontrada com {len(solution)} movimentos:") # Mostra a solução encontrada
-        print(" -> ".join(solution)) # Mostra os movimentos
-        return solution
+        if stats is not None: # Preenche as estatísticas
+            stats.expandidos, stats.gerados, stats.repetidos = self.nodes_expanded, generated, stale
+            stats.pico_abertos, stats.pico_fechados = peak_open, len(vistos)
+        return solution # Retorna a solução (None se não encontrar)
 
-    def run_all_algorithms_minimal(self):   # Método para executar todos os algoritmos minimamente
+    def canonical_start(self): # Método para renomear as peças de forma a que o objetivo passe a ser o canónico
         
-        print("\nExecutando A* com Manhattan:") 
-        sol_manhattan = self.auto_solve_astar(self.heuristic_manhattan) # Resolve o puzzle com a heurística de Manhattan
-        if sol_manhattan is not None: # Se encontrar solução
-            print(f"Solução: {' -> '.join(sol_manhattan)}") # Mostra a solução
-            print(f"Número de movimentos: {len(sol_manhattan)}\n") # Mostra o número de movimentos
-        else: #
-            print("Nenhuma solução encontrada.\n") # Mostra a mensagem de erro
-            
-        print("Executando A* com Hamming:") # Mostra a execução do A* com Hamming
-        sol_hamming = self.auto_solve_astar(self.heuristic_hamming) # Resolve o puzzle com a heurística de Hamming
-        if sol_hamming is not None: # Se encontrar solução
-            print(f"Solução: {' -> '.join(sol_hamming)}") # Mostra a solução
-            print(f"Número de movimentos: {len(sol_hamming)}\n") # Mostra o número de movimentos
-        else:
-            print("Nenhuma solução encontrada.\n") # Mostra a mensagem de erro
-            
-        print("Executando BFS:") # Mostra a execução do BFS
-        sol_bfs = self.auto_solve_bfs() # Resolve o puzzle com o BFS
-        if sol_bfs is not None: # Se encontrar solução
-            print(f"Solução: {' -> '.join(sol_bfs)}") # Mostra a solução
-            print(f"Número de movimentos: {len(sol_bfs)}\n") # Mostra o número de movimentos
-        else:
-            print("Nenhuma solução encontrada.\n")
+        alvo = [num for row in self.target_board for num in row] # Números do tabuleiro final
+        vazio = alvo.index(0) # Célula final do espaço vazio (não muda com a renomeação)
+        canonico = objetivo_canonico(vazio, self.size) # Objetivo canónico com o vazio na mesma célula
+        mapa = [0] * len(alvo) # Novo nome de cada peça
+        for pos, num in enumerate(alvo): # A peça que termina na célula pos passa a ter o número do canónico
+            mapa[num] = canonico[pos]
+        return vazio, [mapa[num] for row in self.board for num in row] # Vazio final e tabuleiro inicial renomeado (os movimentos são os mesmos)
 
-    def play(self): # Método para jogar o puzzle
+    @instrumentado
+    def auto_solve_table(self, stats=None): # Método para resolver o puzzle 3x3 por consulta da tabela de distâncias exatas
         
-        mode = input("Escolha o modo (M para manual, A para automático, C para comparação): ").strip().upper() # Escolha do modo
-        if mode == "M": 
-            print("Modo manual: Use as SETAS DIRECIONAIS para mover o espaço vazio (0). Pressione ESC para sair.")
-            keyboard.on_press_key("up", lambda _: self.move('up')) # Usa a tecla de seta para cima para mover o espaço vazio para cima
-            keyboard.on_press_key("down", lambda _: self.move('down')) # Usa a tecla de seta para baixo para mover o espaço vazio para baixo
-            keyboard.on_press_key("left", lambda _: self.move('left')) # Usa a tecla de seta para a esquerda para mover o espaço vazio para a esquerda 
-            keyboard.on_press_key("right", lambda _: self.move('right')) # Usa a tecla de seta para a direita para mover o espaço vazio para a direita
-            while not self.is_solved(): # Enquanto o tabuleiro não estiver resolvido
-                if keyboard.is_pressed("esc"): # Se a tecla ESC for pressionada
-                    print("Jogo encerrado.") # Mostra a mensagem de encerramento
-                    break 
-            if self.is_solved(): # Se o tabuleiro estiver resolvido
-                self.mostrar_tabuleiro() # Mostra o tab
-                print(f"🎉 Parabéns! Atingiu a configuração final em {self.moves} movimentos! 🎉") # 
-        elif mode == "A": # Se escolher o modo automático
-            solution = self.auto_solve() # Resolve o puzzle automaticamente 
-            if solution is None:
-                return
-            input("Pressione Enter para começar a solução automática...")
-            for move in solution:
-                self.move(move)
-                input("Pressione Enter para o próximo movimento...")
-            print("Resolução automática completa.")
-        elif mode == "C":
-            self.run_all_algorithms_minimal()
-        else:
-            print("Modo inválido.")
+        if self.size != 3: # 16!/2 estados do 4x4 não cabem numa tabela
+            raise ValueError("A tabela de distâncias exatas só existe para o tabuleiro 3x3")
+        vazio, inicial = self.canonical_start() # Renomeia para o objetivo canónico
+        tabela = carregar_tabela_distancias(vazio) # Tabela mapeada em memória (construída uma vez)
+        geo = self.geo # Constantes do estado compactado
+        distancia = tabela[rank_permutacao(inicial)] # Distância exata até ao objetivo
+        if distancia == 255: # Paridade diferente: sem solução
+            return None
+        empty = inicial.index(0) # Posição do espaço vazio
+        moves = [] # Movimentos da solução
+        generated = 0 # Consultas à tabela
+        while distancia > 0: # Desce pela tabela: há sempre um vizinho à distância d - 1
+            for move, destino, _, _, _ in geo.movimentos[empty]: # Trocas pré-calculadas para o espaço vazio
+                inicial[empty], inicial[destino] = inicial[destino], 0 # Faz o movimento
+                generated += 1 # Conta o vizinho consultado
+                if tabela[rank_permutacao(inicial)] == distancia - 1: # Aproxima-se do objetivo
+                    moves.append(move) # Guarda o movimento
+                    empty = destino # Nova posição do espaço vazio
+                    distancia -= 1 # Menos um movimento até ao objetivo
+                    break
+                inicial[destino], inicial[empty] = inicial[empty], 0 # Desfaz o movimento
+        self.nodes_expanded = len(moves) # Só os estados do caminho são expandidos
+        if stats is not None: # Preenche as estatísticas
+            stats.expandidos, stats.gerados, stats.pico_abertos, stats.pico_fechados = len(moves), generated, 1, 1
+        return moves # Retorna a solução (ótima)
 
-if __name__ == "__main__": # Executa o jogo
-    game = EightPuzzle() # Instancia a classe EightPuzzle
-    game.play() # Inicia o jogo
\ No newline at end of file
+if __name__ == "__main__": # Executa o jogo (a interface de terminal só é importada aqui)
+    from terminal import main # Importa a interface de terminal
+    main() # Inicia o jogo
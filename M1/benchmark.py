@@ -0,0 +1,193 @@
+import argparse # Importa a biblioteca argparse
+import json # Importa a biblioteca json
+import platform # Importa a biblioteca platform
+import random # Importa a biblioteca random
+import statistics # Importa a biblioteca statistics
+import sys # Importa a biblioteca sys
+import time # Importa a biblioteca time
+
+from Projeto import (EightPuzzle, EstatisticasPesquisa, carregar_tabela_distancias, geometria, objetivo_canonico,
+                     rank_permutacao) # Importa o motor do puzzle
+from lote import ALGORITMOS # Algoritmos disponíveis (nome -> função que resolve um EightPuzzle)
+
+SUITES = { # Conjuntos fixos de instâncias: a mesma semente gera sempre as mesmas instâncias
+    "rapida": {"tamanho": 3, "profundidades": (8, 14, 20, 26), "por_profundidade": 3, "semente": 1,
+               "algoritmos": ("manhattan", "conflitos", "pdb", "idastar", "bidirecional", "tabela")},
+    "3x3": {"tamanho": 3, "profundidades": (6, 10, 14, 18, 22, 26, 30), "por_profundidade": 5, "semente": 2,
+            "algoritmos": ("manhattan", "hamming", "conflitos", "pdb", "bfs", "bidirecional", "idastar", "idastar-pdb",
+                           "tabela", "bfs-numpy", "manhattan-numpy")},
+    "4x4": {"tamanho": 4, "profundidades": (20, 30, 40), "por_profundidade": 3, "semente": 3,
+            "algoritmos": ("manhattan", "conflitos", "pdb", "idastar-pdb", "manhattan-numpy")},
+}
+
+def tabuleiro_objetivo(tamanho): # Tabuleiro final habitual: 1, 2, ..., N*N-1 e o espaço vazio no fim
+    numeros = list(range(1, tamanho * tamanho)) + [0] # Números por ordem
+    return [numeros[i:i + tamanho] for i in range(0, tamanho * tamanho, tamanho)]
+
+def gerar_instancia(rng, profundidade, tamanho=3, final=None): # Gera um tabuleiro inicial a partir do final
+    # No 3x3 a profundidade é exata: cada passo vai para um vizinho a distância d + 1 (tabela de distâncias exatas).
+    # Nos outros tamanhos faz um passeio aleatório de `profundidade` movimentos sem voltar atrás (a solução ótima
+    # pode ser mais curta); o tabuleiro resultante é sempre solucionável, porque é alcançável a partir do final
+    final = final or tabuleiro_objetivo(tamanho) # Tabuleiro final
+    alvo = [num for row in final for num in row] # Números do tabuleiro final
+    vazio = alvo.index(0) # Célula final do espaço vazio
+    movimentos = geometria(tamanho).movimentos # Trocas possíveis para cada posição do espaço vazio
+    if tamanho == 3: # Caminha no objetivo canónico (a tabela só existe para ele) e renomeia as peças no fim
+        if not 0 <= profundidade <= 31: # O 8-puzzle mais difícil precisa de 31 movimentos
+            raise ValueError("No 3x3 a profundidade tem de estar entre 0 e 31")
+        tabela = carregar_tabela_distancias(vazio) # Distâncias exatas ao objetivo canónico
+        d = -1 # Ainda sem passeio
+        while d < profundidade: # Repete se o passeio ficar sem saída antes da profundidade pedida
+            tabuleiro, posicao, d = objetivo_canonico(vazio, tamanho), vazio, 0 # Começa no objetivo (distância 0)
+            while d < profundidade: # Afasta-se um movimento de cada vez
+                opcoes = [] # Vizinhos exatamente um movimento mais longe
+                for _, destino, _, _, _ in movimentos[posicao]:
+                    vizinho = tabuleiro[:] # Faz o movimento numa cópia
+                    vizinho[posicao], vizinho[destino] = vizinho[destino], 0
+                    if tabela[rank_permutacao(vizinho)] == d + 1:
+                        opcoes.append((vizinho, destino))
+                if not opcoes: # Nenhum vizinho mais longe (só perto dos estados mais difíceis): recomeça
+                    break
+                tabuleiro, posicao = rng.choice(opcoes) # Escolhe um dos vizinhos mais longe
+                d += 1 # Um movimento mais longe do objetivo
+        canonico = objetivo_canonico(alvo.index(0), tamanho) # Objetivo canónico usado na tabela
+        mapa = {canonico[pos]: num for pos, num in enumerate(alvo)} # Número canónico -> número do tabuleiro final
+        tabuleiro = [mapa[num] for num in tabuleiro] # Renomeia as peças (os movimentos são os mesmos)
+    else:
+        tabuleiro, anterior = alvo[:], -1 # Começa no objetivo
+        for _ in range(profundidade): # Passeio aleatório
+            destino = rng.choice([d for _, d, _, _, _ in movimentos[vazio] if d != anterior]) # Não desfaz o último movimento
+            tabuleiro[vazio], tabuleiro[destino] = tabuleiro[destino], 0 # Faz o movimento
+            anterior, vazio = vazio, destino
+    return [tabuleiro[i:i + tamanho] for i in range(0, tamanho * tamanho, tamanho)], final
+
+def gerar_suite(nome): # Instâncias de uma suite: (id, profundidade, inicial, final)
+    suite = SUITES[nome] # Parâmetros da suite
+    rng = random.Random(suite["semente"]) # Gerador próprio: não depende do estado global do random
+    instancias = [] # Lista de instâncias
+    for profundidade in suite["profundidades"]: # Várias instâncias por profundidade
+        for i in range(suite["por_profundidade"]):
+            inicial, final = gerar_instancia(rng, profundidade, suite["tamanho"])
+            instancias.append((f"d{profundidade}-{i}", profundidade, inicial, final))
+    return instancias
+
+def percentil(valores, p): # Percentil p (0 a 100) com interpolação linear
+    ordenados = sorted(valores) # Valores por ordem
+    posicao = (len(ordenados) - 1) * p / 100 # Posição (fracionária) do percentil
+    abaixo = int(posicao) # Índice abaixo da posição
+    acima = min(abaixo + 1, len(ordenados) - 1) # Índice acima da posição
+    return ordenados[abaixo] + (ordenados[acima] - ordenados[abaixo]) * (posicao - abaixo)
+
+def medir(algoritmo, inicial, final, repeticoes): # Corre um algoritmo numa instância várias vezes
+    game = EightPuzzle(inicial, final) # Puzzle da instância
+    stats = EstatisticasPesquisa(medir_memoria=True) # Primeira execução: memória (também aquece as tabelas e caches)
+    ALGORITMOS[algoritmo](game, stats)
+    memoria = stats.memoria_pico # Pico de memória em bytes
+    tempos = [] # Tempo de cada repetição
+    for _ in range(repeticoes): # Repetições cronometradas (sem o tracemalloc)
+        game = EightPuzzle(inicial, final) # Puzzle novo em cada repetição
+        stats = EstatisticasPesquisa() # Contadores desta repetição
+        ALGORITMOS[algoritmo](game, stats)
+        tempos.append(stats.tempo) # Tempo medido com perf_counter
+    return {"comprimento": stats.comprimento, "expandidos": stats.expandidos, "gerados": stats.gerados,
+            "memoria_pico": memoria, "tempos": tempos}
+
+def resumir(medicoes): # Resumo de um algoritmo num grupo de instâncias
+    tempos = [tempo for medicao in medicoes for tempo in medicao["tempos"]] # Todas as repetições de todas as instâncias
+    return {"instancias": len(medicoes), "mediana": statistics.median(tempos), "p90": percentil(tempos, 90),
+            "p99": percentil(tempos, 99), "expandidos": statistics.median(m["expandidos"] for m in medicoes),
+            "memoria_pico": max(m["memoria_pico"] or 0 for m in medicoes)}
+
+def correr_suite(nome, repeticoes=5, algoritmos=None, mostrar=print): # Corre todos os algoritmos de uma suite
+    suite = SUITES[nome] # Parâmetros da suite
+    algoritmos = algoritmos or suite["algoritmos"] # Algoritmos a medir
+    instancias = gerar_suite(nome) # Instâncias (as mesmas em todas as execuções)
+    resultados = {"suite": nome, "semente": suite["semente"], "repeticoes": repeticoes, "python": platform.python_version(),
+                  "data": time.strftime("%Y-%m-%d %H:%M:%S"), "instancias": {}, "resumo": {}} # Ficheiro de resultados
+    erros = [] # Soluções com comprimento diferente do ótimo
+    for algoritmo in algoritmos: # Um algoritmo de cada vez
+        por_profundidade = {} # Medições agrupadas pela profundidade da instância
+        for identificador, profundidade, inicial, final in instancias:
+            try:
+                medicao = medir(algoritmo, inicial, final, repeticoes)
+            except (ImportError, ValueError) as erro: # Algoritmo indisponível (numpy) ou não aplicável a este tamanho
+                mostrar(f"{algoritmo}: ignorado ({erro})")
+                break
+            if suite["tamanho"] == 3 and medicao["comprimento"] != profundidade: # No 3x3 a profundidade é o ótimo
+                erros.append(f"{algoritmo} {identificador}: {medicao['comprimento']} movimentos (ótimo {profundidade})")
+            resultados["instancias"].setdefault(identificador, {})[algoritmo] = medicao
+            por_profundidade.setdefault(str(profundidade), []).append(medicao)
+        else: # Todas as instâncias foram medidas
+            resultados["resumo"][algoritmo] = {d: resumir(m) for d, m in por_profundidade.items()}
+            resultados["resumo"][algoritmo]["total"] = resumir([m for ms in por_profundidade.values() for m in ms])
+            total = resultados["resumo"][algoritmo]["total"] # Resumo de todas as instâncias
+            mostrar(f"{algoritmo:<16} mediana {total['mediana'] * 1000:9.2f} ms  p90 {total['p90'] * 1000:9.2f} ms  "
+                    f"p99 {total['p99'] * 1000:9.2f} ms  nós {total['expandidos']:>9.0f}  memória {total['memoria_pico'] / 1024:8.0f} KB")
+    resultados["erros"] = erros # Soluções não ótimas (devem ser sempre zero)
+    return resultados
+
+def comparar(base, atual, limiar=1.2, mostrar=print): # Compara os resultados com uma execução de referência
+    # Devolve as regressões: mediana do tempo acima de limiar x referência, mais nós expandidos ou soluções diferentes
+    regressoes = list(atual["erros"]) # As soluções não ótimas são sempre regressões
+    for algoritmo, grupos in atual["resumo"].items(): # Compara algoritmo a algoritmo
+        if algoritmo not in base["resumo"]: # Algoritmo novo: nada a comparar
+            continue
+        antes, agora = base["resumo"][algoritmo]["total"], grupos["total"] # Resumos de todas as instâncias
+        razao = agora["mediana"] / antes["mediana"] if antes["mediana"] else 1.0 # Razão entre as medianas
+        mostrar(f"{algoritmo:<16} mediana {razao:6.2f}x  nós {antes['expandidos']:.0f} -> {agora['expandidos']:.0f}")
+        if razao > limiar: # Mais lento do que o aceitável
+            regressoes.append(f"{algoritmo}: mediana {razao:.2f}x mais lenta")
+        if agora["expandidos"] > antes["expandidos"]: # A pesquisa ficou pior (não depende da máquina)
+            regressoes.append(f"{algoritmo}: {antes['expandidos']:.0f} -> {agora['expandidos']:.0f} nós expandidos")
+        for identificador, medicoes in atual["instancias"].items(): # Comprimento das soluções instância a instância
+            anterior = base["instancias"].get(identificador, {}).get(algoritmo)
+            if anterior and medicoes.get(algoritmo) and anterior["comprimento"] != medicoes[algoritmo]["comprimento"]:
+                regressoes.append(f"{algoritmo} {identificador}: {anterior['comprimento']} -> "
+                                  f"{medicoes[algoritmo]['comprimento']} movimentos")
+    return regressoes
+
+if __name__ == "__main__": # Executa a suite de desempenho
+    parser = argparse.ArgumentParser(description="Gera instâncias e mede o desempenho dos algoritmos do puzzle.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    correr = sub.add_parser("correr", help="corre uma suite de instâncias com sementes fixas")
+    correr.add_argument("-s", "--suite", default="rapida", choices=sorted(SUITES), help="suite a correr")
+    correr.add_argument("-r", "--repeticoes", type=int, default=5, help="repetições cronometradas por instância")
+    correr.add_argument("-a", "--algoritmos", default=None, help="algoritmos separados por vírgulas (por omissão, os da suite)")
+    correr.add_argument("-o", "--saida", default=None, help="ficheiro JSON onde são guardados os resultados (nova referência)")
+    correr.add_argument("-b", "--base", default=None, help="ficheiro JSON de referência com que os resultados são comparados")
+    correr.add_argument("-l", "--limiar", type=float, default=1.2, help="razão de tempo acima da qual há regressão")
+    gerar = sub.add_parser("gerar", help="escreve instâncias aleatórias (JSONL, como o modo em lote)")
+    gerar.add_argument("saida", help="ficheiro JSONL de instâncias")
+    gerar.add_argument("-n", "--numero", type=int, default=10, help="número de instâncias")
+    gerar.add_argument("-d", "--profundidade", type=int, default=20, help="profundidade (exata no 3x3)")
+    gerar.add_argument("-t", "--tamanho", type=int, default=3, help="dimensão do tabuleiro")
+    gerar.add_argument("--semente", type=int, default=0, help="semente do gerador")
+    args = parser.parse_args() # Lê os argumentos
+
+    if args.comando == "gerar": # Escreve as instâncias
+        rng = random.Random(args.semente) # Gerador com semente fixa
+        with open(args.saida, "w", encoding="utf-8") as f:
+            for i in range(args.numero):
+                inicial, final = gerar_instancia(rng, args.profundidade, args.tamanho)
+                f.write(json.dumps({"id": i, "profundidade": args.profundidade, "inicial": inicial, "final": final}) + "\n")
+        print(f"{args.numero} instâncias escritas em {args.saida}")
+    else: # Mede os algoritmos
+        algoritmos = args.algoritmos.split(",") if args.algoritmos else None # Algoritmos pedidos
+        if algoritmos and any(a not in ALGORITMOS for a in algoritmos): # Verifica os nomes
+            parser.error(f"algoritmos disponíveis: {', '.join(ALGORITMOS)}")
+        resultados = correr_suite(args.suite, args.repeticoes, algoritmos) # Corre a suite
+        for erro in resultados["erros"]: # Mostra as soluções não ótimas
+            print(f"ERRO: {erro}")
+        if args.saida: # Guarda os resultados
+            with open(args.saida, "w", encoding="utf-8") as f:
+                json.dump(resultados, f, ensure_ascii=False, indent=2)
+            print(f"Resultados guardados em {args.saida}")
+        if args.base: # Compara com a referência
+            with open(args.base, encoding="utf-8") as f:
+                base = json.load(f)
+            regressoes = comparar(base, resultados, args.limiar)
+            for regressao in regressoes:
+                print(f"REGRESSÃO: {regressao}")
+            if regressoes: # Código de saída diferente de zero para usar em scripts
+                sys.exit(1)
+            print("Sem regressões em relação à referência.")
@@ -0,0 +1,94 @@
+import argparse # Importa a biblioteca argparse
+import json # Importa a biblioteca json
+import math # Importa a biblioteca math
+import multiprocessing # Importa a biblioteca multiprocessing
+import time # Importa a biblioteca time
+
+from Projeto import EightPuzzle, EstatisticasPesquisa # Importa o motor do puzzle e os contadores da pesquisa
+
+ALGORITMOS = { # Algoritmos disponíveis no modo em lote (nome -> função que resolve um EightPuzzle, preenchendo as estatísticas)
+    "manhattan": lambda game, stats: game.auto_solve_astar(game.heuristic_manhattan, stats=stats), # A* com Manhattan
+    "hamming": lambda game, stats: game.auto_solve_astar(game.heuristic_hamming, stats=stats), # A* com Hamming
+    "conflitos": lambda game, stats: game.auto_solve_astar(game.heuristic_linear_conflict, stats=stats), # A* com conflitos lineares
+    "pdb": lambda game, stats: game.auto_solve_astar(game.heuristic_pdb, stats=stats), # A* com bases de dados de padrões
+    "bfs": lambda game, stats: game.auto_solve_bfs(stats=stats), # Pesquisa em largura
+    "bidirecional": lambda game, stats: game.auto_solve_bidirectional(stats=stats), # Pesquisa em largura bidirecional
+    "idastar": lambda game, stats: game.auto_solve_idastar(game.heuristic_manhattan, stats=stats), # IDA* com Manhattan
+    "idastar-pdb": lambda game, stats: game.auto_solve_idastar(game.heuristic_pdb, stats=stats), # IDA* com bases de dados de padrões (4x4 e maiores)
+    "tabela": lambda game, stats: game.auto_solve_table(stats=stats), # Consulta da tabela de distâncias exatas (só 3x3)
+    "bfs-numpy": lambda game, stats: game.auto_solve_bfs_numpy(stats=stats), # Pesquisa em largura vetorizada (precisa do numpy)
+    "manhattan-numpy": lambda game, stats: game.auto_solve_astar_numpy(stats=stats), # A* vetorizado com Manhattan (precisa do numpy)
+}
+
+def ler_instancias(caminho): # Lê as instâncias (inicial, final) de um ficheiro, uma por linha
+    # Formatos aceites por linha: JSON {"id": ..., "inicial": [[...]], "final": [[...]]}
+    # ou 2*N*N números separados por espaços (tabuleiro inicial seguido do final; 18 no 3x3, 32 no 4x4)
+    with open(caminho, encoding="utf-8") as f: # Abre o ficheiro de instâncias
+        for numero, linha in enumerate(f, start=1): # Lê linha a linha (não carrega o ficheiro inteiro)
+            linha = linha.strip() # Remove espaços e a mudança de linha
+            if not linha or linha.startswith("#"): # Ignora linhas vazias e comentários
+                continue
+            if linha.startswith("{"): # Linha em JSON
+                dados = json.loads(linha)
+                yield dados.get("id", numero), dados["inicial"], dados["final"]
+            else: # Linha com os números dos dois tabuleiros
+                nums = list(map(int, linha.replace(";", " ").split())) # Aceita ';' entre os dois tabuleiros
+                n = math.isqrt(len(nums) // 2) # Dimensão do tabuleiro
+                if n < 2 or 2 * n * n != len(nums): # Tem de ter os dois tabuleiros NxN completos
+                    raise ValueError(f"Linha {numero}: esperados 2*N*N números, encontrados {len(nums)}")
+                celulas = n * n # Números de cada tabuleiro
+                yield (numero, [nums[i:i + n] for i in range(0, celulas, n)],
+                       [nums[i:i + n] for i in range(celulas, 2 * celulas, n)])
+
+def limitar_memoria(memoria_mb): # Inicializador de cada processo: limita a memória disponível
+    if memoria_mb: # Só limita se for pedido
+        import resource # Disponível apenas em sistemas Unix
+        limite = memoria_mb * 1024 * 1024 # Limite em bytes
+        resource.setrlimit(resource.RLIMIT_AS, (limite, limite)) # Acima do limite as alocações dão MemoryError
+
+def resolver_instancia(tarefa): # Resolve uma instância num processo do pool
+    identificador, inicial, final, algoritmo = tarefa # Desempacota a tarefa
+    resultado = {"id": identificador, "algoritmo": algoritmo} # Resultado a devolver
+    inicio = time.perf_counter() # Regista o tempo de início
+    try:
+        game = EightPuzzle(inicial, final) # Constrói o puzzle sem interação
+        stats = EstatisticasPesquisa() # Contadores da pesquisa (expandidos, gerados, picos, ...)
+        solucao = ALGORITMOS[algoritmo](game, stats) # Resolve com o algoritmo escolhido
+        resultado["movimentos"] = solucao # Lista de movimentos (None se não houver solução)
+        resultado.update(stats.como_dict()) # Acrescenta os contadores da pesquisa
+        resultado["algoritmo"] = algoritmo # Mantém o nome usado na linha de comandos
+    except MemoryError: # Ultrapassou o limite de memória do processo
+        resultado["erro"] = "memória esgotada"
+    except ValueError as erro: # Tabuleiro inválido ou sem solução
+        resultado["erro"] = str(erro)
+    resultado["tempo_total"] = time.perf_counter() - inicio # Tempo de execução (inclui a construção do puzzle)
+    return resultado # Retorna o resultado
+
+def resolver_lote(entrada, saida, algoritmo="manhattan", processos=None, chunk=8, memoria_mb=None, tarefas_por_processo=None):
+    # Distribui as instâncias pelo pool e escreve os resultados (JSONL) à medida que terminam
+    if algoritmo not in ALGORITMOS: # Verifica o algoritmo
+        raise ValueError(f"Algoritmo desconhecido: {algoritmo} (opções: {', '.join(ALGORITMOS)})")
+    tarefas = ((i, inicial, final, algoritmo) for i, inicial, final in ler_instancias(entrada)) # Gerador de tarefas
+    total = 0 # Número de resultados escritos
+    with multiprocessing.Pool(processos, initializer=limitar_memoria, initargs=(memoria_mb,),
+                              maxtasksperchild=tarefas_por_processo) as pool, open(saida, "w", encoding="utf-8") as f:
+        for resultado in pool.imap_unordered(resolver_instancia, tarefas, chunksize=chunk): # Resultados pela ordem em que terminam
+            f.write(json.dumps(resultado, ensure_ascii=False) + "\n") # Uma linha JSON por instância
+            f.flush() # Disponibiliza o resultado imediatamente
+            total += 1 # Conta o resultado
+    return total # Retorna o número de instâncias resolvidas
+
+if __name__ == "__main__": # Executa o modo em lote
+    parser = argparse.ArgumentParser(description="Resolve instâncias do puzzle de peças deslizantes em lote, com vários processos.")
+    parser.add_argument("entrada", help="ficheiro com uma instância por linha (2*N*N números ou JSON)")
+    parser.add_argument("saida", help="ficheiro JSONL onde são escritos os resultados")
+    parser.add_argument("-a", "--algoritmo", default="manhattan", choices=sorted(ALGORITMOS), help="algoritmo a usar")
+    parser.add_argument("-p", "--processos", type=int, default=None, help="número de processos (por omissão, um por núcleo)")
+    parser.add_argument("-c", "--chunk", type=int, default=8, help="instâncias enviadas de cada vez a um processo")
+    parser.add_argument("-m", "--memoria-mb", type=int, default=None, help="limite de memória por processo, em MB")
+    parser.add_argument("--tarefas-por-processo", type=int, default=None, help="reinicia cada processo após N instâncias")
+    args = parser.parse_args() # Lê os argumentos
+    inicio = time.perf_counter() # Regista o tempo de início
+    total = resolver_lote(args.entrada, args.saida, args.algoritmo, args.processos, args.chunk, args.memoria_mb,
+                          args.tarefas_por_processo) # Resolve o lote
+    print(f"{total} instâncias resolvidas em {time.perf_counter() - inicio:.2f} segundos") # Mostra o resumo
@@ -0,0 +1,337 @@
+import importlib.util # Importa a função find_spec (verifica se o numpy está instalado)
+import os # Importa a biblioteca os
+import queue # Importa a biblioteca queue
+import sys # Importa a biblioteca sys
+import threading # Importa a biblioteca threading
+
+from Projeto import (PESOS_ARA, TAMANHO_PADRAO, EightPuzzle, EstatisticasPesquisa, PuzzleInsolavel, exportar_estatisticas,
+                     hda_em_serie) # Importa o motor do puzzle (sem interação)
+
+SETAS = {b"\x1b[A": "up", b"\x1b[B": "down", b"\x1b[C": "right", b"\x1b[D": "left"} # Sequências das setas no terminal
+SAIR = (b"\x1b", b"q", b"Q") # Teclas para sair do modo manual (ESC sozinho ou Q)
+
+class InterfaceTerminal: # Interface de terminal do puzzle: lê os tabuleiros, mostra o jogo e pede as opções
+    def __init__(self, game=None): # Construtor da classe
+        if game is None: # Sem puzzle dado, lê os tabuleiros do utilizador
+            game = self.ler_puzzle() # Lê os dois tabuleiros
+        self.game = game # Motor do puzzle
+
+    def ler_puzzle(self): # Método para ler os dois tabuleiros e construir o puzzle
+        
+        self.game_size = self.ler_tamanho() # Lê a dimensão do tabuleiro
+        print("Configuração inicial:") # Mostra a configuração inicial
+        board = self.ler_config("inicial") # Lê a configuração inicial do tabuleiro
+        print("\nTabuleiro inicial:\n") # Mostra o tabuleiro inicial
+        self.mostrar_tabuleiro_custom(board) # Mostra o tabuleiro
+        
+        print("Configuração final (objetivo):") # Mostra a configuração final
+        target_board = self.ler_config("final") # Lê a configuração final do tabuleiro
+        print("\nTabuleiro final (objetivo):\n") # Mostra o tabuleiro final
+        self.mostrar_tabuleiro_custom(target_board) # Mostra o tabuleiro final
+        
+        try:
+            return EightPuzzle(board, target_board) # Constrói o puzzle
+        except PuzzleInsolavel as erro: # Verifica se o puzzle é solucionável
+            print(erro) # Mostra a mensagem de erro, se não o for solucionável.
+            sys.exit(1) # Sai do programa com código de erro 1
+
+    def ler_tamanho(self): # Método para ler a dimensão do tabuleiro
+       
+        while True: # Enquanto a dimensão não for válida
+            resposta = input(f"Dimensão do tabuleiro (3 = 8 peças, 4 = 15 peças, ...) [{TAMANHO_PADRAO}]: ").strip() # Lê a dimensão
+            if not resposta: # Sem resposta usa a dimensão por omissão
+                return TAMANHO_PADRAO
+            if resposta.isdigit() and int(resposta) >= 2: # Tem de ser um inteiro maior ou igual a 2
+                return int(resposta)
+            print("Erro: Introduza um número inteiro maior ou igual a 2.") # Mostra a mensagem de erro
+
+    def ler_config(self, tipo): # Método para ler a configuração do tabuleiro
+       
+        n = self.game_size # Dimensão do tabuleiro
+        maximo = n * n - 1 # Maior número do tabuleiro
+        print(f"Introduza {n * n} números únicos entre 0 e {maximo} para a configuração {tipo}:") # Mostra a mensagem para introduzir os números
+        numeros_validos = set(range(0, n * n)) # Define os números válidos
+        numeros_usados = set() # Define os números usados
+        tabuleiro = [] # Define o tabuleiro
+
+        for i in range(n): # Loop para ler as linhas do tabuleiro
+            while True: # Enquanto verdade/loop verifica se os números são válidos
+                try: # Tenta ler os números
+                    linha = list(map(int, input(f"Linha {i+1}: ").split())) # Lê os números da linha
+                    if len(linha) != n: # Verifica se a linha tem n números
+                        print(f"Erro: Deve introduzir exatamente {n} números.") # Mostra a mensagem de erro se não tiver n números
+                        continue # Continua o loop se preencher os requisitos
+
+                    if not all(num in numeros_validos for num in linha): # Verifica se os números estão no intervalo
+                        print(f"Erro: Apenas números de 0 a {maximo} são permitidos.") # Mostra a mensagem de erro se houver números fora do intervalo
+                        continue # Continua o loop se preencher os requisitos
+
+                    if any(num in numeros_usados for num in linha): # Verifica se não há números repetidos
+                        print("Erro: Não pode repetir números no tabuleiro.") # Mostra a mensagem de erro se houver números repetidos
+                        continue# Continua o loop se preencher os requisitos
+
+                    tabuleiro.append(linha) # Adiciona a linha ao tabuleiro
+                    numeros_usados.update(linha) # Atualiza os números usados
+                    break # Sai do loop
+
+                except ValueError: # Trata o erro de valor inválido
+                    print("Erro: Introduza apenas números inteiros separados por espaço.") # Mostra a mensagem de erro se o valor for inválido
+
+        return tabuleiro # Retorna o tabuleiro
+
+    def mostrar_tabuleiro_custom(self, board): # Método para mostrar o tabuleiro
+       
+        print("\033[H\033[2J", end="") # Limpa a tela com uma sequência ANSI (sem lançar uma shell)
+        largura = len(str(len(board) ** 2 - 1)) # Largura de cada célula (2 algarismos a partir do 4x4)
+        for row in board: # Loop para mostrar as linhas do tabuleiro 
+            print(" ".join(str(num).rjust(largura) if num != 0 else " " * largura for num in row)) # Conversão dos números para string e se for 0, mostra um espaço
+        print("\n") # Espaço de uma linha em branco
+    
+    def mostrar_tabuleiro(self): # Método para mostrar o tabuleiro
+        
+        self.mostrar_tabuleiro_custom(self.game.board) # Mostra o tabuleiro
+
+    def desenhar_celula(self, linha, coluna): # Redesenha só uma célula do tabuleiro (posiciona o cursor com ANSI)
+        
+        largura = len(str(self.game.size ** 2 - 1)) # Largura de cada célula (igual à de mostrar_tabuleiro_custom)
+        num = self.game.board[linha][coluna] # Número da célula
+        texto = str(num).rjust(largura) if num != 0 else " " * largura # O espaço vazio é mostrado em branco
+        sys.stdout.write(f"\033[{linha + 1};{coluna * (largura + 1) + 1}H{texto}") # Escreve por cima da célula antiga
+
+    def desenhar_estado(self, mensagem=""): # Reescreve a linha do contador de movimentos, abaixo do tabuleiro
+        
+        sys.stdout.write(f"\033[{self.game.size + 2};1H\033[KMovimentos: {self.game.moves}") # Contador de movimentos
+        sys.stdout.write(f"\033[{self.game.size + 3};1H\033[J{mensagem}") # Mensagem (apaga o resto do ecrã)
+        sys.stdout.flush() # Mostra as alterações imediatamente
+
+    def ligar_teclado(self, eventos): # Envia as teclas para a fila de eventos e devolve a função que as desliga
+        
+        try:
+            import keyboard # Importa a biblioteca keyboard (só é necessária no modo manual)
+        except ImportError: # Sem a biblioteca: lê as teclas do stdin
+            keyboard = None
+        if keyboard is not None:
+            try:
+                for tecla in ("up", "down", "left", "right"): # As callbacks só põem a tecla na fila (não mexem no tabuleiro)
+                    keyboard.on_press_key(tecla, lambda _, direcao=tecla: eventos.put(direcao))
+                keyboard.on_press_key("esc", lambda _: eventos.put(None)) # None pede para sair
+                return keyboard.unhook_all # Desliga as callbacks no fim
+            except (ImportError, OSError): # Sem permissões para ler o teclado (ex.: Linux sem root)
+                keyboard.unhook_all()
+
+        try:
+            import termios # Importa a biblioteca termios (só existe em sistemas Unix)
+            import tty # Importa a biblioteca tty
+        except ImportError:
+            return None
+        if not sys.stdin.isatty(): # Sem terminal não há teclas para ler
+            return None
+        fd = sys.stdin.fileno() # Descritor do stdin
+        original = termios.tcgetattr(fd) # Configuração do terminal para repor no fim
+        tty.setcbreak(fd) # Teclas lidas uma a uma, sem eco (o Ctrl+C continua a funcionar)
+        threading.Thread(target=self.ler_stdin, args=(fd, eventos), daemon=True).start() # Thread que lê as teclas
+        return lambda: termios.tcsetattr(fd, termios.TCSADRAIN, original) # Repõe o terminal no fim
+
+    def ler_stdin(self, fd, eventos): # Lê as teclas do stdin (bloqueante) e põe as direções na fila
+        
+        while True:
+            dados = os.read(fd, 32) # Bloqueia até haver teclas (uma seta chega como 3 bytes)
+            if not dados or dados in SAIR: # Fim do stdin, ESC ou Q
+                eventos.put(None)
+                return
+            i = 0 # Várias teclas podem chegar na mesma leitura
+            while i < len(dados):
+                direcao = SETAS.get(dados[i:i + 3]) # Seta nesta posição?
+                if direcao is not None:
+                    eventos.put(direcao)
+                    i += 3
+                elif dados[i:i + 1] in SAIR[1:]: # Q no meio de outras teclas
+                    eventos.put(None)
+                    return
+                else: # Ignora as outras teclas
+                    i += 1
+
+    def modo_manual(self): # Modo manual orientado a eventos: bloqueia à espera de teclas, sem ocupar o processador
+        
+        eventos = queue.Queue() # Fila única: as jogadas são aplicadas só por esta thread, pela ordem das teclas
+        desligar = self.ligar_teclado(eventos) # Liga a fonte das teclas
+        if desligar is None:
+            print("Não é possível ler o teclado (instale a biblioteca keyboard ou use um terminal).")
+            return
+        try:
+            self.mostrar_tabuleiro() # Desenha o tabuleiro inteiro uma única vez
+            self.desenhar_estado("Use as SETAS DIRECIONAIS para mover o espaço vazio (0). Pressione ESC para sair.")
+            while not self.game.is_solved(): # Enquanto o tabuleiro não estiver resolvido
+                direction = eventos.get() # Bloqueia até chegar uma tecla
+                if direction is None: # ESC: sai do jogo
+                    break
+                antes = self.game.find_empty() # Célula do espaço vazio antes do movimento
+                if self.game.move(direction): # Só mudam duas células: redesenha essas e o contador
+                    self.desenhar_celula(*antes)
+                    self.desenhar_celula(*self.game.find_empty())
+                    self.desenhar_estado()
+        finally:
+            desligar() # Desliga as teclas (e repõe o terminal)
+        if self.game.is_solved(): # Se o tabuleiro estiver resolvido
+            self.desenhar_estado(f"🎉 Parabéns! Atingiu a configuração final em {self.game.moves} movimentos! 🎉\n")
+        else:
+            self.desenhar_estado("Jogo encerrado.\n") # Mostra a mensagem de encerramento
+
+    def move(self, direction): # Método para mover o espaço vazio e mostrar o resultado
+        
+        if self.game.move(direction): # Se o movimento foi realizado com sucesso
+            self.mostrar_tabuleiro() # Mostra o tabuleiro
+            print(f"Movimentos: {self.game.moves}") # Exibe o número de movimentos
+
+            if self.game.is_solved(): # Verifica se o tabuleiro está resolvido
+                print(f"🎉 Parabéns! Atingiu a configuração final em {self.game.moves} movimentos! 🎉") 
+
+    def auto_solve(self): # Método para resolver o puzzle automaticamente
+        
+        print("Algoritmos disponíveis:")
+        print(" 1 - A* com Manhattan")
+        print(" 2 - A* com Hamming")
+        print(" 3 - BFS")
+        print(" 4 - IDA* com Manhattan")
+        print(" 5 - BFS bidirecional")
+        print(" 6 - A* com conflitos lineares")
+        print(" 7 - A* com bases de dados de padrões")
+        print(" 8 - IDA* com bases de dados de padrões (recomendado a partir do 4x4)")
+        print(" 9 - Tabela de distâncias exatas (só 3x3)")
+        print("10 - ARA* com PDB (solução rápida que vai melhorando até acabar o tempo)")
+        print("11 - BFS vetorizado (NumPy, até 4x4)")
+        print("12 - A* vetorizado com Manhattan (NumPy, até 4x4)")
+        if hda_em_serie(): # O HDA* só compensa com vários núcleos
+            print("13 - A* paralelo com PDB (HDA*; neste computador corre como A* em série, que é mais rápido)")
+        else:
+            print(f"13 - A* paralelo com PDB (HDA*, {os.cpu_count()} processos)")
+        alg = input("Escolha o algoritmo (1 a 13): ").strip() # Escolha do algoritmo
+        if alg == "1": # Se escolher o algoritmo 1
+            solution = self.game.auto_solve_astar(self.game.heuristic_manhattan) # Resolve o puzzle com a heurística de Manhattan
+        elif alg == "2":    # Se escolher o algoritmo 2
+            solution = self.game.auto_solve_astar(self.game.heuristic_hamming) # Resolve o puzzle com a heurística de Hamming
+        elif alg == "3":    # Se escolher o algoritmo 3
+            solution = self.game.auto_solve_bfs()    # Resolve o puzzle com o BFS
+        elif alg == "4":    # Se escolher o algoritmo 4
+            solution = self.game.auto_solve_idastar(self.game.heuristic_manhattan) # Resolve o puzzle com IDA* e Manhattan (memória constante)
+        elif alg == "5":    # Se escolher o algoritmo 5
+            solution = self.game.auto_solve_bidirectional() # Resolve o puzzle com BFS a partir dos dois extremos
+        elif alg == "6":    # Se escolher o algoritmo 6
+            solution = self.game.auto_solve_astar(self.game.heuristic_linear_conflict) # Resolve o puzzle com Manhattan + conflitos lineares
+        elif alg == "7":    # Se escolher o algoritmo 7
+            solution = self.game.auto_solve_astar(self.game.heuristic_pdb) # Resolve o puzzle com as bases de dados de padrões
+        elif alg == "8":    # Se escolher o algoritmo 8
+            solution = self.game.auto_solve_idastar(self.game.heuristic_pdb) # Pesquisa de memória limitada com a heurística mais informada
+        elif alg == "9" and self.game.size == 3:    # Se escolher o algoritmo 9 (só no 3x3)
+            solution = self.game.auto_solve_table() # Resolve o puzzle por consulta da tabela (sem pesquisa)
+        elif alg == "10":    # Se escolher o algoritmo 10
+            resposta = input("Tempo limite em segundos (Enter para sem limite): ").strip() # Orçamento de tempo
+            try:
+                tempo_limite = float(resposta) if resposta else None
+            except ValueError:
+                print("Tempo inválido!")
+                return None
+            solution = self.game.auto_solve_arastar(self.game.heuristic_pdb, tempo_limite=tempo_limite) # Pesos decrescentes até ao prazo
+            for tempo, movimentos, peso, limite in self.game.anytime_solutions: # Mostra a evolução da solução
+                print(f"  {tempo:8.4f} s: {movimentos} movimentos (peso {peso}, no máximo {limite:.3f} x ótimo)")
+        elif alg in ("11", "12"):    # Se escolher os algoritmos vetorizados
+            try:
+                if alg == "11":
+                    solution = self.game.auto_solve_bfs_numpy() # Expande uma camada inteira de cada vez
+                else:
+                    solution = self.game.auto_solve_astar_numpy() # Expande todos os estados com o menor f de uma vez
+            except ImportError: # O numpy é opcional
+                print("Estes algoritmos precisam da biblioteca numpy (pip install numpy).")
+                return None
+        elif alg == "13":    # Se escolher o algoritmo 13
+            solution = self.game.auto_solve_hda(self.game.heuristic_pdb) # Um processo por núcleo, estados distribuídos por hash
+            if self.game.parallel_load: # Equilíbrio da carga (vazio se resolveu em série)
+                print(f"Nós expandidos por processo: {self.game.parallel_load}")
+        else:  # Se escolher um algoritmo inválido
+            print("Opção inválida!")
+            return None
+
+        if solution is None: # Se não encontrar solução
+            print("Não foi encontrada solução!") # Mostra a mensagem de erro
+            return None
+
+        print(f"Solução encontrada com {len(solution)} movimentos:") # Mostra a solução encontrada
+        print(" -> ".join(solution)) # Mostra os movimentos
+        return solution
+
+    def run_all_algorithms_minimal(self):   # Método para executar todos os algoritmos minimamente
+        
+        heap = {"fila": "heap"} # A* com a fila heapq, para comparar com a fila por baldes
+        algoritmos = [("A* com Manhattan", self.game.auto_solve_astar, (self.game.heuristic_manhattan,), {}),
+                      ("A* com Manhattan (heap)", self.game.auto_solve_astar, (self.game.heuristic_manhattan,), heap),
+                      ("A* com Hamming", self.game.auto_solve_astar, (self.game.heuristic_hamming,), {}),
+                      ("BFS", self.game.auto_solve_bfs, (), {}),
+                      ("IDA* com Manhattan", self.game.auto_solve_idastar, (self.game.heuristic_manhattan,), {}),
+                      ("BFS bidirecional", self.game.auto_solve_bidirectional, (), {}),
+                      ("A* com conflitos lineares", self.game.auto_solve_astar, (self.game.heuristic_linear_conflict,), {}),
+                      ("A* com PDB", self.game.auto_solve_astar, (self.game.heuristic_pdb,), {}),
+                      ("A* com PDB (heap)", self.game.auto_solve_astar, (self.game.heuristic_pdb,), heap)] # Algoritmos a comparar
+        for peso in sorted(PESOS_ARA[:-1]): # A* com peso (uma só iteração do ARA*): latência vs comprimento da solução
+            algoritmos.append((f"A* com peso {peso} (PDB)", self.game.auto_solve_arastar, (self.game.heuristic_pdb,), {"pesos": (peso,)}))
+        algoritmos.append(("ARA* com PDB (0,1 s)", self.game.auto_solve_arastar, (self.game.heuristic_pdb,), {"tempo_limite": 0.1}))
+        if not hda_em_serie(): # Em série seria igual ao "A* com PDB"
+            algoritmos.append((f"HDA* com PDB ({os.cpu_count()} processos)", self.game.auto_solve_hda, (self.game.heuristic_pdb,), {}))
+        if importlib.util.find_spec("numpy") is not None and self.game.size <= 4: # Versões vetorizadas, se o numpy estiver instalado
+            algoritmos += [("BFS vetorizado (NumPy)", self.game.auto_solve_bfs_numpy, (), {}),
+                           ("A* vetorizado (NumPy)", self.game.auto_solve_astar_numpy, (), {})]
+        medir_memoria = input("Medir o pico de memória (torna a pesquisa mais lenta)? (s/N): ").strip().upper() == "S"
+        self.game.pdb_tables() # Carrega (ou constrói) as bases de dados antes de medir o tempo
+        resultados = [] # Estatísticas de cada algoritmo
+
+        for nome, solver, args, opcoes in algoritmos: # Loop para executar os algoritmos
+            print(f"\nExecutando {nome}:") # Mostra o algoritmo em execução
+            stats = EstatisticasPesquisa(medir_memoria) # Contadores desta execução
+            solucao = solver(*args, stats=stats, **opcoes) # Resolve o puzzle com o algoritmo
+            stats.algoritmo = nome # Nome mostrado na tabela
+            resultados.append(stats) # Guarda as estatísticas
+            if solucao is not None: # Se encontrar solução
+                print(f"Solução: {' -> '.join(solucao)}") # Mostra a solução
+                print(f"Número de movimentos: {len(solucao)}") # Mostra o número de movimentos
+            else:
+                print("Nenhuma solução encontrada.") # Mostra a mensagem de erro
+
+        print("\nComparação dos algoritmos:") # Tabela com os contadores de cada algoritmo
+        print(f"{'Algoritmo':<27}{'Movimentos':>11}{'Expandidos':>12}{'Gerados':>10}{'Pico abertos':>14}"
+              f"{'Pico fechados':>15}{'Repetidos':>11}{'Tempo (s)':>11}{'Memória (KB)':>14}{'Limite':>8}")
+        for stats in resultados: # Uma linha por algoritmo
+            movimentos = stats.comprimento if stats.comprimento is not None else "-" # Número de movimentos da solução
+            memoria = f"{stats.memoria_pico / 1024:.0f}" if stats.memoria_pico is not None else "-" # Pico de memória em KB
+            limite = f"{stats.limite_subotimo:.2f}" if stats.limite_subotimo is not None else "1" # Garantia (1 = ótima)
+            print(f"{stats.algoritmo:<27}{movimentos:>11}{stats.expandidos:>12}{stats.gerados:>10}{stats.pico_abertos:>14}"
+                  f"{stats.pico_fechados:>15}{stats.repetidos:>11}{stats.tempo:>11.4f}{memoria:>14}{limite:>8}")
+
+        caminho = input("\nGuardar as métricas num ficheiro .json ou .csv (Enter para não guardar): ").strip()
+        if caminho: # Exporta as estatísticas
+            exportar_estatisticas(resultados, caminho)
+            print(f"Métricas guardadas em {caminho}")
+        print()
+
+    def play(self): # Método para jogar o puzzle
+        
+        mode = input("Escolha o modo (M para manual, A para automático, C para comparação): ").strip().upper() # Escolha do modo
+        if mode == "M": 
+            self.modo_manual() # Jogo com as setas, orientado a eventos
+        elif mode == "A": # Se escolher o modo automático
+            solution = self.auto_solve() # Resolve o puzzle automaticamente 
+            if solution is None:
+                return
+            input("Pressione Enter para começar a solução automática...")
+            for move in solution:
+                self.move(move)
+                input("Pressione Enter para o próximo movimento...")
+            print("Resolução automática completa.")
+        elif mode == "C":
+            self.run_all_algorithms_minimal()
+        else:
+            print("Modo inválido.")
+
+def main(): # Executa o jogo no terminal
+    InterfaceTerminal().play() # Lê os tabuleiros e inicia o jogo
+
+if __name__ == "__main__": # Executa o jogo
+    main()
@@ -1,5 +1,15 @@
+import atexit
+import csv
+import json
+import math
+import multiprocessing
+from array import array
+import os
 import random
+import sys
 import time
+from collections import OrderedDict
+from functools import lru_cache
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -9,37 +19,21 @@ import numpy as np
 
 def mostrar_tabuleiro(tabuleiro):
     """Mostra o estado atual do tabuleiro"""
-    print("-------------")  # Imprime a linha superior do tabuleiro
+    separador = "-" * (4 * len(tabuleiro[0]) + 1)  # Linha horizontal à largura do tabuleiro
+    print(separador)  # Imprime a linha superior do tabuleiro
     for linha in tabuleiro:  # Itera por cada linha do tabuleiro
         print("| " + " | ".join(linha) + " |")  # Imprime cada célula da linha com separadores
-        print("-------------")  # Imprime linha divisória após cada linha do tabuleiro
+        print(separador)  # Imprime linha divisória após cada linha do tabuleiro
 
 
-#verificar_vencedor(tabuleiro, jogador)
-#Verifica se o jogador passado como argumento venceu o jogo, analisando linhas, colunas e diagonais do tabuleiro.
+#verificar_vencedor(tabuleiro, jogador, k=None)
+#Verifica se o jogador passado como argumento venceu o jogo, procurando k peças seguidas numa linha, coluna ou diagonal do tabuleiro
+#(jogo m,n,k). Por omissão k é o lado menor do tabuleiro, o que no 3x3 é o jogo do galo clássico.
 
-def verificar_vencedor(tabuleiro, jogador):
+def verificar_vencedor(tabuleiro, jogador, k=None):
     """Verifica se o jogador especificado venceu"""
-    # Verificar linhas - examina se alguma linha está preenchida com o mesmo símbolo
-    for linha in tabuleiro:
-        if all(celula == jogador for celula in linha):  # Verifica se todas as células da linha têm o símbolo do jogador
-            return True
-    
-    # Verificar colunas - examina se alguma coluna está preenchida com o mesmo símbolo
-    for col in range(3):  # Itera pelas 3 colunas do tabuleiro
-        if all(tabuleiro[linha][col] == jogador for linha in range(3)):  # Verifica se todas as células da coluna têm o símbolo do jogador
-            return True
-    
-    # Verificar diagonal principal (de cima-esquerda a baixo-direita)
-    if all(tabuleiro[i][i] == jogador for i in range(3)):  # Verifica as células [0][0], [1][1], [2][2]
-        return True
-    
-    # Verificar diagonal secundária (de cima-direita a baixo-esquerda)
-    if all(tabuleiro[i][2-i] == jogador for i in range(3)):  # Verifica as células [0][2], [1][1], [2][0]
-        return True
-    
-    # Se nenhuma condição de vitória foi satisfeita
-    return False
+    vencedoras, _ = mascaras_bitboard(len(tabuleiro), len(tabuleiro[0]), k)  # Todas as sequências vencedoras deste tabuleiro
+    return venceu_bitboard(para_bitboard(tabuleiro, jogador)[0], vencedoras)  # Alguma está completa com peças do jogador?
 
 
 #tabuleiro_cheio(tabuleiro)
@@ -56,228 +50,1262 @@ def tabuleiro_cheio(tabuleiro):
 def obter_jogadas_possiveis(tabuleiro):
     """Retorna uma lista de jogadas disponíveis como tuplos (linha, coluna)"""
     jogadas = []  # Inicializa uma lista vazia para armazenar as jogadas possíveis
-    for i in range(3):  # Itera pelas linhas do tabuleiro
-        for j in range(3):  # Itera pelas colunas do tabuleiro
+    for i in range(len(tabuleiro)):  # Itera pelas linhas do tabuleiro
+        for j in range(len(tabuleiro[i])):  # Itera pelas colunas do tabuleiro
             if tabuleiro[i][j] == " ":  # Verifica se a célula está vazia
                 jogadas.append((i, j))  # Adiciona a coordenada da célula vazia à lista de jogadas
     return jogadas  # Retorna a lista completa de jogadas possíveis
 
 
-#minimax(tabuleiro, profundidade, e_maximizador, jogador, oponente)
-#Implementa o algoritmo Minimax, que avalia recursivamente todas as possibilidades de jogadas para escolher a melhor jogada possível para o jogador, 
-#assumindo que ambos jogam de forma ótima.
-
-def minimax(tabuleiro, profundidade, e_maximizador, jogador, oponente):
-    """Implementa o algoritmo Minimax para escolher a melhor jogada"""
-    # Casos base: verificar estados terminais
-    if verificar_vencedor(tabuleiro, jogador):
-        return 10 - profundidade  # Vitória, pontuação maior para vitórias mais rápidas
-    if verificar_vencedor(tabuleiro, oponente):
-        return profundidade - 10  # Derrota, pontuação maior para derrotas mais lentas
+#mascaras_bitboard(linhas=3, colunas=3, k=None)
+#Representação compacta do tabuleiro: cada jogador é um inteiro com um bit por casa (a casa (i, j) é o bit i*colunas+j).
+#Devolve as máscaras das sequências vencedoras (k casas seguidas na horizontal, vertical ou diagonal; k é por omissão o lado
+#menor do tabuleiro) e a máscara do tabuleiro completo.
+
+@lru_cache(maxsize=None)
+def mascaras_bitboard(linhas=3, colunas=3, k=None):
+    """Máscaras das sequências vencedoras e máscara com todas as casas do tabuleiro"""
+    if k is None:  # Por omissão: uma linha inteira do lado menor
+        k = min(linhas, colunas)
+    vencedoras = []  # Uma máscara por sequência vencedora
+    for i in range(linhas):
+        for j in range(colunas):
+            for di, dj in ((0, 1), (1, 0), (1, 1), (1, -1)):  # Horizontal, vertical e as duas diagonais
+                fim_i, fim_j = i + di * (k - 1), j + dj * (k - 1)  # Última casa da sequência
+                if 0 <= fim_i < linhas and 0 <= fim_j < colunas:  # A sequência cabe no tabuleiro
+                    vencedoras.append(sum(1 << ((i + di * passo) * colunas + j + dj * passo) for passo in range(k)))
+    return tuple(vencedoras), (1 << (linhas * colunas)) - 1
+
+
+#pontuacao_vitoria(linhas=3, colunas=3)
+#Pontuação de uma vitória imediata (a vitória à profundidade p vale pontuacao_vitoria - p). Tem de ser maior que o número de casas
+#para que qualquer vitória valha mais que um empate; no 3x3 mantém-se 10.
+
+def pontuacao_vitoria(linhas=3, colunas=3):
+    """Pontuação de uma vitória à profundidade 0"""
+    return max(10, linhas * colunas + 1)
+
+
+#para_bitboard(tabuleiro, jogador) / de_bitboard(bits_jogador, bits_oponente, jogador, oponente, linhas=3, colunas=3)
+#Convertem entre o tabuleiro em lista de listas (usado para mostrar o jogo) e o par de máscaras (jogador, oponente).
+
+def para_bitboard(tabuleiro, jogador):
+    """Converte o tabuleiro num par de máscaras (casas do jogador, casas do oponente)"""
+    bits_jogador = bits_oponente = 0
+    colunas = len(tabuleiro[0])  # Largura do tabuleiro
+    for i, linha in enumerate(tabuleiro):
+        for j, celula in enumerate(linha):
+            if celula == jogador:  # Casa do jogador
+                bits_jogador |= 1 << (i * colunas + j)
+            elif celula != " ":  # Casa do oponente
+                bits_oponente |= 1 << (i * colunas + j)
+    return bits_jogador, bits_oponente
+
+
+def de_bitboard(bits_jogador, bits_oponente, jogador, oponente, linhas=3, colunas=3):
+    """Converte um par de máscaras no tabuleiro em lista de listas"""
+    tabuleiro = [[" " for _ in range(colunas)] for _ in range(linhas)]  # Tabuleiro vazio
+    for i in range(linhas):
+        for j in range(colunas):
+            bit = 1 << (i * colunas + j)  # Bit da casa (i, j)
+            if bits_jogador & bit:
+                tabuleiro[i][j] = jogador
+            elif bits_oponente & bit:
+                tabuleiro[i][j] = oponente
+    return tabuleiro
+
+
+#venceu_bitboard(bits, vencedoras) / jogadas_bitboard(ocupadas, completo)
+#Vitória: alguma linha vencedora totalmente contida na máscara do jogador. Jogadas: os bits livres, do menor para o maior
+#(a mesma ordem de obter_jogadas_possiveis).
+
+def venceu_bitboard(bits, vencedoras):
+    """Verifica se a máscara do jogador contém uma linha vencedora"""
+    for mascara in vencedoras:
+        if bits & mascara == mascara:  # Todas as casas da linha são do jogador
+            return True
+    return False
+
+
+def jogadas_bitboard(ocupadas, completo):
+    """Devolve a lista de bits das casas livres, por ordem crescente"""
+    livres = completo & ~ocupadas  # Casas ainda por ocupar
+    jogadas = []
+    while livres:
+        bit = livres & -livres  # Bit livre mais baixo
+        jogadas.append(bit)
+        livres ^= bit  # Retira-o das casas livres
+    return jogadas
+
+
+#avaliar_linhas_abertas(bits_jogador, bits_oponente, linhas=3, colunas=3, k=None)
+#Avaliação heurística de uma posição não terminal, usada quando a pesquisa atinge a profundidade máxima. Cada sequência vencedora
+#ainda livre de peças do oponente vale o quadrado das peças que o jogador lá tem (e o contrário para o oponente).
+#O resultado fica entre -1 e 1, ou seja, abaixo de qualquer vitória e acima de qualquer derrota. Qualquer função com a mesma
+#assinatura pode ser usada no seu lugar (parâmetro avaliar das pesquisas).
+
+def avaliar_linhas_abertas(bits_jogador, bits_oponente, linhas=3, colunas=3, k=None):
+    """Avaliação heurística pelas sequências vencedoras ainda abertas, entre -1 e 1"""
+    vencedoras, _ = mascaras_bitboard(linhas, colunas, k)
+    if k is None:
+        k = min(linhas, colunas)
+    total = 0
+    for mascara in vencedoras:
+        if not bits_oponente & mascara:  # Sequência ainda possível para o jogador
+            total += bin(bits_jogador & mascara).count("1") ** 2
+        elif not bits_jogador & mascara:  # Sequência ainda possível para o oponente
+            total -= bin(bits_oponente & mascara).count("1") ** 2
+    return total / (len(vencedoras) * k * k)  # Normaliza para ]-1, 1[
+
+
+#simetrias(linhas, colunas)
+#Devolve as permutações das casas do tabuleiro que correspondem às rotações e reflexões do tabuleiro
+#(8 num tabuleiro quadrado, 4 num tabuleiro retangular). Posições equivalentes têm o mesmo valor.
+
+@lru_cache(maxsize=None)
+def simetrias(linhas, colunas):
+    """Permutações das casas (índice linha*colunas+coluna) para cada simetria do tabuleiro"""
+    transformacoes = [lambda i, j: (i, j), lambda i, j: (i, colunas - 1 - j),  # Identidade e reflexão horizontal
+                      lambda i, j: (linhas - 1 - i, j), lambda i, j: (linhas - 1 - i, colunas - 1 - j)]  # Reflexão vertical e rotação de 180º
+    if linhas == colunas:  # Só os tabuleiros quadrados têm as rotações de 90º e as reflexões nas diagonais
+        transformacoes += [lambda i, j: (j, i), lambda i, j: (j, colunas - 1 - i),
+                           lambda i, j: (linhas - 1 - j, i), lambda i, j: (linhas - 1 - j, colunas - 1 - i)]
+    permutacoes = set()  # Conjunto para ignorar simetrias repetidas
+    for transformar in transformacoes:
+        permutacao = [0] * (linhas * colunas)  # Casa de origem de cada casa do tabuleiro transformado
+        for i in range(linhas):
+            for j in range(colunas):
+                ti, tj = transformar(i, j)  # Casa transformada
+                permutacao[ti * colunas + tj] = i * colunas + j
+        permutacoes.add(tuple(permutacao))
+    return tuple(sorted(permutacoes))  # Tuplo imutável (partilhado entre chamadas)
+
+
+#simetrias_bitboard(linhas, colunas) / permutar_bits(bits, blocos)
+#Cada simetria aplicada a uma máscara em blocos de 8 casas: para cada bloco, uma tabela de 256 entradas dá logo os bits de destino.
+
+@lru_cache(maxsize=None)
+def simetrias_bitboard(linhas, colunas):
+    """Tabelas por blocos de 8 bits de cada simetria do tabuleiro"""
+    casas = linhas * colunas
+    resultado = []
+    for permutacao in simetrias(linhas, colunas):
+        destino = [0] * casas  # Casa para onde vai cada casa de origem
+        for nova, origem in enumerate(permutacao):
+            destino[origem] = nova
+        blocos = []
+        for inicio in range(0, casas, 8):  # Um bloco por cada 8 casas de origem
+            tabela = [0] * 256
+            for valor in range(1, 256):
+                bit = valor & -valor  # Bit mais baixo do valor
+                casa = inicio + bit.bit_length() - 1
+                tabela[valor] = tabela[valor ^ bit] | (1 << destino[casa] if casa < casas else 0)
+            blocos.append(tuple(tabela))
+        resultado.append(tuple(blocos))
+    return tuple(resultado)
+
+
+def permutar_bits(bits, blocos):
+    """Aplica uma simetria (tabelas de simetrias_bitboard) a uma máscara"""
+    resultado = 0
+    for tabela in blocos:
+        resultado |= tabela[bits & 255]
+        bits >>= 8  # Bloco seguinte
+    return resultado
+
+
+#TabelaTransposicao(capacidade)
+#Guarda o valor das posições já avaliadas pelo Minimax e pelo Alpha-Beta. A chave é a forma canónica do tabuleiro
+#(a menor das suas simetrias), pelo que posições iguais a menos de rotações/reflexões partilham a entrada. Cada entrada
+#indica se o valor é exato ou apenas um limite inferior/superior (cortes alpha-beta) e o valor é guardado relativo à
+#posição (independente da profundidade a que foi encontrada). Quando fica cheia, remove a entrada usada há mais tempo.
+
+class TabelaTransposicao:
+    """Tabela de transposição com chaves canónicas por simetria e substituição LRU"""
+
+    EXATO, INFERIOR, SUPERIOR = 0, 1, 2  # Tipos de entrada: valor exato, limite inferior (corte beta) e superior (corte alpha)
+
+    def __init__(self, capacidade=200000):
+        self.capacidade = capacidade  # Número máximo de entradas
+        self.entradas = OrderedDict()  # chave -> (valor relativo, tipo, altura), pela ordem de utilização
+        self.consultas = 0  # Número de consultas
+        self.acertos = 0  # Consultas que encontraram a posição
+        self.despejos = 0  # Entradas removidas por falta de espaço
+
+    def chave(self, tabuleiro, jogador, e_maximizador, k=None):
+        """Chave canónica: a menor das simetrias do tabuleiro, vista do lado do jogador, e quem joga"""
+        bits_jogador, bits_oponente = para_bitboard(tabuleiro, jogador)
+        return self.chave_bitboard(bits_jogador, bits_oponente, len(tabuleiro), len(tabuleiro[0]), e_maximizador, k)
+
+    def chave_bitboard(self, bits_jogador, bits_oponente, linhas, colunas, e_maximizador, k=None):
+        """Chave canónica de um tabuleiro em bitboard (a mesma que chave() dá para o tabuleiro equivalente)"""
+        canonica = None
+        for blocos in simetrias_bitboard(linhas, colunas):  # Aplica cada simetria, 8 casas de cada vez
+            transformada = (permutar_bits(bits_jogador, blocos), permutar_bits(bits_oponente, blocos))
+            if canonica is None or transformada < canonica:
+                canonica = transformada
+        return canonica, e_maximizador, linhas, colunas, k or min(linhas, colunas)  # O jogo (m,n,k) também faz parte da chave
+
+    def obter(self, chave, profundidade, altura=None):
+        """Devolve (valor, tipo) da posição à profundidade dada, ou None se não estiver na tabela.
+        altura é o número de jogadas que ainda falta pesquisar (None: até ao fim do jogo); uma entrada
+        pesquisada com menos altura do que a pedida não serve."""
+        self.consultas += 1  # Conta a consulta
+        entrada = self.entradas.get(chave)
+        if entrada is None:
+            return None
+        valor, tipo, altura_entrada = entrada
+        if altura_entrada is not None and (altura is None or altura_entrada < altura):  # Pesquisa menos profunda
+            return None
+        self.acertos += 1  # Conta o acerto
+        self.entradas.move_to_end(chave)  # Usada agora: é a última a ser removida
+        # Os valores de vitória/derrota dependem da profundidade (vitória - profundidade): repõe a profundidade atual.
+        # As avaliações heurísticas (entre -1 e 1) não dependem.
+        if valor >= 1:
+            valor -= profundidade
+        elif valor <= -1:
+            valor += profundidade
+        return valor, tipo
+
+    def guardar(self, chave, profundidade, valor, tipo, altura=None):
+        """Guarda o valor de uma posição avaliada à profundidade dada, pesquisada até altura jogadas (None: até ao fim)"""
+        if valor >= 1:  # Vitória: guarda a distância a partir desta posição (não a partir da raiz)
+            valor += profundidade
+        elif valor <= -1:  # Derrota: idem
+            valor -= profundidade
+        self.entradas[chave] = (valor, tipo, altura)
+        self.entradas.move_to_end(chave)
+        if len(self.entradas) > self.capacidade:  # Tabela cheia: remove a entrada usada há mais tempo
+            self.entradas.popitem(last=False)
+            self.despejos += 1
+
+    def taxa_acertos(self):
+        """Percentagem de consultas que encontraram a posição na tabela"""
+        return 100 * self.acertos / self.consultas if self.consultas else 0.0
+
+    def limpar(self):
+        """Remove todas as entradas e repõe os contadores"""
+        self.entradas.clear()
+        self.consultas = self.acertos = self.despejos = 0
+
+
+TABELA_TRANSPOSICAO = TabelaTransposicao()  # Tabela partilhada pelas jogadas do computador
+
+
+#EstatisticasPesquisa()
+#Estatísticas recolhidas pela própria pesquisa (sem a repetir): nós visitados, folhas (posições terminais ou avaliadas pela
+#heurística), cortes alpha-beta por profundidade, profundidade máxima atingida, acertos na tabela de transposição e tempo
+#(perf_counter, entre iniciar() e terminar()). As funções de pesquisa recebem-na no parâmetro estatisticas; com None (omissão)
+#não recolhem nada.
+
+class EstatisticasPesquisa:
+    """Contadores de uma pesquisa Minimax/Alpha-Beta"""
+
+    def __init__(self):
+        self.nos = 0  # Nós visitados
+        self.folhas = 0  # Posições terminais ou avaliadas pela heurística
+        self.cortes = {}  # profundidade -> número de cortes alpha-beta
+        self.profundidade_atingida = 0  # Maior profundidade visitada
+        self.acertos_tabela = 0  # Posições resolvidas (ou limitadas) pela tabela de transposição
+        self.tempo = 0.0  # Segundos de pesquisa
+        self._inicio = None
+
+    def iniciar(self):
+        """Começa a contar o tempo"""
+        self._inicio = time.perf_counter()
+
+    def terminar(self):
+        """Acumula o tempo desde iniciar()"""
+        if self._inicio is not None:
+            self.tempo += time.perf_counter() - self._inicio
+            self._inicio = None
+
+    def visitar(self, profundidade):
+        """Conta um nó visitado à profundidade dada"""
+        self.nos += 1
+        if profundidade > self.profundidade_atingida:
+            self.profundidade_atingida = profundidade
+
+    def cortar(self, profundidade):
+        """Conta um corte alpha-beta à profundidade dada"""
+        self.cortes[profundidade] = self.cortes.get(profundidade, 0) + 1
+
+    def total_cortes(self):
+        """Número total de cortes"""
+        return sum(self.cortes.values())
+
+    def juntar(self, outra):
+        """Soma as estatísticas de outra pesquisa (por exemplo, de outro processo)"""
+        self.nos += outra.nos
+        self.folhas += outra.folhas
+        for profundidade, cortes in outra.cortes.items():
+            self.cortes[profundidade] = self.cortes.get(profundidade, 0) + cortes
+        self.profundidade_atingida = max(self.profundidade_atingida, outra.profundidade_atingida)
+        self.acertos_tabela += outra.acertos_tabela
+        self.tempo += outra.tempo
+
+    def __str__(self):
+        return (f"{self.nos} nós, {self.folhas} folhas, {self.total_cortes()} cortes, profundidade {self.profundidade_atingida}, "
+                f"{self.acertos_tabela} acertos na tabela, {self.tempo:.6f}s")
+
+
+#pontuacao_terminal(tabuleiro, profundidade, jogador, oponente, k=None, profundidade_maxima=None, avaliar=avaliar_linhas_abertas)
+#pontuacao_terminal_bitboard(bits_jogador, bits_oponente, profundidade, linhas=3, colunas=3, k=None, profundidade_maxima=None, avaliar=avaliar_linhas_abertas)
+#Casos base das pesquisas: devolvem a pontuação de uma posição terminal (vitória, derrota ou empate) ou na profundidade máxima
+#(heurística), ou None se a posição tem de ser expandida.
+
+def pontuacao_terminal(tabuleiro, profundidade, jogador, oponente, k=None, profundidade_maxima=None, avaliar=avaliar_linhas_abertas):
+    """Pontuação de uma folha da pesquisa, ou None se a posição não é folha"""
+    linhas, colunas = len(tabuleiro), len(tabuleiro[0])  # Dimensões do tabuleiro
+    if verificar_vencedor(tabuleiro, jogador, k):
+        return pontuacao_vitoria(linhas, colunas) - profundidade  # Vitória, pontuação maior para vitórias mais rápidas
+    if verificar_vencedor(tabuleiro, oponente, k):
+        return profundidade - pontuacao_vitoria(linhas, colunas)  # Derrota, pontuação maior para derrotas mais lentas
     if tabuleiro_cheio(tabuleiro):
-        return 0  # Empate 
+        return 0  # Empate
+    if profundidade_maxima is not None and profundidade >= profundidade_maxima:  # Limite de profundidade: avaliação heurística
+        bits_jogador, bits_oponente = para_bitboard(tabuleiro, jogador)
+        return avaliar(bits_jogador, bits_oponente, linhas, colunas, k)
+    return None
+
+
+def pontuacao_terminal_bitboard(bits_jogador, bits_oponente, profundidade, linhas=3, colunas=3, k=None, profundidade_maxima=None, avaliar=avaliar_linhas_abertas):
+    """Pontuação de uma folha da pesquisa em bitboard, ou None se a posição não é folha"""
+    vencedoras, completo = mascaras_bitboard(linhas, colunas, k)  # Máscaras pré-calculadas
+    if venceu_bitboard(bits_jogador, vencedoras):
+        return pontuacao_vitoria(linhas, colunas) - profundidade  # Vitória
+    if venceu_bitboard(bits_oponente, vencedoras):
+        return profundidade - pontuacao_vitoria(linhas, colunas)  # Derrota
+    if bits_jogador | bits_oponente == completo:
+        return 0  # Empate
+    if profundidade_maxima is not None and profundidade >= profundidade_maxima:  # Limite de profundidade: avaliação heurística
+        return avaliar(bits_jogador, bits_oponente, linhas, colunas, k)
+    return None
+
+
+#minimax(tabuleiro, profundidade, e_maximizador, jogador, oponente, tabela=None, k=None, profundidade_maxima=None, avaliar=avaliar_linhas_abertas,
+#        estatisticas=None)
+#Implementa o algoritmo Minimax, que avalia recursivamente todas as possibilidades de jogadas para escolher a melhor jogada possível para o jogador, 
+#assumindo que ambos jogam de forma ótima. Com profundidade_maxima, as posições a essa profundidade são avaliadas pela heurística avaliar.
+
+def minimax(tabuleiro, profundidade, e_maximizador, jogador, oponente, tabela=None, k=None, profundidade_maxima=None, avaliar=avaliar_linhas_abertas,
+            estatisticas=None):
+    """Implementa o algoritmo Minimax para escolher a melhor jogada (com tabela de transposição opcional)"""
+    if estatisticas is not None:  # Conta o nó
+        estatisticas.visitar(profundidade)
+    # Casos base: estados terminais ou limite de profundidade
+    pontuacao = pontuacao_terminal(tabuleiro, profundidade, jogador, oponente, k, profundidade_maxima, avaliar)
+    if pontuacao is not None:
+        if estatisticas is not None:
+            estatisticas.folhas += 1
+        return pontuacao
+    altura = None if profundidade_maxima is None else profundidade_maxima - profundidade  # Jogadas que faltam pesquisar
+    if tabela is not None:  # Posição (ou uma simetria dela) já avaliada?
+        chave = tabela.chave(tabuleiro, jogador, e_maximizador, k)  # Chave canónica da posição
+        entrada = tabela.obter(chave, profundidade, altura)
+        if entrada is not None and entrada[1] == TabelaTransposicao.EXATO:  # Só valores exatos (a tabela pode ter limites do Alpha-Beta)
+            if estatisticas is not None:
+                estatisticas.acertos_tabela += 1
+            return entrada[0]
     # Casos recursivos - exploração de árvore de possibilidades
     if e_maximizador:  # Se é o turno maximizador (computador)
         melhor_pontuacao = float('-inf')  # Inicializa com o pior valor possível
         for jogada in obter_jogadas_possiveis(tabuleiro):  # Itera por todas as jogadas possíveis
             tabuleiro[jogada[0]][jogada[1]] = jogador  # Simula a jogada do jogador atual
-            pontuacao = minimax(tabuleiro, profundidade + 1, False, jogador, oponente)  # Avalia recursivamente o estado resultante
+            pontuacao = minimax(tabuleiro, profundidade + 1, False, jogador, oponente, tabela, k, profundidade_maxima, avaliar, estatisticas)  # Avalia recursivamente o estado resultante
             tabuleiro[jogada[0]][jogada[1]] = " "  # Desfaz a jogada para explorar outras possibilidades
             melhor_pontuacao = max(pontuacao, melhor_pontuacao)  # Atualiza a melhor pontuação encontrada
-        return melhor_pontuacao  # Retorna a melhor pontuação possível para o maximizador
     else:  # Se é o turno minimizador (oponente)
         melhor_pontuacao = float('inf')  # Inicializa com o melhor valor possível
         for jogada in obter_jogadas_possiveis(tabuleiro):  # Itera por todas as jogadas possíveis
             tabuleiro[jogada[0]][jogada[1]] = oponente  # Simula a jogada do oponente
-            pontuacao = minimax(tabuleiro, profundidade + 1, True, jogador, oponente)  # Avalia recursivamente o estado resultante
+            pontuacao = minimax(tabuleiro, profundidade + 1, True, jogador, oponente, tabela, k, profundidade_maxima, avaliar, estatisticas)  # Avalia recursivamente o estado resultante
             tabuleiro[jogada[0]][jogada[1]] = " "  # Desfaz a jogada para explorar outras possibilidades
             melhor_pontuacao = min(pontuacao, melhor_pontuacao)  # Atualiza a melhor pontuação encontrada
-        return melhor_pontuacao  # Retorna a melhor pontuação possível para o minimizador
+    if tabela is not None:  # Guarda o valor exato da posição
+        tabela.guardar(chave, profundidade, melhor_pontuacao, TabelaTransposicao.EXATO, altura)
+    return melhor_pontuacao  # Retorna a melhor pontuação possível para o jogador a jogar
     
 
-#alpha_beta(tabuleiro, profundidade, e_maximizador, jogador, oponente, alpha, beta)
+#alpha_beta(tabuleiro, profundidade, e_maximizador, jogador, oponente, alpha, beta, tabela=None, k=None, profundidade_maxima=None, avaliar=avaliar_linhas_abertas,
+#           estatisticas=None)
 #Implementa o algoritmo Minimax com poda Alpha-Beta, uma versão otimizada do Minimax que ignora ramos da árvore de decisão que não 
 #podem afetar o resultado final, tornando o processo mais eficiente.
 
-def alpha_beta(tabuleiro, profundidade, e_maximizador, jogador, oponente, alpha, beta):
-    """Implementa o algoritmo Minimax com poda Alpha-Beta para melhorar a eficiência"""
-    # Casos base: verificar estados terminais
-    if verificar_vencedor(tabuleiro, jogador):
-        return 10 - profundidade  # Vitória, pontuação maior para vitórias mais rápidas
-    if verificar_vencedor(tabuleiro, oponente):
-        return profundidade - 10  # Derrota, pontuação maior para derrotas mais lentas
-    if tabuleiro_cheio(tabuleiro):
-        return 0  # Empate
+def alpha_beta(tabuleiro, profundidade, e_maximizador, jogador, oponente, alpha, beta, tabela=None, k=None, profundidade_maxima=None, avaliar=avaliar_linhas_abertas,
+               estatisticas=None):
+    """Implementa o algoritmo Minimax com poda Alpha-Beta para melhorar a eficiência (com tabela de transposição opcional)"""
+    if estatisticas is not None:  # Conta o nó
+        estatisticas.visitar(profundidade)
+    # Casos base: estados terminais ou limite de profundidade
+    pontuacao = pontuacao_terminal(tabuleiro, profundidade, jogador, oponente, k, profundidade_maxima, avaliar)
+    if pontuacao is not None:
+        if estatisticas is not None:
+            estatisticas.folhas += 1
+        return pontuacao
+    altura = None if profundidade_maxima is None else profundidade_maxima - profundidade  # Jogadas que faltam pesquisar
+    alpha_original, beta_original = alpha, beta  # Janela inicial (decide o tipo de entrada a guardar)
+    if tabela is not None:  # Posição (ou uma simetria dela) já avaliada?
+        chave = tabela.chave(tabuleiro, jogador, e_maximizador, k)  # Chave canónica da posição
+        entrada = tabela.obter(chave, profundidade, altura)
+        if entrada is not None:
+            if estatisticas is not None:
+                estatisticas.acertos_tabela += 1
+            valor, tipo = entrada
+            if tipo == TabelaTransposicao.EXATO:  # Valor exato: não é preciso pesquisar
+                return valor
+            if tipo == TabelaTransposicao.INFERIOR:  # O valor é pelo menos este
+                alpha = max(alpha, valor)
+            else:  # O valor é no máximo este
+                beta = min(beta, valor)
+            if beta <= alpha:  # O limite guardado já provoca o corte
+                return valor
 
     # Casos recursivos com poda alpha-beta
     if e_maximizador:  # Se é o turno maximizador (computador)
         melhor_pontuacao = float('-inf')  # Inicializa com o pior valor possível
         for jogada in obter_jogadas_possiveis(tabuleiro):  # Itera por todas as jogadas possíveis
             tabuleiro[jogada[0]][jogada[1]] = jogador  # Simula a jogada do jogador atual
-            pontuacao = alpha_beta(tabuleiro, profundidade + 1, False, jogador, oponente, alpha, beta)  # Avalia recursivamente com poda
+            pontuacao = alpha_beta(tabuleiro, profundidade + 1, False, jogador, oponente, alpha, beta, tabela, k, profundidade_maxima, avaliar, estatisticas)  # Avalia recursivamente com poda
             tabuleiro[jogada[0]][jogada[1]] = " "  # Desfaz a jogada
             melhor_pontuacao = max(pontuacao, melhor_pontuacao)  # Atualiza a melhor pontuação
             alpha = max(alpha, pontuacao)  # Atualiza o valor de alpha
             if beta <= alpha:  # Condição de poda - se beta <= alpha, o minimizador nunca escolherá este ramo
+                if estatisticas is not None:
+                    estatisticas.cortar(profundidade)
                 break  # Corte beta - poda o resto da árvore
-        return melhor_pontuacao  # Retorna a melhor pontuação possível para o maximizador
     else:  # Se é o turno minimizador (oponente)
         melhor_pontuacao = float('inf')  # Inicializa com o melhor valor possível
         for jogada in obter_jogadas_possiveis(tabuleiro):  # Itera por todas as jogadas possíveis
             tabuleiro[jogada[0]][jogada[1]] = oponente  # Simula a jogada do oponente
-            pontuacao = alpha_beta(tabuleiro, profundidade + 1, True, jogador, oponente, alpha, beta)  # Avalia recursivamente com poda
+            pontuacao = alpha_beta(tabuleiro, profundidade + 1, True, jogador, oponente, alpha, beta, tabela, k, profundidade_maxima, avaliar, estatisticas)  # Avalia recursivamente com poda
             tabuleiro[jogada[0]][jogada[1]] = " "  # Desfaz a jogada
             melhor_pontuacao = min(pontuacao, melhor_pontuacao)  # Atualiza a melhor pontuação
             beta = min(beta, pontuacao)  # Atualiza o valor de beta
             if beta <= alpha:  # Condição de poda - se beta <= alpha, o maximizador nunca escolherá este ramo
+                if estatisticas is not None:
+                    estatisticas.cortar(profundidade)
                 break  # Corte alpha - poda o resto da árvore
-        return melhor_pontuacao  # Retorna a melhor pontuação possível para o minimizador
+    if tabela is not None:  # Guarda o resultado com o tipo dado pela janela original
+        if melhor_pontuacao <= alpha_original:  # Todos os ramos falharam por baixo: é um limite superior
+            tipo = TabelaTransposicao.SUPERIOR
+        elif melhor_pontuacao >= beta_original:  # Houve corte: é um limite inferior
+            tipo = TabelaTransposicao.INFERIOR
+        else:  # Dentro da janela: valor exato
+            tipo = TabelaTransposicao.EXATO
+        tabela.guardar(chave, profundidade, melhor_pontuacao, tipo, altura)
+    return melhor_pontuacao  # Retorna a melhor pontuação possível para o jogador a jogar
+
+
+#minimax_bitboard(bits_jogador, bits_oponente, profundidade, e_maximizador, linhas=3, colunas=3, tabela=None, k=None, profundidade_maxima=None,
+#                 avaliar=avaliar_linhas_abertas, estatisticas=None)
+#alpha_beta_bitboard(bits_jogador, bits_oponente, profundidade, e_maximizador, alpha, beta, linhas=3, colunas=3, tabela=None, k=None,
+#                    profundidade_maxima=None, avaliar=avaliar_linhas_abertas, estatisticas=None)
+#As mesmas pesquisas sobre o tabuleiro em bitboard: jogar e desfazer é um OR/XOR, a vitória é um AND por sequência vencedora
+#e as jogadas saem da máscara das casas livres. Dão as mesmas pontuações (e exploram as jogadas pela mesma ordem) que minimax e alpha_beta.
+
+def minimax_bitboard(bits_jogador, bits_oponente, profundidade, e_maximizador, linhas=3, colunas=3, tabela=None, k=None, profundidade_maxima=None,
+                     avaliar=avaliar_linhas_abertas, estatisticas=None):
+    """Minimax sobre o tabuleiro em bitboard"""
+    if estatisticas is not None:  # Conta o nó
+        estatisticas.visitar(profundidade)
+    pontuacao = pontuacao_terminal_bitboard(bits_jogador, bits_oponente, profundidade, linhas, colunas, k, profundidade_maxima, avaliar)
+    if pontuacao is not None:  # Folha
+        if estatisticas is not None:
+            estatisticas.folhas += 1
+        return pontuacao
+    altura = None if profundidade_maxima is None else profundidade_maxima - profundidade  # Jogadas que faltam pesquisar
+    if tabela is not None:  # Posição (ou uma simetria dela) já avaliada?
+        chave = tabela.chave_bitboard(bits_jogador, bits_oponente, linhas, colunas, e_maximizador, k)
+        entrada = tabela.obter(chave, profundidade, altura)
+        if entrada is not None and entrada[1] == TabelaTransposicao.EXATO:  # Só valores exatos (a tabela pode ter limites do Alpha-Beta)
+            if estatisticas is not None:
+                estatisticas.acertos_tabela += 1
+            return entrada[0]
+    _, completo = mascaras_bitboard(linhas, colunas, k)
+    if e_maximizador:  # Turno do jogador
+        melhor_pontuacao = float('-inf')
+        for bit in jogadas_bitboard(bits_jogador | bits_oponente, completo):
+            pontuacao = minimax_bitboard(bits_jogador | bit, bits_oponente, profundidade + 1, False, linhas, colunas, tabela, k, profundidade_maxima, avaliar, estatisticas)
+            melhor_pontuacao = max(pontuacao, melhor_pontuacao)
+    else:  # Turno do oponente
+        melhor_pontuacao = float('inf')
+        for bit in jogadas_bitboard(bits_jogador | bits_oponente, completo):
+            pontuacao = minimax_bitboard(bits_jogador, bits_oponente | bit, profundidade + 1, True, linhas, colunas, tabela, k, profundidade_maxima, avaliar, estatisticas)
+            melhor_pontuacao = min(pontuacao, melhor_pontuacao)
+    if tabela is not None:  # Guarda o valor exato da posição
+        tabela.guardar(chave, profundidade, melhor_pontuacao, TabelaTransposicao.EXATO, altura)
+    return melhor_pontuacao
+
+
+def alpha_beta_bitboard(bits_jogador, bits_oponente, profundidade, e_maximizador, alpha, beta, linhas=3, colunas=3, tabela=None, k=None,
+                        profundidade_maxima=None, avaliar=avaliar_linhas_abertas, estatisticas=None):
+    """Alpha-Beta sobre o tabuleiro em bitboard"""
+    if estatisticas is not None:  # Conta o nó
+        estatisticas.visitar(profundidade)
+    pontuacao = pontuacao_terminal_bitboard(bits_jogador, bits_oponente, profundidade, linhas, colunas, k, profundidade_maxima, avaliar)
+    if pontuacao is not None:  # Folha
+        if estatisticas is not None:
+            estatisticas.folhas += 1
+        return pontuacao
+    altura = None if profundidade_maxima is None else profundidade_maxima - profundidade  # Jogadas que faltam pesquisar
+    alpha_original, beta_original = alpha, beta  # Janela inicial (decide o tipo de entrada a guardar)
+    if tabela is not None:  # Posição (ou uma simetria dela) já avaliada?
+        chave = tabela.chave_bitboard(bits_jogador, bits_oponente, linhas, colunas, e_maximizador, k)
+        entrada = tabela.obter(chave, profundidade, altura)
+        if entrada is not None:
+            if estatisticas is not None:
+                estatisticas.acertos_tabela += 1
+            valor, tipo = entrada
+            if tipo == TabelaTransposicao.EXATO:  # Valor exato: não é preciso pesquisar
+                return valor
+            if tipo == TabelaTransposicao.INFERIOR:  # O valor é pelo menos este
+                alpha = max(alpha, valor)
+            else:  # O valor é no máximo este
+                beta = min(beta, valor)
+            if beta <= alpha:  # O limite guardado já provoca o corte
+                return valor
+    _, completo = mascaras_bitboard(linhas, colunas, k)
+    if e_maximizador:  # Turno do jogador
+        melhor_pontuacao = float('-inf')
+        for bit in jogadas_bitboard(bits_jogador | bits_oponente, completo):
+            pontuacao = alpha_beta_bitboard(bits_jogador | bit, bits_oponente, profundidade + 1, False, alpha, beta, linhas, colunas, tabela, k, profundidade_maxima, avaliar, estatisticas)
+            melhor_pontuacao = max(pontuacao, melhor_pontuacao)
+            alpha = max(alpha, pontuacao)
+            if beta <= alpha:  # Corte beta
+                if estatisticas is not None:
+                    estatisticas.cortar(profundidade)
+                break
+    else:  # Turno do oponente
+        melhor_pontuacao = float('inf')
+        for bit in jogadas_bitboard(bits_jogador | bits_oponente, completo):
+            pontuacao = alpha_beta_bitboard(bits_jogador, bits_oponente | bit, profundidade + 1, True, alpha, beta, linhas, colunas, tabela, k, profundidade_maxima, avaliar, estatisticas)
+            melhor_pontuacao = min(pontuacao, melhor_pontuacao)
+            beta = min(beta, pontuacao)
+            if beta <= alpha:  # Corte alpha
+                if estatisticas is not None:
+                    estatisticas.cortar(profundidade)
+                break
+    if tabela is not None:  # Guarda o resultado com o tipo dado pela janela original
+        if melhor_pontuacao <= alpha_original:
+            tipo = TabelaTransposicao.SUPERIOR
+        elif melhor_pontuacao >= beta_original:
+            tipo = TabelaTransposicao.INFERIOR
+        else:
+            tipo = TabelaTransposicao.EXATO
+        tabela.guardar(chave, profundidade, melhor_pontuacao, tipo, altura)
+    return melhor_pontuacao
+
+
+#valor_casas(linhas=3, colunas=3, k=None)
+#Ordem estática das jogadas: cada casa vale o número de sequências vencedoras que passam por ela (no 3x3: centro 4, cantos 3,
+#lados 2), com a distância ao centro a desempatar. É a ordem "centro primeiro, depois cantos" generalizada a qualquer tabuleiro.
+
+@lru_cache(maxsize=None)
+def valor_casas(linhas=3, colunas=3, k=None):
+    """Dicionário bit -> prioridade estática da casa"""
+    vencedoras, _ = mascaras_bitboard(linhas, colunas, k)
+    valores = {}
+    for i in range(linhas):
+        for j in range(colunas):
+            bit = 1 << (i * colunas + j)
+            distancia = abs(2 * i - (linhas - 1)) + abs(2 * j - (colunas - 1))  # Distância (x2) ao centro
+            valores[bit] = sum(1 for mascara in vencedoras if mascara & bit) * 4 * (linhas + colunas) - distancia
+    return valores
+
+
+class OrcamentoEsgotado(Exception):
+    """O tempo ou o número de nós disponível para a jogada acabou"""
+
+
+#AprofundamentoIterativo(linhas=3, colunas=3, k=None, tabela=None, avaliar=avaliar_linhas_abertas, tempo_limite=None, limite_nos=None)
+#Alpha-Beta com aprofundamento iterativo: pesquisa a 1, 2, 3, ... jogadas até chegar ao fim do jogo ou esgotar o orçamento
+#(segundos e/ou nós) e devolve sempre a melhor jogada encontrada até então. Em cada iteração as jogadas da raiz seguem a ordem
+#dada pelas pontuações da iteração anterior; nos outros nós tentam-se primeiro as jogadas "killer" (as que provocaram cortes
+#à mesma profundidade), depois as de maior histórico de cortes e por fim a ordem estática de valor_casas.
+
+class AprofundamentoIterativo:
+    """Alpha-Beta com aprofundamento iterativo, ordenação de jogadas e orçamento de tempo/nós"""
+
+    def __init__(self, linhas=3, colunas=3, k=None, tabela=None, avaliar=avaliar_linhas_abertas, tempo_limite=None, limite_nos=None):
+        self.linhas, self.colunas, self.k = linhas, colunas, k  # Jogo m,n,k
+        self.tabela = tabela  # Tabela de transposição (opcional)
+        self.avaliar = avaliar  # Heurística das folhas
+        self.tempo_limite = tempo_limite  # Segundos disponíveis (None: sem limite)
+        self.limite_nos = limite_nos  # Nós disponíveis (None: sem limite)
+        self.killers = {}  # profundidade -> [jogada, jogada] que provocaram os últimos cortes
+        self.historia = {}  # jogada -> pontuação acumulada de cortes
+        self.nos = 0  # Nós visitados
+        self.profundidade_atingida = 0  # Última iteração completa
+        self.podar = True  # False: sem cortes (Minimax com a mesma ordenação e contagem de nós)
+        self.estatisticas = None  # EstatisticasPesquisa a preencher (opcional)
+
+    def ordenar(self, jogadas, profundidade):
+        """Ordena as jogadas: killers, depois histórico de cortes, depois ordem estática"""
+        killers = self.killers.get(profundidade, ())
+        estatico = valor_casas(self.linhas, self.colunas, self.k)
+        return sorted(jogadas, key=lambda bit: (bit in killers, self.historia.get(bit, 0), estatico[bit]), reverse=True)
 
+    def registar_corte(self, bit, profundidade, altura):
+        """A jogada que provocou um corte passa a killer desta profundidade e ganha histórico"""
+        killers = self.killers.setdefault(profundidade, [])
+        if bit not in killers:
+            killers.insert(0, bit)
+            del killers[2:]  # Guarda só as duas mais recentes
+        self.historia[bit] = self.historia.get(bit, 0) + altura * altura  # Cortes perto da raiz pesam mais
+        if self.estatisticas is not None:
+            self.estatisticas.cortar(profundidade)
 
-#obter_jogada_computador(tabuleiro, computador, humano, usar_alpha_beta=False)
+    def verificar_orcamento(self):
+        """Lança OrcamentoEsgotado se o tempo ou os nós acabaram"""
+        if self.limite_nos is not None and self.nos >= self.limite_nos:
+            raise OrcamentoEsgotado
+        if self.tempo_limite is not None and self.nos % 256 == 0 and time.perf_counter() >= self.prazo:  # O relógio só é lido de 256 em 256 nós
+            raise OrcamentoEsgotado
+
+    def alpha_beta(self, bits_jogador, bits_oponente, profundidade, e_maximizador, alpha, beta, limite):
+        """Alpha-Beta com ordenação de jogadas, limitado a limite jogadas"""
+        self.nos += 1
+        self.verificar_orcamento()
+        estatisticas = self.estatisticas
+        if estatisticas is not None:
+            estatisticas.visitar(profundidade)
+        pontuacao = pontuacao_terminal_bitboard(bits_jogador, bits_oponente, profundidade, self.linhas, self.colunas, self.k, limite, self.avaliar)
+        if pontuacao is not None:  # Folha (terminal ou na fronteira desta iteração)
+            if estatisticas is not None:
+                estatisticas.folhas += 1
+            return pontuacao
+        _, completo = mascaras_bitboard(self.linhas, self.colunas, self.k)
+        altura = limite - profundidade  # Jogadas que faltam pesquisar
+        alpha_original, beta_original = alpha, beta
+        if self.tabela is not None:  # Posição já avaliada com pelo menos esta altura?
+            chave = self.tabela.chave_bitboard(bits_jogador, bits_oponente, self.linhas, self.colunas, e_maximizador, self.k)
+            entrada = self.tabela.obter(chave, profundidade, altura)
+            if entrada is not None:
+                if estatisticas is not None:
+                    estatisticas.acertos_tabela += 1
+                valor, tipo = entrada
+                if tipo == TabelaTransposicao.EXATO:
+                    return valor
+                if tipo == TabelaTransposicao.INFERIOR:
+                    alpha = max(alpha, valor)
+                else:
+                    beta = min(beta, valor)
+                if beta <= alpha:
+                    return valor
+        melhor_pontuacao = float('-inf') if e_maximizador else float('inf')
+        for bit in self.ordenar(jogadas_bitboard(bits_jogador | bits_oponente, completo), profundidade):
+            if e_maximizador:
+                pontuacao = self.alpha_beta(bits_jogador | bit, bits_oponente, profundidade + 1, False, alpha, beta, limite)
+                melhor_pontuacao = max(melhor_pontuacao, pontuacao)
+                alpha = max(alpha, pontuacao)
+            else:
+                pontuacao = self.alpha_beta(bits_jogador, bits_oponente | bit, profundidade + 1, True, alpha, beta, limite)
+                melhor_pontuacao = min(melhor_pontuacao, pontuacao)
+                beta = min(beta, pontuacao)
+            if self.podar and beta <= alpha:  # Corte
+                self.registar_corte(bit, profundidade, altura)
+                break
+        if self.tabela is not None:
+            if melhor_pontuacao <= alpha_original:
+                tipo = TabelaTransposicao.SUPERIOR
+            elif melhor_pontuacao >= beta_original:
+                tipo = TabelaTransposicao.INFERIOR
+            else:
+                tipo = TabelaTransposicao.EXATO
+            self.tabela.guardar(chave, profundidade, melhor_pontuacao, tipo, altura)
+        return melhor_pontuacao
+
+    def melhor_jogada(self, bits_computador, bits_humano, profundidade_maxima=None):
+        """Devolve (bit da melhor jogada, pontuação) para o computador, dentro do orçamento e até profundidade_maxima jogadas"""
+        self.prazo = time.perf_counter() + self.tempo_limite if self.tempo_limite is not None else None
+        _, completo = mascaras_bitboard(self.linhas, self.colunas, self.k)
+        jogadas = self.ordenar(jogadas_bitboard(bits_computador | bits_humano, completo), 0)  # Ordem estática na primeira iteração
+        melhor, melhor_pontuacao = jogadas[0], None  # Sem orçamento nenhum, joga pela ordem estática
+        livres = len(jogadas)  # Nunca é preciso ir além do fim do jogo
+        if profundidade_maxima is not None:
+            livres = min(livres, profundidade_maxima)
+        for limite in range(1, livres + 1):  # Uma iteração por profundidade
+            pontuacoes = {}  # Pontuação de cada jogada da raiz nesta iteração
+            alpha = float('-inf')
+            try:
+                for bit in jogadas:  # A melhor da iteração anterior é pesquisada primeiro
+                    pontuacoes[bit] = self.alpha_beta(bits_computador | bit, bits_humano, 1, False, alpha, float('inf'), limite)
+                    alpha = max(alpha, pontuacoes[bit])
+            except OrcamentoEsgotado:
+                # As jogadas já pesquisadas nesta iteração incluem a melhor da anterior: a melhor delas é pelo menos tão boa
+                if pontuacoes:
+                    melhor = max(pontuacoes, key=pontuacoes.get)
+                    melhor_pontuacao = pontuacoes[melhor]
+                break
+            # Jogadas ordenadas pelo resultado desta iteração (a ordenação é estável: empates mantêm a ordem anterior)
+            jogadas.sort(key=lambda bit: pontuacoes[bit], reverse=True)
+            melhor, melhor_pontuacao = jogadas[0], pontuacoes[jogadas[0]]
+            self.profundidade_atingida = limite
+            if melhor_pontuacao >= 1:  # Vitória forçada: uma iteração mais funda não encontra uma mais rápida
+                break
+        return melhor, melhor_pontuacao
+
+
+#NegamaxPVS(linhas=3, colunas=3, k=None, tabela=None, avaliar=avaliar_linhas_abertas, tempo_limite=None, limite_nos=None)
+#A mesma pesquisa com aprofundamento iterativo (ordenação, orçamento e tabela), escrita em negamax: a pontuação é sempre vista
+#por quem joga, e o valor de uma posição é o simétrico do melhor valor do adversário, pelo que não há ramos separados para o
+#maximizador e o minimizador. Só a primeira jogada de cada nó (a variante principal) é pesquisada com a janela completa; as
+#restantes usam uma janela nula (alpha, alpha + ε), que só prova que não são melhores, e são pesquisadas de novo com a janela
+#completa quando falham alto. Na raiz, cada iteração começa com uma janela de aspiração centrada na pontuação da iteração
+#anterior, alargada só do lado em que a pontuação cair fora dela. As pontuações são as mesmas do Minimax.
+
+class NegamaxPVS(AprofundamentoIterativo):
+    """Negamax com pesquisa de variante principal (PVS) e janelas de aspiração na raiz"""
+
+    janela_aspiracao = 0.5  # Meia largura da janela de aspiração (as avaliações heurísticas ficam entre -1 e 1)
+
+    def negamax(self, bits_jogador, bits_oponente, profundidade, alpha, beta, limite):
+        """Negamax PVS com pontuação vista por quem joga (bits_jogador), limitado a limite jogadas"""
+        self.nos += 1
+        self.verificar_orcamento()
+        estatisticas = self.estatisticas
+        if estatisticas is not None:
+            estatisticas.visitar(profundidade)
+        pontuacao = pontuacao_terminal_bitboard(bits_jogador, bits_oponente, profundidade, self.linhas, self.colunas, self.k, limite, self.avaliar)
+        if pontuacao is not None:  # Folha (terminal ou na fronteira desta iteração)
+            if estatisticas is not None:
+                estatisticas.folhas += 1
+            return pontuacao
+        _, completo = mascaras_bitboard(self.linhas, self.colunas, self.k)
+        altura = limite - profundidade  # Jogadas que faltam pesquisar
+        alpha_original, beta_original = alpha, beta
+        if self.tabela is not None:  # Mesma chave do Alpha-Beta com o jogador a maximizar: a tabela pode ser partilhada
+            chave = self.tabela.chave_bitboard(bits_jogador, bits_oponente, self.linhas, self.colunas, True, self.k)
+            entrada = self.tabela.obter(chave, profundidade, altura)
+            if entrada is not None:
+                if estatisticas is not None:
+                    estatisticas.acertos_tabela += 1
+                valor, tipo = entrada
+                if tipo == TabelaTransposicao.EXATO:
+                    return valor
+                if tipo == TabelaTransposicao.INFERIOR:
+                    alpha = max(alpha, valor)
+                else:
+                    beta = min(beta, valor)
+                if beta <= alpha:
+                    return valor
+        melhor_pontuacao = float('-inf')
+        for indice, bit in enumerate(self.ordenar(jogadas_bitboard(bits_jogador | bits_oponente, completo), profundidade)):
+            if indice == 0:  # Variante principal: janela completa
+                pontuacao = -self.negamax(bits_oponente, bits_jogador | bit, profundidade + 1, -beta, -alpha, limite)
+            else:  # Janela nula: basta saber se a jogada é melhor do que alpha
+                pontuacao = -self.negamax(bits_oponente, bits_jogador | bit, profundidade + 1, -math.nextafter(alpha, math.inf), -alpha, limite)
+                if alpha < pontuacao < beta:  # Falhou alto: pesquisa de novo, sabendo já que o valor é pelo menos pontuacao
+                    pontuacao = -self.negamax(bits_oponente, bits_jogador | bit, profundidade + 1, -beta, -pontuacao, limite)
+            melhor_pontuacao = max(melhor_pontuacao, pontuacao)
+            alpha = max(alpha, pontuacao)
+            if beta <= alpha:  # Corte
+                self.registar_corte(bit, profundidade, altura)
+                break
+        if self.tabela is not None:
+            if melhor_pontuacao <= alpha_original:
+                tipo = TabelaTransposicao.SUPERIOR
+            elif melhor_pontuacao >= beta_original:
+                tipo = TabelaTransposicao.INFERIOR
+            else:
+                tipo = TabelaTransposicao.EXATO
+            self.tabela.guardar(chave, profundidade, melhor_pontuacao, tipo, altura)
+        return melhor_pontuacao
+
+    def pesquisar_raiz(self, bits_computador, bits_humano, jogadas, alpha, beta, limite):
+        """Pesquisa PVS das jogadas da raiz na janela (alpha, beta); devolve (bit, pontuação) da melhor"""
+        melhor, melhor_pontuacao = None, float('-inf')
+        for indice, bit in enumerate(jogadas):
+            if indice == 0:
+                pontuacao = -self.negamax(bits_humano, bits_computador | bit, 1, -beta, -alpha, limite)
+            else:
+                pontuacao = -self.negamax(bits_humano, bits_computador | bit, 1, -math.nextafter(alpha, math.inf), -alpha, limite)
+                if alpha < pontuacao < beta:
+                    pontuacao = -self.negamax(bits_humano, bits_computador | bit, 1, -beta, -pontuacao, limite)
+            if pontuacao > melhor_pontuacao:
+                melhor, melhor_pontuacao = bit, pontuacao
+            if pontuacao > alpha:  # Melhor do que a janela: serve de resposta se o orçamento acabar a meio da iteração
+                self.melhor_parcial = (bit, pontuacao)
+                alpha = pontuacao
+            if beta <= alpha:
+                break
+        return melhor, melhor_pontuacao
+
+    def melhor_jogada(self, bits_computador, bits_humano, profundidade_maxima=None):
+        """Devolve (bit da melhor jogada, pontuação) para o computador, dentro do orçamento e até profundidade_maxima jogadas"""
+        self.prazo = time.perf_counter() + self.tempo_limite if self.tempo_limite is not None else None
+        _, completo = mascaras_bitboard(self.linhas, self.colunas, self.k)
+        jogadas = self.ordenar(jogadas_bitboard(bits_computador | bits_humano, completo), 0)  # Ordem estática na primeira iteração
+        melhor, melhor_pontuacao = jogadas[0], None  # Sem orçamento nenhum, joga pela ordem estática
+        livres = len(jogadas)  # Nunca é preciso ir além do fim do jogo
+        if profundidade_maxima is not None:
+            livres = min(livres, profundidade_maxima)
+        for limite in range(1, livres + 1):  # Uma iteração por profundidade
+            if melhor_pontuacao is None:  # Primeira iteração: janela completa
+                alpha, beta = float('-inf'), float('inf')
+            else:  # Janela de aspiração à volta da pontuação anterior
+                alpha, beta = melhor_pontuacao - self.janela_aspiracao, melhor_pontuacao + self.janela_aspiracao
+            self.melhor_parcial = None
+            try:
+                while True:
+                    bit, pontuacao = self.pesquisar_raiz(bits_computador, bits_humano, jogadas, alpha, beta, limite)
+                    if pontuacao <= alpha:  # Falhou baixo: o valor está abaixo da janela
+                        alpha = float('-inf')
+                    elif pontuacao >= beta:  # Falhou alto: o valor está acima da janela
+                        beta = float('inf')
+                    else:  # Valor exato dentro da janela
+                        break
+            except OrcamentoEsgotado:
+                if self.melhor_parcial is not None:  # Jogada que já bateu a janela nesta iteração
+                    melhor, melhor_pontuacao = self.melhor_parcial
+                break
+            jogadas.remove(bit)
+            jogadas.insert(0, bit)  # A melhor desta iteração é a primeira (variante principal) da seguinte
+            melhor, melhor_pontuacao = bit, pontuacao
+            self.profundidade_atingida = limite
+            if melhor_pontuacao >= 1:  # Vitória forçada: uma iteração mais funda não encontra uma mais rápida
+                break
+        return melhor, melhor_pontuacao
+
+
+#Pesquisa paralela na raiz: cada jogada do computador é avaliada por um processo de um pool criado uma só vez e reutilizado
+#entre jogadas. Os processos partilham (multiprocessing.Value) a melhor pontuação já encontrada na raiz, que cada um usa como
+#alpha ao começar uma subárvore, para que as subárvores seguintes continuem a ser cortadas. Uma subárvore que não passa desse
+#alpha devolve só um limite superior (que pode ser igual à melhor pontuação sem a jogada o ser), por isso só as pontuações
+#acima do alpha com que cada tarefa começou contam como exatas. Os resultados são lidos pela ordem das jogadas, para que os
+#empates se resolvam sempre da mesma maneira.
+
+_POOL = None  # Pool de processos reutilizado entre jogadas
+_PROCESSOS_POOL = 0  # Número de processos do pool atual
+_MELHOR_RAIZ = None  # multiprocessing.Value com a melhor pontuação da raiz (partilhado com os processos)
+
+
+def _iniciar_trabalhador(melhor_raiz):
+    """Inicializador dos processos do pool: guarda o valor partilhado"""
+    global _MELHOR_RAIZ
+    _MELHOR_RAIZ = melhor_raiz
+
+
+def _avaliar_raiz(tarefa, melhor_raiz=None):
+    """Avalia uma jogada da raiz (corre num processo do pool, ou em série com melhor_raiz próprio); devolve (bit, pontuação, alpha usado, estatísticas)"""
+    bit, bits_computador, bits_humano, linhas, colunas, k, limite, usar_alpha_beta, usar_tabela = tarefa
+    if melhor_raiz is None:  # Processo do pool: o valor partilhado dado pelo inicializador
+        melhor_raiz = _MELHOR_RAIZ
+    pesquisa = AprofundamentoIterativo(linhas, colunas, k, TABELA_TRANSPOSICAO if usar_tabela else None)
+    pesquisa.podar = usar_alpha_beta
+    pesquisa.estatisticas = EstatisticasPesquisa()  # Voltam ao processo principal com o resultado
+    pesquisa.estatisticas.iniciar()
+    alpha = melhor_raiz.value if usar_alpha_beta else float('-inf')  # Melhor pontuação já encontrada pelos outros processos
+    pontuacao = pesquisa.alpha_beta(bits_computador | bit, bits_humano, 1, False, alpha, float('inf'), limite)
+    if usar_alpha_beta:
+        with melhor_raiz.get_lock():  # Atualiza o limite partilhado
+            if pontuacao > melhor_raiz.value:
+                melhor_raiz.value = pontuacao
+    pesquisa.estatisticas.terminar()
+    return bit, pontuacao, alpha, pesquisa.estatisticas
+
+
+def obter_pool(processos=None):
+    """Devolve o pool de processos (criado na primeira chamada e reutilizado depois)"""
+    global _POOL, _PROCESSOS_POOL, _MELHOR_RAIZ
+    processos = processos or os.cpu_count() or 1  # Um processo por núcleo
+    if _POOL is None or _PROCESSOS_POOL != processos:  # Primeira utilização ou outro número de processos
+        fechar_pool()
+        _MELHOR_RAIZ = multiprocessing.Value('d', float('-inf'))
+        _POOL = multiprocessing.Pool(processos, initializer=_iniciar_trabalhador, initargs=(_MELHOR_RAIZ,))
+        _PROCESSOS_POOL = processos
+    return _POOL
+
+
+def fechar_pool():
+    """Termina o pool de processos, se existir"""
+    global _POOL
+    if _POOL is not None:
+        _POOL.terminate()
+        _POOL.join()
+        _POOL = None
+
+
+atexit.register(fechar_pool)  # Não deixa processos pendurados à saída
+
+
+#avaliar_raiz(bits_computador, bits_humano, linhas=3, colunas=3, k=None, profundidade_maxima=None, usar_alpha_beta=True,
+#             processos=None, paralelo=True, usar_tabela=False)
+#Avalia todas as jogadas da raiz (pela ordem estática de valor_casas, para que as melhores subam cedo o limite partilhado),
+#em paralelo ou, com paralelo=False, em série com exatamente a mesma pesquisa. Devolve (bit, pontuação, estatísticas somadas
+#de todos os processos; o tempo é o de CPU somado, não o de relógio).
+
+def avaliar_raiz(bits_computador, bits_humano, linhas=3, colunas=3, k=None, profundidade_maxima=None, usar_alpha_beta=True,
+                 processos=None, paralelo=True, usar_tabela=False):
+    """Avalia as jogadas da raiz em paralelo (ou em série) e devolve (bit, pontuação, estatísticas)"""
+    _, completo = mascaras_bitboard(linhas, colunas, k)
+    jogadas = sorted(jogadas_bitboard(bits_computador | bits_humano, completo), key=valor_casas(linhas, colunas, k).get, reverse=True)
+    limite = len(jogadas) if profundidade_maxima is None else profundidade_maxima  # Jogadas a pesquisar a partir da raiz
+    tarefas = [(bit, bits_computador, bits_humano, linhas, colunas, k, limite, usar_alpha_beta, usar_tabela) for bit in jogadas]
+    if paralelo:
+        pool = obter_pool(processos)
+        _MELHOR_RAIZ.value = float('-inf')  # Nova jogada: ainda não há limite (é o valor com que o pool foi criado)
+        resultados = list(pool.imap(_avaliar_raiz, tarefas))  # Em paralelo, mas devolvidos pela ordem das jogadas
+    else:  # O mesmo limite, atualizado em série, num valor local (não substitui o do pool)
+        melhor_raiz = multiprocessing.Value('d', float('-inf'))
+        resultados = [_avaliar_raiz(tarefa, melhor_raiz) for tarefa in tarefas]
+    melhor_bit, melhor_pontuacao = None, float('-inf')
+    estatisticas = EstatisticasPesquisa()
+    for bit, pontuacao, alpha, estatisticas_jogada in resultados:
+        estatisticas.juntar(estatisticas_jogada)
+        if pontuacao <= alpha:  # Falhou baixo: é só um limite superior, nunca é melhor do que uma pontuação exata
+            continue
+        if pontuacao > melhor_pontuacao:
+            melhor_bit, melhor_pontuacao = bit, pontuacao
+    return melhor_bit, melhor_pontuacao, estatisticas
+
+
+#comparar_paralelo(tabuleiro=None, processos=None, k=None, profundidade_maxima=None)
+#Mede a pesquisa da raiz em série e em paralelo na mesma posição e mostra o ganho de tempo e os nós extra da versão paralela
+#(as subárvores que arrancam antes de o limite partilhado melhorar são menos cortadas).
+
+def comparar_paralelo(tabuleiro=None, processos=None, k=None, profundidade_maxima=None):
+    """Compara a avaliação da raiz em série e em paralelo"""
+    if tabuleiro is None:  # Posição de exemplo: 5x5, quatro em linha, pesquisa a 5 jogadas
+        tabuleiro = [[" "] * 5 for _ in range(5)]
+        tabuleiro[2][2], tabuleiro[1][1] = "X", "O"
+        k, profundidade_maxima = k or 4, profundidade_maxima or 5
+    processos = processos or os.cpu_count() or 1
+    linhas, colunas = len(tabuleiro), len(tabuleiro[0])
+    bits_computador, bits_humano = para_bitboard(tabuleiro, "X")
+    obter_pool(processos)  # O arranque do pool não conta para o tempo
+    resultados = {}
+    for nome, paralelo in (("Série", False), (f"Paralelo ({processos} processos)", True)):
+        tempo_inicio = time.perf_counter()
+        bit, pontuacao, estatisticas = avaliar_raiz(bits_computador, bits_humano, linhas, colunas, k, profundidade_maxima, True, processos, paralelo)
+        nos = estatisticas.nos
+        resultados[nome] = (time.perf_counter() - tempo_inicio, nos)
+        print(f"{nome:<28} jogada {divmod(bit.bit_length() - 1, colunas)}  pontuação {pontuacao:.3f}  "
+              f"{nos} nós  {resultados[nome][0]:.3f}s")
+    (tempo_serie, nos_serie), (tempo_paralelo, nos_paralelo) = resultados.values()
+    print(f"Ganho: {tempo_serie / tempo_paralelo:.2f}x  |  Nós extra: {nos_paralelo - nos_serie} "
+          f"({(nos_paralelo / nos_serie - 1) * 100:+.1f}%)")
+
+
+#Tabela de jogo perfeito do 3x3: todas as posições alcançáveis (4520 por terminar) são resolvidas uma vez e, para cada uma, guarda-se o valor
+#minimax e as melhores jogadas. O índice da posição é o tabuleiro em base 3 visto por quem joga (casa i vale 3**i vezes
+#0 = vazia, 1 = peça de quem joga, 2 = peça do adversário), pelo que a mesma tabela serve a X e a O. Cada entrada é um inteiro
+#de 16 bits: (valor + 16) << 9 | máscara das melhores jogadas. O valor segue a convenção do Minimax (vitória em n jogadas vale
+#11 - n, derrota em n jogadas -(11 - n), empate 0). A tabela (19683 entradas, ~39 KB) é guardada em FICHEIRO_JOGO_PERFEITO e
+#só é carregada (ou calculada, se o ficheiro não existir) na primeira consulta.
+
+FICHEIRO_JOGO_PERFEITO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "jogo_perfeito_3x3.bin")
+_JOGO_PERFEITO = None  # Tabela carregada (array de 16 bits)
+_POTENCIAS_3 = tuple(3 ** i for i in range(9))  # Peso de cada casa no índice
+
+
+def indice_base3(bits_jogador, bits_oponente):
+    """Índice em base 3 de um tabuleiro 3x3 em bitboard, visto por quem joga"""
+    indice = 0
+    for casa in range(9):
+        if bits_jogador >> casa & 1:
+            indice += _POTENCIAS_3[casa]
+        elif bits_oponente >> casa & 1:
+            indice += 2 * _POTENCIAS_3[casa]
+    return indice
+
+
+def resolver_jogo_perfeito():
+    """Resolve todas as posições alcançáveis do 3x3 e devolve a tabela"""
+    vencedoras, completo = mascaras_bitboard(3, 3)
+    tabela = array('H', bytes(2 * 3 ** 9))  # 19683 entradas a zero (posições terminais ou impossíveis)
+
+    def resolver(bits_jogador, bits_oponente):
+        """Valor da posição (ainda não terminada) para quem joga; preenche a tabela pelo caminho"""
+        indice = indice_base3(bits_jogador, bits_oponente)
+        if tabela[indice]:  # Já resolvida (a tabela serve de memória)
+            return (tabela[indice] >> 9) - 16
+        pontuacoes = {}  # Pontuação de cada jogada para quem joga
+        for bit in jogadas_bitboard(bits_jogador | bits_oponente, completo):
+            novo = bits_jogador | bit
+            if venceu_bitboard(novo, vencedoras):
+                pontuacoes[bit] = 10  # Vitória imediata
+            elif novo | bits_oponente == completo:
+                pontuacoes[bit] = 0  # Empate
+            else:  # O valor para o adversário, visto daqui, fica uma jogada mais longe
+                valor_adversario = resolver(bits_oponente, novo)
+                pontuacoes[bit] = -valor_adversario + (valor_adversario > 0) - (valor_adversario < 0)
+        valor = max(pontuacoes.values())
+        mascara = sum(bit for bit, pontuacao in pontuacoes.items() if pontuacao == valor)  # Todas as melhores jogadas
+        tabela[indice] = (valor + 16) << 9 | mascara
+        return valor
+
+    resolver(0, 0)  # Todas as posições alcançáveis a partir do tabuleiro vazio
+    return tabela
+
+
+def carregar_jogo_perfeito(caminho=None):
+    """Devolve a tabela de jogo perfeito (lida do ficheiro, ou calculada e guardada na primeira utilização)"""
+    global _JOGO_PERFEITO
+    if _JOGO_PERFEITO is None:
+        caminho = caminho or FICHEIRO_JOGO_PERFEITO
+        tabela = array('H')
+        try:
+            with open(caminho, "rb") as ficheiro:
+                tabela.fromfile(ficheiro, 3 ** 9)
+        except (OSError, EOFError):  # Ficheiro ainda não existe (ou está incompleto): resolve e guarda
+            tabela = resolver_jogo_perfeito()
+            try:
+                with open(caminho, "wb") as ficheiro:
+                    tabela.tofile(ficheiro)
+            except OSError:  # Sem permissão de escrita: fica só em memória
+                pass
+        _JOGO_PERFEITO = tabela
+    return _JOGO_PERFEITO
+
+
+#jogada_perfeita(tabuleiro, jogador, aleatoria=False, gerador=random)
+#Jogada perfeita num tabuleiro 3x3 por consulta à tabela: devolve ((linha, coluna), valor). Entre várias jogadas igualmente boas
+#escolhe a primeira ou, com aleatoria=True, uma ao acaso com o gerador dado (para variar os jogos).
+
+def jogada_perfeita(tabuleiro, jogador, aleatoria=False, gerador=random):
+    """Melhor jogada e valor da posição para o jogador, por consulta à tabela de jogo perfeito"""
+    entrada = carregar_jogo_perfeito()[indice_base3(*para_bitboard(tabuleiro, jogador))]
+    mascara, valor = entrada & 511, (entrada >> 9) - 16
+    melhores = [casa for casa in range(9) if mascara >> casa & 1]  # Casas das melhores jogadas
+    if not melhores:  # Posição terminal (ou impossível no jogo normal)
+        return None, valor
+    casa = gerador.choice(melhores) if aleatoria else melhores[0]
+    return divmod(casa, 3), valor
+
+
+#obter_jogada_computador(tabuleiro, computador, humano, usar_alpha_beta=False, tabela=TABELA_TRANSPOSICAO, usar_bitboard=True,
+#                        k=None, profundidade_maxima=None, avaliar=avaliar_linhas_abertas, tempo_limite=None, limite_nos=None, processos=None,
+#                        perfeito=False, estatisticas=None, pvs=False, iterativo=False, gerador=random)
 #Determina a melhor jogada para o computador, usando Minimax ou Alpha-Beta conforme especificado. Mede também o tempo de execução da decisão.
+#As posições avaliadas ficam na tabela de transposição (partilhada entre jogadas); tabela=None desliga-a.
+#Por omissão a pesquisa corre sobre o bitboard (mesmo resultado, bastante mais rápida); usar_bitboard=False usa o tabuleiro em listas.
+#Em tabuleiros grandes, profundidade_maxima limita a pesquisa a esse número de jogadas (contando com a do computador) e as posições
+#na fronteira são avaliadas pela heurística avaliar.
+#Com tempo_limite (segundos) e/ou limite_nos usa AprofundamentoIterativo (Alpha-Beta com ordenação de jogadas) e devolve a melhor
+#jogada encontrada dentro do orçamento; profundidade_maxima, se dada, limita as iterações.
+#Com pvs=True usa NegamaxPVS (com ou sem orçamento): mesma pontuação, menos nós. Com iterativo=True usa AprofundamentoIterativo
+#mesmo sem orçamento (a referência com que o NegamaxPVS se compara: mesma ordenação de jogadas e mesma regra de paragem).
+#Com processos (>1) as jogadas da raiz são avaliadas em paralelo por avaliar_raiz (cada processo usa a sua tabela de transposição).
+#Com perfeito=True, no 3x3 clássico, a jogada vem da tabela de jogo perfeito (sem pesquisa nenhuma).
+#Se receber um EstatisticasPesquisa, acumula nele as estatísticas da pesquisa feita para esta jogada.
+#As escolhas ao acaso (primeira jogada, empates na tabela de jogo perfeito) usam o gerador dado (por omissão, o módulo random).
 
-def obter_jogada_computador(tabuleiro, computador, humano, usar_alpha_beta=False):
+def obter_jogada_computador(tabuleiro, computador, humano, usar_alpha_beta=False, tabela=TABELA_TRANSPOSICAO, usar_bitboard=True,
+                            k=None, profundidade_maxima=None, avaliar=avaliar_linhas_abertas, tempo_limite=None, limite_nos=None, processos=None,
+                            perfeito=False, estatisticas=None, pvs=False, iterativo=False, gerador=random):
     """Determina a melhor jogada para o computador usando Minimax ou Alpha-Beta"""
     
     melhor_pontuacao = float('-inf')  # Inicializa com o pior valor possível
     melhor_jogada = None  # Inicializa a melhor jogada como None
     jogadas_possiveis = obter_jogadas_possiveis(tabuleiro)  # Obtém todas as jogadas possíveis no estado atual
+    linhas, colunas = len(tabuleiro), len(tabuleiro[0])  # Dimensões do tabuleiro
+
+    if perfeito and linhas == colunas == 3 and k in (None, 3):  # Consulta à tabela de jogo perfeito
+        tempo_inicio = time.perf_counter()
+        jogada, _ = jogada_perfeita(tabuleiro, computador, aleatoria=True, gerador=gerador)
+        return jogada, time.perf_counter() - tempo_inicio
+
+    if pvs or iterativo or tempo_limite is not None or limite_nos is not None:  # Negamax PVS e/ou jogada com orçamento: aprofundamento iterativo
+        tempo_inicio = time.perf_counter()
+        classe = NegamaxPVS if pvs else AprofundamentoIterativo
+        pesquisa = classe(linhas, colunas, k, tabela, avaliar, tempo_limite, limite_nos)
+        pesquisa.estatisticas = estatisticas
+        if estatisticas is not None:
+            estatisticas.iniciar()
+        bits_computador, bits_humano = para_bitboard(tabuleiro, computador)
+        bit, _ = pesquisa.melhor_jogada(bits_computador, bits_humano, profundidade_maxima)
+        if estatisticas is not None:
+            estatisticas.terminar()
+        return divmod(bit.bit_length() - 1, colunas), time.perf_counter() - tempo_inicio  # Bit -> (linha, coluna)
+
+    if processos is not None and processos > 1 and len(jogadas_possiveis) < linhas * colunas:  # Raiz em paralelo
+        tempo_inicio = time.perf_counter()
+        bits_computador, bits_humano = para_bitboard(tabuleiro, computador)
+        bit, _, estatisticas_raiz = avaliar_raiz(bits_computador, bits_humano, linhas, colunas, k, profundidade_maxima, usar_alpha_beta,
+                                                 processos, usar_tabela=tabela is not None)
+        tempo_execucao = time.perf_counter() - tempo_inicio
+        if estatisticas is not None:  # Soma os contadores dos processos, mas com o tempo de relógio
+            estatisticas_raiz.tempo = tempo_execucao
+            estatisticas.juntar(estatisticas_raiz)
+        return divmod(bit.bit_length() - 1, colunas), tempo_execucao
 
     # Para a primeira jogada, escolher aleatoriamente por eficiência
-    if len(jogadas_possiveis) == 9:  # Se todas as 9 células estão vazias (início do jogo)
-        return random.choice(jogadas_possiveis), 0.0  # Retorna uma jogada aleatória e tempo zero
+    if len(jogadas_possiveis) == linhas * colunas:  # Se todas as células estão vazias (início do jogo)
+        return gerador.choice(jogadas_possiveis), 0.0  # Retorna uma jogada aleatória e tempo zero
 
     # Medir tempo de execução
-    tempo_inicio = time.time()  # Registra o tempo de início
+    tempo_inicio = time.perf_counter()  # Registra o tempo de início
+    if estatisticas is not None:
+        estatisticas.iniciar()
     
+    limite = None if profundidade_maxima is None else profundidade_maxima - 1  # As respostas começam à profundidade 0
+    if usar_bitboard:  # Converte uma vez para o bitboard
+        bits_computador, bits_humano = para_bitboard(tabuleiro, computador)
+
     # Avaliar cada jogada possível
     for jogada in jogadas_possiveis:  # Itera por todas as jogadas possíveis
-        tabuleiro[jogada[0]][jogada[1]] = computador  # Simula a jogada do computador
-        if usar_alpha_beta:  # Se usar Alpha-Beta
-            pontuacao = alpha_beta(tabuleiro, 0, False, computador, humano, float('-inf'), float('inf'))  # Avalia com Alpha-Beta
-        else:  # Se usar Minimax padrão
-            pontuacao = minimax(tabuleiro, 0, False, computador, humano)  # Avalia com Minimax
-        tabuleiro[jogada[0]][jogada[1]] = " "  # Desfaz a jogada
+        if usar_bitboard:  # Pesquisa sobre o bitboard
+            bits = bits_computador | 1 << (jogada[0] * colunas + jogada[1])  # Simula a jogada do computador
+            if usar_alpha_beta:
+                pontuacao = alpha_beta_bitboard(bits, bits_humano, 0, False, float('-inf'), float('inf'), linhas, colunas, tabela, k, limite, avaliar, estatisticas)
+            else:
+                pontuacao = minimax_bitboard(bits, bits_humano, 0, False, linhas, colunas, tabela, k, limite, avaliar, estatisticas)
+        else:  # Pesquisa sobre o tabuleiro em listas
+            tabuleiro[jogada[0]][jogada[1]] = computador  # Simula a jogada do computador
+            if usar_alpha_beta:  # Se usar Alpha-Beta
+                pontuacao = alpha_beta(tabuleiro, 0, False, computador, humano, float('-inf'), float('inf'), tabela, k, limite, avaliar, estatisticas)  # Avalia com Alpha-Beta
+            else:  # Se usar Minimax padrão
+                pontuacao = minimax(tabuleiro, 0, False, computador, humano, tabela, k, limite, avaliar, estatisticas)  # Avalia com Minimax
+            tabuleiro[jogada[0]][jogada[1]] = " "  # Desfaz a jogada
 
         # Atualiza a melhor jogada se encontrar uma pontuação melhor
         if pontuacao > melhor_pontuacao:  # Se a pontuação atual é melhor que a melhor encontrada
             melhor_pontuacao = pontuacao  # Atualiza a melhor pontuação
             melhor_jogada = jogada  # Atualiza a melhor jogada
             
-    tempo_fim = time.time()  # Registra o tempo de fim
+    tempo_fim = time.perf_counter()  # Registra o tempo de fim
     tempo_execucao = tempo_fim - tempo_inicio  # Calcula o tempo total de execução
+    if estatisticas is not None:
+        estatisticas.terminar()
     
     return melhor_jogada, tempo_execucao  # Retorna a melhor jogada e o tempo de execução
 
 
-#contar_nos_visitados(tabuleiro, e_maximizador, jogador, oponente, usar_alpha_beta=False, alpha=float('-inf'), beta=float('inf'))
-#Conta quantos estados do jogo (nós) são explorados pelo algoritmo (Minimax ou Alpha-Beta) a partir do estado atual do tabuleiro.
+#contar_nos_visitados(tabuleiro, e_maximizador, jogador, oponente, usar_alpha_beta=False, alpha=float('-inf'), beta=float('inf'), usar_bitboard=False,
+#                     k=None, profundidade_maxima=None)
+#Número de estados do jogo (nós) que o algoritmo (Minimax ou Alpha-Beta) visita a partir do estado atual do tabuleiro.
+#Mantida por compatibilidade: faz uma pesquisa com EstatisticasPesquisa e devolve o número de nós (para mais detalhe,
+#passar um EstatisticasPesquisa diretamente às funções de pesquisa).
 
-def contar_nos_visitados(tabuleiro, e_maximizador, jogador, oponente, usar_alpha_beta=False, alpha=float('-inf'), beta=float('inf')):
+def contar_nos_visitados(tabuleiro, e_maximizador, jogador, oponente, usar_alpha_beta=False, alpha=float('-inf'), beta=float('inf'), usar_bitboard=False,
+                         k=None, profundidade_maxima=None):
     """Conta o número de nós (estados do jogo) explorados pelos algoritmos"""
-   
-    # Casos base: verificar estados terminais
-    if verificar_vencedor(tabuleiro, jogador) or verificar_vencedor(tabuleiro, oponente) or tabuleiro_cheio(tabuleiro):
-        return 1  # Nó terminal conta como 1
-    
-    nos = 1  # Contar nó atual
-    
-    # Casos recursivos - exploração da árvore de possibilidades
-    for jogada in obter_jogadas_possiveis(tabuleiro):  # Para cada jogada possível
-        tabuleiro[jogada[0]][jogada[1]] = jogador if e_maximizador else oponente  # Simula jogada do jogador atual
-        
-        if usar_alpha_beta:  # Se usar Alpha-Beta
-            proxima_pontuacao = alpha_beta(tabuleiro, 0, not e_maximizador, jogador, oponente, alpha, beta)  # Calcula pontuação
-            if e_maximizador:  # Se é maximizador
-                alpha = max(alpha, proxima_pontuacao)  # Atualiza alpha
-                if beta <= alpha:  # Condição de poda
-                    tabuleiro[jogada[0]][jogada[1]] = " "  # Desfaz jogada
-                    break  # Poda - não explora mais nós
-            else:  # Se é minimizador
-                beta = min(beta, proxima_pontuacao)  # Atualiza beta
-                if beta <= alpha:  # Condição de poda
-                    tabuleiro[jogada[0]][jogada[1]] = " "  # Desfaz jogada
-                    break  # Poda - não explora mais nós
-        
-        # Chamada recursiva para contar nós de subárvores
-        nos += contar_nos_visitados(
-            tabuleiro, 
-            not e_maximizador,  # Alterna entre maximizador e minimizador
-            jogador, 
-            oponente, 
-            usar_alpha_beta,
-            alpha,
-            beta
-        )
-        
-        tabuleiro[jogada[0]][jogada[1]] = " "  # Desfaz a jogada
-    
-    return nos  # Retorna número total de nós visitados
+    estatisticas = EstatisticasPesquisa()
+    if usar_bitboard:  # Pesquisa sobre o bitboard
+        bits_jogador, bits_oponente = para_bitboard(tabuleiro, jogador)
+        return contar_nos_bitboard(bits_jogador, bits_oponente, e_maximizador, len(tabuleiro), len(tabuleiro[0]), usar_alpha_beta, alpha, beta,
+                                   k, profundidade_maxima)
+    if usar_alpha_beta:
+        alpha_beta(tabuleiro, 0, e_maximizador, jogador, oponente, alpha, beta, k=k, profundidade_maxima=profundidade_maxima, estatisticas=estatisticas)
+    else:
+        minimax(tabuleiro, 0, e_maximizador, jogador, oponente, k=k, profundidade_maxima=profundidade_maxima, estatisticas=estatisticas)
+    return estatisticas.nos  # Retorna número total de nós visitados
+
+
+#contar_nos_bitboard(bits_jogador, bits_oponente, e_maximizador, linhas=3, colunas=3, usar_alpha_beta=False, alpha=float('-inf'), beta=float('inf'),
+#                    k=None, profundidade_maxima=None)
+#A mesma contagem de contar_nos_visitados, sobre o tabuleiro em bitboard.
 
-#comparar_desempenho_algoritmos()
-#Compara o desempenho dos algoritmos Minimax e Alpha-Beta em tabuleiros de diferentes tamanhos, 
-#medindo tempo de execução e número de nós visitados, e apresenta os resultados em gráficos.
+def contar_nos_bitboard(bits_jogador, bits_oponente, e_maximizador, linhas=3, colunas=3, usar_alpha_beta=False, alpha=float('-inf'), beta=float('inf'),
+                        k=None, profundidade_maxima=None):
+    """Conta o número de nós explorados pelos algoritmos, sobre o bitboard"""
+    estatisticas = EstatisticasPesquisa()
+    if usar_alpha_beta:
+        alpha_beta_bitboard(bits_jogador, bits_oponente, 0, e_maximizador, alpha, beta, linhas, colunas, k=k, profundidade_maxima=profundidade_maxima,
+                            estatisticas=estatisticas)
+    else:
+        minimax_bitboard(bits_jogador, bits_oponente, 0, e_maximizador, linhas, colunas, k=k, profundidade_maxima=profundidade_maxima,
+                         estatisticas=estatisticas)
+    return estatisticas.nos
 
-def comparar_desempenho_algoritmos():
+
+#comparar_desempenho_algoritmos(tamanhos=(3, 4, 5, 6, 7), profundidade_maxima=3, k=None, semente=None)
+#Compara o desempenho dos algoritmos Minimax, Alpha-Beta, Alpha-Beta com aprofundamento iterativo (AI) e Negamax PVS em tabuleiros
+#de diferentes tamanhos, medindo tempo de execução e número de nós visitados, e apresenta os resultados numa tabela e em gráficos.
+#A coluna PVS/AI é a fração dos nós do AI que o Negamax PVS visita na mesma posição de meio-jogo: as duas pesquisas usam a mesma
+#ordenação de jogadas e param ao encontrar uma vitória, por isso a diferença vem só das janelas nulas e de aspiração.
+#(O Alpha-Beta simples não ordena as jogadas nem pára cedo, por isso não serve para medir o ganho do PVS.)
+#O 3x3 é pesquisado até ao fim; nos maiores a pesquisa pára a profundidade_maxima jogadas (com a heurística nas folhas).
+#Por omissão ganha-se com min(lado, 4) em linha.
+
+def comparar_desempenho_algoritmos(tamanhos=(3, 4, 5, 6, 7), profundidade_maxima=3, k=None, semente=None):
     """Compara o desempenho dos algoritmos Minimax e Alpha-Beta em diferentes tamanhos de tabuleiro"""
     
-    tamanhos_tabuleiro = [(i, i) for i in range(3, 5)]  # Define tabuleiros 3x3 e 4x4 para teste
+    gerador = random.Random(semente)  # Gerador próprio (semente fixa = mesmos tabuleiros)
+    tamanhos_tabuleiro = [(n, n) for n in tamanhos]  # Tabuleiros quadrados a testar
     tempos_minimax = []  # Lista para armazenar tempos do Minimax
     tempos_alpha_beta = []  # Lista para armazenar tempos do Alpha-Beta
     nos_minimax = []  # Lista para armazenar nós visitados pelo Minimax
     nos_alpha_beta = []  # Lista para armazenar nós visitados pelo Alpha-Beta
+    tempos_iterativo = []  # Lista para armazenar tempos do Alpha-Beta com aprofundamento iterativo
+    nos_iterativo = []  # Lista para armazenar nós visitados pelo Alpha-Beta com aprofundamento iterativo
+    tempos_pvs = []  # Lista para armazenar tempos do Negamax PVS
+    nos_pvs = []  # Lista para armazenar nós visitados pelo Negamax PVS
     
+    print(f"\n{'Tabuleiro':<10}{'k':>3}{'Prof.':>7}{'Tempo MM (s)':>14}{'Tempo AB (s)':>14}{'Tempo AI (s)':>14}{'Tempo PVS (s)':>15}"
+          f"{'Nós MM':>10}{'Nós AB':>10}{'Nós AI':>10}{'Nós PVS':>10}{'PVS/AI':>8}")
     # Para cada tamanho de tabuleiro
     for n, m in tamanhos_tabuleiro:
-        # Criar tabuleiro vazio
-        tabuleiro = [[" " for _ in range(m)] for _ in range(n)]  # Cria tabuleiro n x m
-        
-        # Colocar algumas jogadas aleatórias para criar um estado de meio-jogo
-        jogadas = [(i, j) for i in range(n) for j in range(m)]  # Lista todas as posições possíveis
-        random.shuffle(jogadas)  # Embaralha as posições
-        for i, jogada in enumerate(jogadas[:n]):  # Usa as primeiras n posições
-            tabuleiro[jogada[0]][jogada[1]] = "X" if i % 2 == 0 else "O"  # Alterna entre X e O
+        k_tabuleiro = k or min(n, m, 4)  # Comprimento da sequência vencedora
+        limite = None if n * m <= 9 else profundidade_maxima  # Só o 3x3 se pesquisa até ao fim
         
-        # Medir desempenho Minimax
-        tempo_inicio = time.time()  # Registra tempo inicial
-        _, _ = obter_jogada_computador(tabuleiro, "X", "O", usar_alpha_beta=False)  # Executa Minimax
-        tempos_minimax.append(time.time() - tempo_inicio)  # Registra tempo total
+        # Colocar algumas jogadas aleatórias para criar um estado de meio-jogo (sem vencedor)
+        while True:
+            tabuleiro = [[" " for _ in range(m)] for _ in range(n)]  # Cria tabuleiro n x m
+            jogadas = [(i, j) for i in range(n) for j in range(m)]  # Lista todas as posições possíveis
+            gerador.shuffle(jogadas)  # Embaralha as posições
+            for i, jogada in enumerate(jogadas[:n]):  # Usa as primeiras n posições
+                tabuleiro[jogada[0]][jogada[1]] = "X" if i % 2 == 0 else "O"  # Alterna entre X e O
+            if not verificar_vencedor(tabuleiro, "X", k_tabuleiro) and not verificar_vencedor(tabuleiro, "O", k_tabuleiro):
+                break
         
-        # Contar nós para Minimax
-        contador_nos = contar_nos_visitados(tabuleiro, True, "X", "O", usar_alpha_beta=False)  # Conta nós do Minimax
-        nos_minimax.append(contador_nos)  # Armazena contagem
+        # Medir desempenho Minimax (tempo e nós da mesma pesquisa)
+        estatisticas = EstatisticasPesquisa()
+        obter_jogada_computador(tabuleiro, "X", "O", usar_alpha_beta=False, tabela=None, k=k_tabuleiro, profundidade_maxima=limite,
+                                estatisticas=estatisticas)  # Executa Minimax
+        tempos_minimax.append(estatisticas.tempo)  # Registra tempo total
+        nos_minimax.append(estatisticas.nos)  # Armazena contagem
         
         # Medir desempenho Alpha-Beta
-        tempo_inicio = time.time()  # Registra tempo inicial
-        _, _ = obter_jogada_computador(tabuleiro, "X", "O", usar_alpha_beta=True)  # Executa Alpha-Beta
-        tempos_alpha_beta.append(time.time() - tempo_inicio)  # Registra tempo total
-        
-        # Contar nós para Alpha-Beta
-        contador_nos = contar_nos_visitados(tabuleiro, True, "X", "O", usar_alpha_beta=True)  # Conta nós do Alpha-Beta
-        nos_alpha_beta.append(contador_nos)  # Armazena contagem
+        estatisticas = EstatisticasPesquisa()
+        obter_jogada_computador(tabuleiro, "X", "O", usar_alpha_beta=True, tabela=None, k=k_tabuleiro, profundidade_maxima=limite,
+                                estatisticas=estatisticas)  # Executa Alpha-Beta
+        tempos_alpha_beta.append(estatisticas.tempo)  # Registra tempo total
+        nos_alpha_beta.append(estatisticas.nos)  # Armazena contagem
+
+        # Medir desempenho Alpha-Beta com aprofundamento iterativo (referência do PVS: mesma ordenação e mesma paragem)
+        estatisticas = EstatisticasPesquisa()
+        obter_jogada_computador(tabuleiro, "X", "O", tabela=None, k=k_tabuleiro, profundidade_maxima=limite, estatisticas=estatisticas,
+                                iterativo=True)  # Executa Alpha-Beta iterativo
+        tempos_iterativo.append(estatisticas.tempo)  # Registra tempo total
+        nos_iterativo.append(estatisticas.nos)  # Armazena contagem
+
+        # Medir desempenho Negamax PVS (a mesma pontuação, com ordenação de jogadas e janelas nulas)
+        estatisticas = EstatisticasPesquisa()
+        obter_jogada_computador(tabuleiro, "X", "O", tabela=None, k=k_tabuleiro, profundidade_maxima=limite, estatisticas=estatisticas,
+                                pvs=True)  # Executa Negamax PVS
+        tempos_pvs.append(estatisticas.tempo)  # Registra tempo total
+        nos_pvs.append(estatisticas.nos)  # Armazena contagem
+
+        print(f"{f'{n}x{m}':<10}{k_tabuleiro:>3}{'fim' if limite is None else limite:>7}{tempos_minimax[-1]:>14.4f}"
+              f"{tempos_alpha_beta[-1]:>14.4f}{tempos_iterativo[-1]:>14.4f}{tempos_pvs[-1]:>15.4f}{nos_minimax[-1]:>10}"
+              f"{nos_alpha_beta[-1]:>10}{nos_iterativo[-1]:>10}{nos_pvs[-1]:>10}{nos_pvs[-1] / nos_iterativo[-1]:>8.3f}")
     
     # Plotar os resultados
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))  # Cria figura com dois gráficos lado a lado
     
     etiquetas_tabuleiro = [f"{n}x{m}" for n, m in tamanhos_tabuleiro]  # Cria etiquetas para os tamanhos de tabuleiro
     
-    # Gráfico de tempos
-    ax1.bar(np.arange(len(tamanhos_tabuleiro)) - 0.2, tempos_minimax, width=0.4, label='Minimax')  # Barras de tempo Minimax
-    ax1.bar(np.arange(len(tamanhos_tabuleiro)) + 0.2, tempos_alpha_beta, width=0.4, label='Alpha-Beta')  # Barras de tempo Alpha-Beta
-    ax1.set_xticks(np.arange(len(tamanhos_tabuleiro)))  # Define posições dos ticks
-    ax1.set_xticklabels(etiquetas_tabuleiro)  # Define etiquetas dos ticks
+    # Gráfico de tempos (escala logarítmica: o custo cresce exponencialmente com o tabuleiro)
+    ax1.plot(etiquetas_tabuleiro, tempos_minimax, marker='o', label='Minimax')  # Curva de tempo Minimax
+    ax1.plot(etiquetas_tabuleiro, tempos_alpha_beta, marker='o', label='Alpha-Beta')  # Curva de tempo Alpha-Beta
+    ax1.plot(etiquetas_tabuleiro, tempos_iterativo, marker='o', label='Alpha-Beta iterativo')  # Curva de tempo Alpha-Beta iterativo
+    ax1.plot(etiquetas_tabuleiro, tempos_pvs, marker='o', label='Negamax PVS')  # Curva de tempo Negamax PVS
+    ax1.set_yscale('log')  # Escala logarítmica
     ax1.set_ylabel('Tempo de Execução (segundos)')  # Define título do eixo Y
     ax1.set_title('Tempo de Execução dos Algoritmos')  # Define título do gráfico
     ax1.legend()  # Adiciona legenda
     
     # Gráfico de nós visitados
-    ax2.bar(np.arange(len(tamanhos_tabuleiro)) - 0.2, nos_minimax, width=0.4, label='Minimax')  # Barras de nós Minimax
-    ax2.bar(np.arange(len(tamanhos_tabuleiro)) + 0.2, nos_alpha_beta, width=0.4, label='Alpha-Beta')  # Barras de nós Alpha-Beta
-    ax2.set_xticks(np.arange(len(tamanhos_tabuleiro)))  # Define posições dos ticks
-    ax2.set_xticklabels(etiquetas_tabuleiro)  # Define etiquetas dos ticks
+    ax2.plot(etiquetas_tabuleiro, nos_minimax, marker='o', label='Minimax')  # Curva de nós Minimax
+    ax2.plot(etiquetas_tabuleiro, nos_alpha_beta, marker='o', label='Alpha-Beta')  # Curva de nós Alpha-Beta
+    ax2.plot(etiquetas_tabuleiro, nos_iterativo, marker='o', label='Alpha-Beta iterativo')  # Curva de nós Alpha-Beta iterativo
+    ax2.plot(etiquetas_tabuleiro, nos_pvs, marker='o', label='Negamax PVS')  # Curva de nós Negamax PVS
+    ax2.set_yscale('log')  # Escala logarítmica
     ax2.set_ylabel('Nós Visitados')  # Define título do eixo Y
-    ax2.set_title('Número de Nós Visitados')  # Define título do gráfico
+    ax2.set_title(f'Número de Nós Visitados (profundidade {profundidade_maxima} acima de 3x3)')  # Define título do gráfico
     ax2.legend()  # Adiciona legenda
     
     plt.tight_layout()  # Ajusta layout
@@ -296,8 +1324,10 @@ def jogar_humano_vs_computador():
     print("Escolha o algoritmo para o computador:")
     print("1. Minimax")
     print("2. Alpha-Beta")
-    escolha_algo = input("Escolha (1-2): ")  # Obtém escolha do usuário
+    print("3. Tabela de jogo perfeito (sem pesquisa)")
+    escolha_algo = input("Escolha (1-3): ")  # Obtém escolha do usuário
     usar_alpha_beta = (escolha_algo == "2")  # Define se usar Alpha-Beta baseado na escolha
+    perfeito = (escolha_algo == "3")  # Define se o computador joga pela tabela
     
     # Escolher quem joga primeiro
     print("\nQuem joga primeiro?")
@@ -350,10 +1380,10 @@ def jogar_humano_vs_computador():
             # Aguardar pressionar Enter para continuar
             input("Prima ENTER para o computador jogar...")  # Pausa para o usuário ver o tabuleiro
             
-            jogada, tempo_execucao = obter_jogada_computador(tabuleiro, jogador_computador, jogador_humano, usar_alpha_beta)  # Obtém jogada do computador
+            jogada, tempo_execucao = obter_jogada_computador(tabuleiro, jogador_computador, jogador_humano, usar_alpha_beta, perfeito=perfeito)  # Obtém jogada do computador
             tabuleiro[jogada[0]][jogada[1]] = jogador_computador  # Efetua a jogada do computador
             
-            nome_algoritmo = "Alpha-Beta" if usar_alpha_beta else "Minimax"  # Nome do algoritmo usado
+            nome_algoritmo = "Tabela de jogo perfeito" if perfeito else "Alpha-Beta" if usar_alpha_beta else "Minimax"  # Nome do algoritmo usado
             print(f"O computador escolheu a posição {jogada[0]*3 + jogada[1] + 1}")  # Mostra posição escolhida
             print(f"Tempo de execução ({nome_algoritmo}): {tempo_execucao:.6f} segundos")  # Mostra tempo de execução
         
@@ -404,6 +1434,8 @@ def jogar_computador_vs_computador():
         usar_alpha_beta_x = True  # X usa poda Alpha-Beta
         usar_alpha_beta_o = False  # O não usa poda Alpha-Beta
     
+    perfeito = input("Usar a tabela de jogo perfeito em vez da pesquisa? (s/n): ").strip().lower() == "s"  # Jogadas por consulta à tabela
+    
     print(f"Jogador X usará {algoritmo_x}")
     print(f"Jogador O usará {algoritmo_o}")
     print("Prima ENTER para avançar para a próxima jogada...")
@@ -434,46 +1466,39 @@ def jogar_computador_vs_computador():
         
         # Obter jogada do computador
         if jogador_atual == computador_x:  # Se é vez do jogador X
-            jogada, tempo_execucao = obter_jogada_computador(tabuleiro, computador_x, computador_o, usar_alpha_beta=usar_alpha_beta_x)  # Obtém jogada de X
+            estatisticas = EstatisticasPesquisa()  # Estatísticas recolhidas pela própria pesquisa
+            jogada, tempo_execucao = obter_jogada_computador(tabuleiro, computador_x, computador_o, usar_alpha_beta=usar_alpha_beta_x, perfeito=perfeito,
+                                                             estatisticas=estatisticas)  # Obtém jogada de X
             algoritmo = algoritmo_x  # Nome do algoritmo usado por X
             
             # Armazenar estatísticas no array correto
             if usar_alpha_beta_x:  # Se X usa Alpha-Beta
                 tempos_alpha_beta.append(tempo_execucao)  # Registra tempo de Alpha-Beta
-                # Contar nós explorados para esta jogada
-                copia_tabuleiro = [linha[:] for linha in tabuleiro]  # Cria cópia do tabuleiro para contagem
-                nos = contar_nos_visitados(copia_tabuleiro, True, computador_x, computador_o, usar_alpha_beta=True)  # Conta nós
-                nos_alpha_beta.append(nos)  # Registra contagem
+                nos_alpha_beta.append(estatisticas.nos)  # Nós explorados nesta jogada
             else:  # Se X usa Minimax
                 tempos_minimax.append(tempo_execucao)  # Registra tempo de Minimax
-                # Contar nós explorados para esta jogada
-                copia_tabuleiro = [linha[:] for linha in tabuleiro]  # Cria cópia do tabuleiro para contagem
-                nos = contar_nos_visitados(copia_tabuleiro, True, computador_x, computador_o, usar_alpha_beta=False)  # Conta nós
-                nos_minimax.append(nos)  # Registra contagem
+                nos_minimax.append(estatisticas.nos)  # Nós explorados nesta jogada
             
         else:  # Se é vez do jogador O
-            jogada, tempo_execucao = obter_jogada_computador(tabuleiro, computador_o, computador_x, usar_alpha_beta=usar_alpha_beta_o)  # Obtém jogada de O
+            estatisticas = EstatisticasPesquisa()  # Estatísticas recolhidas pela própria pesquisa
+            jogada, tempo_execucao = obter_jogada_computador(tabuleiro, computador_o, computador_x, usar_alpha_beta=usar_alpha_beta_o, perfeito=perfeito,
+                                                             estatisticas=estatisticas)  # Obtém jogada de O
             algoritmo = algoritmo_o  # Nome do algoritmo usado por O
             
             # Armazenar estatísticas no array correto
             if usar_alpha_beta_o:  # Se O usa Alpha-Beta
                 tempos_alpha_beta.append(tempo_execucao)  # Registra tempo de Alpha-Beta
-                # Contar nós explorados para esta jogada
-                copia_tabuleiro = [linha[:] for linha in tabuleiro]  # Cria cópia do tabuleiro para contagem
-                nos = contar_nos_visitados(copia_tabuleiro, True, computador_o, computador_x, usar_alpha_beta=True)  # Conta nós
-                nos_alpha_beta.append(nos)  # Registra contagem
+                nos_alpha_beta.append(estatisticas.nos)  # Nós explorados nesta jogada
             else:  # Se O usa Minimax
                 tempos_minimax.append(tempo_execucao)  # Registra tempo de Minimax
-                # Contar nós explorados para esta jogada
-                copia_tabuleiro = [linha[:] for linha in tabuleiro]  # Cria cópia do tabuleiro para contagem
-                nos = contar_nos_visitados(copia_tabuleiro, True, computador_o, computador_x, usar_alpha_beta=False)  # Conta nós
-                nos_minimax.append(nos)  # Registra contagem
+                nos_minimax.append(estatisticas.nos)  # Nós explorados nesta jogada
         
         tabuleiro[jogada[0]][jogada[1]] = jogador_atual  # Efetua a jogada
         jogadas_realizadas.append(rodada)  # Registra número da rodada
         
         print(f"Computador {jogador_atual} ({algoritmo}) escolheu a posição {jogada[0]*3 + jogada[1] + 1}")  # Mostra posição escolhida
         print(f"Tempo de execução: {tempo_execucao:.6f} segundos")  # Mostra tempo de execução
+        print(f"Pesquisa: {estatisticas}")  # Nós, folhas, cortes e profundidade desta jogada
         
         # Verificar vencedor
         if verificar_vencedor(tabuleiro, jogador_atual):  # Se jogador atual venceu
@@ -581,14 +1606,200 @@ def visualizar_exploracao_tabuleiro():
     print("Tabuleiro de exemplo:")
     mostrar_tabuleiro(tabuleiro)  # Mostra o tabuleiro de exemplo
     
-    # Contar nós explorados por cada algoritmo
-    nos_minimax = contar_nos_visitados(tabuleiro, True, "X", "O", usar_alpha_beta=False)  # Conta nós para Minimax
-    nos_alpha_beta = contar_nos_visitados(tabuleiro, True, "X", "O", usar_alpha_beta=True)  # Conta nós para Alpha-Beta
+    # Estatísticas recolhidas pela própria pesquisa de cada algoritmo
+    est_minimax = EstatisticasPesquisa()
+    est_minimax.iniciar()
+    minimax(tabuleiro, 0, True, "X", "O", estatisticas=est_minimax)  # Pesquisa Minimax
+    est_minimax.terminar()
+    est_alpha_beta = EstatisticasPesquisa()
+    est_alpha_beta.iniciar()
+    alpha_beta(tabuleiro, 0, True, "X", "O", float('-inf'), float('inf'), estatisticas=est_alpha_beta)  # Pesquisa Alpha-Beta
+    est_alpha_beta.terminar()
     
     # Exibe os resultados
-    print(f"Minimax explora {nos_minimax} nós")  # Mostra número de nós do Minimax
-    print(f"Alpha-Beta explora {nos_alpha_beta} nós")  # Mostra número de nós do Alpha-Beta
-    print(f"Eficácia da poda Alpha-Beta: {(1 - nos_alpha_beta/nos_minimax)*100:.2f}% de redução")  # Mostra percentual de redução
+    print(f"Minimax: {est_minimax}")  # Nós, folhas e tempo do Minimax
+    print(f"Alpha-Beta: {est_alpha_beta}")  # Nós, folhas, cortes e tempo do Alpha-Beta
+    print(f"Cortes por profundidade (Alpha-Beta): {dict(sorted(est_alpha_beta.cortes.items()))}")  # Onde a poda atua
+    print(f"Eficácia da poda Alpha-Beta: {(1 - est_alpha_beta.nos/est_minimax.nos)*100:.2f}% de redução")  # Mostra percentual de redução
+
+    # Com tabela de transposição, cada posição (a menos de simetrias) só é expandida uma vez
+    for nome, usar_alpha_beta in (("Minimax", False), ("Alpha-Beta", True)):
+        tabela = TabelaTransposicao()  # Tabela nova para medir só esta pesquisa
+        estatisticas = EstatisticasPesquisa()
+        estatisticas.iniciar()
+        if usar_alpha_beta:
+            alpha_beta(tabuleiro, 0, True, "X", "O", float('-inf'), float('inf'), tabela, estatisticas=estatisticas)
+        else:
+            minimax(tabuleiro, 0, True, "X", "O", tabela, estatisticas=estatisticas)
+        estatisticas.terminar()
+        print(f"{nome} com tabela de transposição: {estatisticas.nos} nós visitados, "
+              f"{estatisticas.acertos_tabela} acertos em {tabela.consultas} consultas ({tabela.taxa_acertos():.1f}%), "
+              f"{estatisticas.tempo:.6f}s")
+
+
+#verificar_tabela_partilhada(posicoes=100, semente=0)
+#Verificação de consistência: em posições 3x3 aleatórias, preenche uma tabela de transposição com a pesquisa Alpha-Beta do
+#adversário (que guarda limites inferiores/superiores, como no modo computador vs computador) e confirma que o Minimax, a usar
+#essa mesma tabela, dá a cada jogada a mesma pontuação que sem tabela (nas listas e no bitboard, cada um com a sua tabela).
+#Devolve o número de pontuações diferentes (0 = consistente). Corre à parte do menu: python jogo_galo.py --verificar
+
+def verificar_tabela_partilhada(posicoes=100, semente=0):
+    """Confirma que o Minimax com uma tabela partilhada com o Alpha-Beta dá os mesmos valores que sem tabela"""
+    gerador = random.Random(semente)  # Semente fixa = mesmas posições
+    diferencas = verificadas = 0
+    for _ in range(posicoes):
+        while True:  # Posição aleatória sem vencedor, com X a jogar
+            tabuleiro = [[" "] * 3 for _ in range(3)]
+            casas = gerador.sample(range(9), 2 * gerador.randint(1, 3))  # 2 a 6 peças (o tabuleiro vazio sem tabela é lento)
+            for i, casa in enumerate(casas):
+                tabuleiro[casa // 3][casa % 3] = "X" if i % 2 == 0 else "O"
+            if not verificar_vencedor(tabuleiro, "X") and not verificar_vencedor(tabuleiro, "O"):
+                break
+        tabelas = (TabelaTransposicao(), TabelaTransposicao())  # Uma para o Minimax em listas, outra para o de bitboard
+        for tabela in tabelas:  # Pesquisa do adversário: deixa limites na tabela
+            obter_jogada_computador(tabuleiro, "O", "X", usar_alpha_beta=True, tabela=tabela)
+        bits_x, bits_o = para_bitboard(tabuleiro, "X")
+        for linha, coluna in obter_jogadas_possiveis(tabuleiro):
+            tabuleiro[linha][coluna] = "X"
+            bit = 1 << (linha * 3 + coluna)
+            com_tabela = (minimax(tabuleiro, 0, False, "X", "O", tabelas[0]), minimax_bitboard(bits_x | bit, bits_o, 0, False, tabela=tabelas[1]))
+            sem_tabela = minimax_bitboard(bits_x | bit, bits_o, 0, False)
+            tabuleiro[linha][coluna] = " "
+            diferencas += sum(valor != sem_tabela for valor in com_tabela)
+            verificadas += 2
+    print(f"Tabela partilhada Minimax/Alpha-Beta: {diferencas} pontuações diferentes em {verificadas}")
+    return diferencas
+
+
+#Torneio automático (sem interação): MOTORES_TORNEIO associa o nome de cada motor aos argumentos de obter_jogada_computador
+#(None = jogador aleatório; "tabela": True = tabela de transposição nova em cada jogo, para que os resultados não dependam
+#do processo que joga cada partida). Para juntar um motor novo basta acrescentar uma entrada; não usar "processos" (os jogos
+#já correm dentro do pool de processos).
+
+MOTORES_TORNEIO = {
+    "aleatorio": None,
+    "minimax": {"usar_alpha_beta": False},
+    "alpha_beta": {"usar_alpha_beta": True},
+    "minimax_tabela": {"usar_alpha_beta": False, "tabela": True},
+    "alpha_beta_tabela": {"usar_alpha_beta": True, "tabela": True},
+    "alpha_beta_prof2": {"usar_alpha_beta": True, "profundidade_maxima": 2},
+    "aprofundamento": {"usar_alpha_beta": True, "tabela": True, "limite_nos": 2000},
+    "negamax_pvs": {"pvs": True},
+    "negamax_pvs_tabela": {"pvs": True, "tabela": True},
+    "perfeito": {"perfeito": True},
+}
+
+CAMPOS_TORNEIO = ("jogo", "semente", "abertura", "motor_x", "motor_o", "vencedor", "jogadas",
+                  "latencia_media_x", "latencia_media_o", "nos_x", "nos_o")  # Colunas do CSV (uma linha por jogo)
+
+
+#jogar_partida(tarefa)
+#Joga um jogo completo sem interação (corre num processo do pool). A tarefa é (jogo, semente, motor_x, config_x, motor_o, config_o,
+#tamanho, k, aberturas): as primeiras `aberturas` jogadas são aleatórias a partir da semente, e o resto é jogado pelos motores.
+#Devolve (linha do CSV, lista de (cor, motor, latência, nós) por jogada dos motores).
+
+def jogar_partida(tarefa):
+    """Joga uma partida entre dois motores e devolve o resultado e as medições de cada jogada"""
+    jogo, semente, motor_x, config_x, motor_o, config_o, tamanho, k, aberturas = tarefa
+    gerador = random.Random(semente)  # Mesma semente = mesma abertura e mesmas escolhas aleatórias dos motores (sem tocar no random global)
+    tabuleiro = [[" "] * tamanho for _ in range(tamanho)]
+    motores = {"X": (motor_x, config_x), "O": (motor_o, config_o)}
+    tabelas = {jogador: TabelaTransposicao() if config and config.get("tabela") else None for jogador, (_, config) in motores.items()}
+    jogadores = ("X", "O")
+    abertura, medicoes, vencedor = [], [], "empate"
+    for jogada_numero in range(tamanho * tamanho):
+        jogador, oponente = jogadores[jogada_numero % 2], jogadores[1 - jogada_numero % 2]
+        nome, config = motores[jogador]
+        if jogada_numero < aberturas:  # Abertura aleatória (igual para as duas cores)
+            jogada = gerador.choice(obter_jogadas_possiveis(tabuleiro))
+            abertura.append(str(jogada[0] * tamanho + jogada[1] + 1))
+        elif config is None:  # Jogador aleatório
+            tempo_inicio = time.perf_counter()
+            jogada = gerador.choice(obter_jogadas_possiveis(tabuleiro))
+            medicoes.append((jogador, nome, time.perf_counter() - tempo_inicio, 0))
+        else:  # Motor de pesquisa
+            argumentos = {chave: valor for chave, valor in config.items() if chave != "tabela"}
+            estatisticas = EstatisticasPesquisa()
+            tempo_inicio = time.perf_counter()
+            jogada, _ = obter_jogada_computador(tabuleiro, jogador, oponente, tabela=tabelas[jogador], k=k, estatisticas=estatisticas,
+                                                gerador=gerador, **argumentos)
+            medicoes.append((jogador, nome, time.perf_counter() - tempo_inicio, estatisticas.nos))
+        tabuleiro[jogada[0]][jogada[1]] = jogador  # Efetua a jogada
+        if verificar_vencedor(tabuleiro, jogador, k):
+            vencedor = jogador
+            break
+    linha = {"jogo": jogo, "semente": semente, "abertura": "-".join(abertura), "motor_x": motor_x, "motor_o": motor_o,
+             "vencedor": vencedor, "jogadas": jogada_numero + 1}
+    for jogador in jogadores:
+        proprias = [medicao for medicao in medicoes if medicao[0] == jogador]  # Jogadas deste motor
+        linha[f"latencia_media_{jogador.lower()}"] = sum(m[2] for m in proprias) / len(proprias) if proprias else 0.0
+        linha[f"nos_{jogador.lower()}"] = sum(m[3] for m in proprias)
+    return linha, medicoes
+
+
+#torneio(motores=("alpha_beta", "aleatorio"), jogos=100, semente=0, tamanho=3, k=None, aberturas=2, processos=None,
+#        ficheiro_csv="torneio.csv", ficheiro_json="torneio.json")
+#Joga `jogos` partidas entre os dois motores sem interação, distribuídas pelo pool de processos. Os jogos vêm aos pares com a
+#mesma abertura e as cores trocadas. Cada jogo é escrito no CSV assim que termina, e o resumo por motor (vitórias, empates,
+#derrotas, percentis de latência por jogada e nós) vai para o JSON e para a consola. Devolve o resumo.
+
+def torneio(motores=("alpha_beta", "aleatorio"), jogos=100, semente=0, tamanho=3, k=None, aberturas=2, processos=None,
+            ficheiro_csv="torneio.csv", ficheiro_json="torneio.json"):
+    """Torneio automático entre dois motores, com resultados em CSV e resumo em JSON"""
+    motor_a, motor_b = motores
+    configs = {nome: MOTORES_TORNEIO[nome] for nome in motores}  # Nome desconhecido -> KeyError
+    tarefas = []
+    for jogo in range(jogos):
+        par = jogo // 2  # Os dois jogos do par partilham a abertura
+        motor_x, motor_o = (motor_a, motor_b) if jogo % 2 == 0 else (motor_b, motor_a)  # Alterna as cores
+        tarefas.append((jogo, semente + par, motor_x, configs[motor_x], motor_o, configs[motor_o], tamanho, k, aberturas))
+
+    processos = processos or os.cpu_count() or 1
+    if processos > 1:
+        resultados = obter_pool(processos).imap_unordered(jogar_partida, tarefas, chunksize=max(1, jogos // (processos * 8)))
+    else:  # Um só processo: evita o custo de enviar as tarefas
+        resultados = map(jogar_partida, tarefas)
+
+    resumo = {nome: {"jogos": 0, "vitorias": 0, "empates": 0, "derrotas": 0} for nome in motores}
+    latencias = {nome: [] for nome in motores}
+    nos = {nome: [] for nome in motores}
+    tempo_inicio = time.perf_counter()
+    with open(ficheiro_csv, "w", newline="", encoding="utf-8") as ficheiro:
+        escritor = csv.DictWriter(ficheiro, fieldnames=CAMPOS_TORNEIO)
+        escritor.writeheader()
+        for concluidos, (linha, medicoes) in enumerate(resultados, 1):
+            escritor.writerow(linha)
+            ficheiro.flush()  # Resultados visíveis enquanto o torneio corre
+            for cor, nome in (("X", linha["motor_x"]), ("O", linha["motor_o"])):
+                resumo[nome]["jogos"] += 1
+                if linha["vencedor"] == "empate":
+                    resumo[nome]["empates"] += 1
+                elif linha["vencedor"] == cor:
+                    resumo[nome]["vitorias"] += 1
+                else:
+                    resumo[nome]["derrotas"] += 1
+            for _, nome, latencia, nos_jogada in medicoes:
+                latencias[nome].append(latencia)
+                nos[nome].append(nos_jogada)
+            if concluidos % max(1, jogos // 10) == 0:  # Progresso a cada 10%
+                print(f"{concluidos}/{jogos} jogos ({time.perf_counter() - tempo_inicio:.1f}s)")
+
+    for nome in motores:  # Percentis por jogada
+        if latencias[nome]:
+            p50, p90, p99 = np.percentile(latencias[nome], [50, 90, 99])
+            resumo[nome].update(jogadas=len(latencias[nome]), latencia_p50=p50, latencia_p90=p90, latencia_p99=p99,
+                                latencia_max=max(latencias[nome]), nos_media=sum(nos[nome]) / len(nos[nome]), nos_max=max(nos[nome]))
+    with open(ficheiro_json, "w", encoding="utf-8") as ficheiro:
+        json.dump({"motores": list(motores), "jogos": jogos, "semente": semente, "tamanho": tamanho, "k": k or tamanho,
+                   "aberturas": aberturas, "processos": processos, "tempo": time.perf_counter() - tempo_inicio, "resumo": resumo},
+                  ficheiro, indent=2, ensure_ascii=False)
+
+    print(f"\n{'Motor':<20}{'V':>6}{'E':>6}{'D':>6}{'p50 (ms)':>10}{'p99 (ms)':>10}{'Nós méd.':>10}")
+    for nome, dados in resumo.items():
+        print(f"{nome:<20}{dados['vitorias']:>6}{dados['empates']:>6}{dados['derrotas']:>6}"
+              f"{dados.get('latencia_p50', 0) * 1000:>10.3f}{dados.get('latencia_p99', 0) * 1000:>10.3f}{dados.get('nos_media', 0):>10.1f}")
+    print(f"Resultados em '{ficheiro_csv}', resumo em '{ficheiro_json}'")
+    return resumo
 
 
 #principal()
@@ -604,9 +1815,11 @@ def principal():
         print("2. Ver computador vs computador")
         print("3. Comparar desempenho dos algoritmos")
         print("4. Visualizar exploração do tabuleiro")
-        print("5. Sair")
+        print("5. Comparar pesquisa em série e em paralelo")
+        print("6. Torneio automático entre motores")
+        print("7. Sair")
         
-        escolha = input("Escolha uma opção (1-5): ")  # Obtém escolha do usuário
+        escolha = input("Escolha uma opção (1-7): ")  # Obtém escolha do usuário
         
         # Executa a opção escolhida
         if escolha == "1":  # Modo jogador vs computador
@@ -617,11 +1830,24 @@ def principal():
             comparar_desempenho_algoritmos()
         elif escolha == "4":  # Visualização de exploração
             visualizar_exploracao_tabuleiro()
-        elif escolha == "5":  # Sair
+        elif escolha == "5":  # Pesquisa paralela na raiz
+            comparar_paralelo()
+        elif escolha == "6":  # Torneio sem interação
+            print(f"Motores disponíveis: {', '.join(MOTORES_TORNEIO)}")
+            motor_a = input("Primeiro motor [alpha_beta]: ").strip() or "alpha_beta"
+            motor_b = input("Segundo motor [aleatorio]: ").strip() or "aleatorio"
+            jogos = input("Número de jogos [100]: ").strip()
+            if motor_a in MOTORES_TORNEIO and motor_b in MOTORES_TORNEIO:
+                torneio((motor_a, motor_b), int(jogos) if jogos.isdigit() else 100)
+            else:
+                print("Motor desconhecido.")
+        elif escolha == "7":  # Sair
             print("\nObrigado por jogar!")
             break  # Encerra o programa
         else:  # Opção inválida
             print("Escolha inválida. Tente novamente.")
 
 if __name__ == "__main__":
+    if sys.argv[1:] == ["--verificar"]:  # Só a verificação da tabela partilhada, sem o menu
+        sys.exit(1 if verificar_tabela_partilhada() else 0)
     principal()
\ No newline at end of file